@@ -8,11 +8,13 @@ from tkinter import Canvas, simpledialog
 from PIL import Image, ImageDraw, ImageTk
 import os
 import threading
-import subprocess
-import tempfile
 import time
 import queue
 
+from audio_playback import LIPSYNC_FRAME_SECONDS, AudioPlayer, LipSync
+from tts_client import SystemTTS
+from scene import ImageLoader
+
 
 class RateLimitError(Exception):
     """API制限エラー"""
@@ -23,6 +25,11 @@ class RateLimitError(Exception):
 BACKEND = "groq"
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")  # 環境変数から取得
 
+# 読み上げ（macOSはsay、Linuxはespeak-ng。再生先は環境変数 AUDIO_BACKEND）
+system_tts = SystemTTS()
+player = AudioPlayer()
+image_loader = ImageLoader()  # 縮小済みの画像をディスクにキャッシュ
+
 # キャラクター設定
 CHARACTERS = {
     "pro": {
@@ -202,12 +209,21 @@ class DebateApp:
         img.save(os.path.join(self.assets_dir, filename))
 
     def _load_images(self):
-        """画像をロード"""
-        for key in ['pro_closed', 'pro_open', 'con_closed', 'con_open']:
-            path = os.path.join(self.assets_dir, f"{key}.png")
-            if os.path.exists(path):
-                img = Image.open(path).resize((120, 120), Image.Resampling.LANCZOS)
-                self.images[key] = ImageTk.PhotoImage(img)
+        """画像をロード（縮小済みの画像をキャッシュから別スレッドで読み込む）"""
+        paths = {key: os.path.join(self.assets_dir, f"{key}.png")
+                 for key in ['pro_closed', 'pro_open', 'con_closed', 'con_open']}
+        future = image_loader.load_async(paths, size=(120, 120), fit=False)
+        future.add_done_callback(lambda f: self.message_queue.put({"action": "images", "future": f}))
+
+    def _set_images(self, future):
+        """読み込んだ画像をTk用に変換（Tkのスレッドで呼ぶ）"""
+        try:
+            loaded = future.result()
+        except OSError as e:
+            print(f"画像の読み込みに失敗しました: {e}")
+            return
+        self.images = {key: ImageTk.PhotoImage(img) for key, img in loaded.items()}
+        self._draw_characters()
 
     def _setup_ui(self):
         """UIを構築"""
@@ -304,7 +320,9 @@ class DebateApp:
                 msg = self.message_queue.get_nowait()
                 action = msg.get("action")
 
-                if action == "log":
+                if action == "images":
+                    self._set_images(msg["future"])
+                elif action == "log":
                     self.log_text.insert(tk.END, msg["text"], msg.get("tag", ""))
                     self.log_text.see(tk.END)
                 elif action == "speaker":
@@ -348,6 +366,7 @@ class DebateApp:
     def _stop_debate(self):
         """討論終了"""
         self.is_running = False
+        player.stop()
         self.stop_btn.config(state=tk.DISABLED)
 
     def _debate_loop(self):
@@ -412,29 +431,28 @@ class DebateApp:
         """音声再生と口パク"""
         self.message_queue.put({"action": "speaker", "speaker": speaker})
 
-        # 音声ファイル生成
-        with tempfile.NamedTemporaryFile(suffix='.aiff', delete=False) as f:
-            audio_path = f.name
-
         try:
-            subprocess.run(['say', '-v', voice, '-r', '150', '-o', audio_path, text],
-                          check=True, capture_output=True)
+            # 音声生成（WAVデータをメモリ上で受け取る）
+            audio = system_tts.synthesize(text, voice, rate=150)
 
-            # 再生開始
-            play_proc = subprocess.Popen(['afplay', audio_path],
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            lipsync = LipSync.from_wav(audio)
 
-            # 口パク
-            while play_proc.poll() is None:
-                self.message_queue.put({"action": "mouth", "open": True})
-                time.sleep(0.1)
-                self.message_queue.put({"action": "mouth", "open": False})
-                time.sleep(0.1)
+            # 再生開始
+            play_thread = threading.Thread(target=player.play, args=(audio,), daemon=True)
+            start = time.monotonic()
+            play_thread.start()
+
+            # 口パク（音量から求めた口の開きを再生位置で引き、変化したときだけ送る）
+            mouth_open = False
+            while play_thread.is_alive():
+                is_open = lipsync.is_open(time.monotonic() - start)
+                if is_open != mouth_open:
+                    mouth_open = is_open
+                    self.message_queue.put({"action": "mouth", "open": mouth_open})
+                time.sleep(LIPSYNC_FRAME_SECONDS)
 
         finally:
             self.message_queue.put({"action": "mouth", "open": False})
-            if os.path.exists(audio_path):
-                os.remove(audio_path)
 
     def _run_judge(self):
         """ジャッジを実行"""
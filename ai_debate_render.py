@@ -0,0 +1,343 @@
+"""
+AI Debate 動画書き出し - YouTube版の画面をウィンドウなしで描画して動画にするCLI
+機能:
+- 記録済みのタイムライン（発言・合成済みWAV・表情）を読み込み、YouTube版と同じレイアウトで1280x720のフレームを描画
+- 口パクは音声の音量から求める（ライブ版と同じLipSync）
+- フレームは複数プロセスで分担して描画（ffmpegへ流し込む場合は実時間より速く書き出せる）
+- ffmpegがあれば音声と合わせてMP4に、なければ連番PNGとWAVを出力
+  （連番PNGは1枚ごとのPNG圧縮が律速になり、ワーカー1つあたり実時間の1倍前後に留まる）
+
+使い方:
+    # 討論を記録（DEBATE_TIMELINE_DIR に debate_日時.jsonl と音声フォルダができる）
+    DEBATE_TIMELINE_DIR=timelines python ai_debate_youtube.py
+    python ai_debate_render.py timelines/debate_20250101_120000.jsonl -o debate.mp4 --fps 30 --workers 4
+
+タイムラインの形式は debate_core/timeline.py を参照。
+"""
+
+import argparse
+import bisect
+import math
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import wave
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from audio_playback import LipSync, parse_wav, to_float_frames
+from scene import GradientBackground, ImageLoader
+from scene.video import FfmpegWriter, find_ffmpeg, find_font, load_font, save_frame, wrap_text
+from debate_core.config import EXPRESSIONS, YOUTUBE_CHARACTERS as CHARACTERS
+from debate_core.emotion import classify_emotion
+from debate_core.timeline import TimelineReader
+
+WIDTH, HEIGHT = 1280, 720
+LEAD_IN = 1.0  # 最初の出来事までの秒数
+TAIL = 2.0  # 最後の発言のあとに残す秒数
+CHAR_IMAGE_SIZE = 280
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets_youtube")
+
+
+@dataclass
+class Cue:
+    """画面上の1発言（タイミングと口の開き）"""
+    speaker: str  # "pro" / "con" / "judge"
+    text: str
+    expression: str
+    start: float
+    duration: float
+    lipsync: Optional[LipSync]  # 音声のない字幕はNone
+
+
+def load_timeline(path):
+    """タイムラインを読み込み、画面に出す発言を時間軸に並べる
+
+    Returns:
+        (議題, Cueのリスト, [(開始秒, WavAudio)], 全体の秒数)
+    """
+    timeline = TimelineReader(path)
+    cues, clips = [], []
+    spoken = {}  # ターンごとの話した内容（字幕は文を足していく）
+    emotions = {}  # ターンごとの現在の表情
+    end = 0.0
+    for event in timeline:
+        t = LEAD_IN + event.t
+        end = max(end, t)
+        if event.type == "utterance":
+            speaker = event.data["speaker"]
+            turn = event.data.get("turn")
+            spoken[turn] = spoken.get(turn, "") + event.data["text"]
+            # 感情のないタイムラインはライブと同じく文ごとに判定（感情語がなければ直前の表情）
+            expression = event.data.get("emotion") or classify_emotion(
+                event.data["text"], default=emotions.get(turn, "normal")
+            )
+            if expression not in EXPRESSIONS:
+                expression = "normal"
+            emotions[turn] = expression
+
+            audio = timeline.read_audio(event)
+            wav = parse_wav(audio) if audio else None
+            duration = wav.duration if wav else float(event.data.get("duration", 0.0))
+            lipsync = LipSync.from_wav(wav) if wav else None
+            cues.append(Cue(speaker, spoken[turn], expression, t, duration, lipsync))
+            if wav:
+                clips.append((t, wav))
+            end = max(end, t + duration)
+        elif event.type == "verdict":
+            text = f"勝者は{event.data['winner_name']}さん！"
+            totals = event.data.get("totals")
+            if totals:
+                text += f"（{CHARACTERS['pro']['name']} {totals['pro']}点 / {CHARACTERS['con']['name']} {totals['con']}点）"
+            cues.append(Cue("judge", text, "normal", t, 0.0, None))
+        elif event.type == "judge_start":
+            cues.append(Cue("judge", "判定中...", "normal", t, 0.0, None))
+    return timeline.topic, cues, clips, end + TAIL
+
+
+def write_soundtrack(clips, duration: float, path: str):
+    """発言の音声を時間軸どおりに並べて一本の16bit WAVにする（形式は最初の音声に合わせる）"""
+    sample_rate = clips[0][1].sample_rate if clips else 24000
+    channels = clips[0][1].channels if clips else 1
+    track = np.zeros((int(math.ceil(duration * sample_rate)), channels), dtype=np.float32)
+    for start, wav in clips:
+        frames = to_float_frames(wav, sample_rate, channels)
+        offset = int(round(start * sample_rate))
+        frames = frames[:max(0, len(track) - offset)]
+        track[offset:offset + len(frames)] += frames
+
+    pcm = (np.clip(track, -1.0, 1.0) * 32767).astype("<i2")
+    with wave.open(path, "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(pcm.tobytes())
+
+
+class FrameRenderer:
+    """YouTube版の _draw_scene と同じレイアウトで1フレームを描く
+
+    プロセスに渡すのは台本のデータだけで、画像やフォントは各プロセスで初回描画時に読み込む。
+    """
+
+    def __init__(self, topic: str, cues: List[Cue], fps: int, assets_dir: str = ASSETS_DIR):
+        self.topic = topic
+        self.cues = cues
+        self.fps = fps
+        self.assets_dir = assets_dir
+        self.starts = [cue.start for cue in cues]
+
+        # 各発言の時点での両者の表情（表情は次に話すまで残る）
+        self.expressions = []
+        current = {"pro": "normal", "con": "normal"}
+        for cue in cues:
+            if cue.speaker in current:
+                current = {**current, cue.speaker: cue.expression}
+            self.expressions.append(current)
+
+        self._ready = False
+
+    def _prepare(self):
+        """画像・フォント・背景を読み込む（プロセスごとに一度）"""
+        paths = {}
+        for char in ["pro", "con"]:
+            for expr in EXPRESSIONS:
+                for mouth in ["closed", "open"]:
+                    key = f"{char}_{expr}_{mouth}"
+                    paths[key] = os.path.join(self.assets_dir, f"{key}.png")
+        self.images = ImageLoader().load_all(paths, size=(CHAR_IMAGE_SIZE, CHAR_IMAGE_SIZE))
+        self.images = {key: img.convert("RGBA") for key, img in self.images.items()}
+
+        self.fonts = {
+            "vs": load_font(96),
+            "name": load_font(24),
+            "topic": load_font(27),
+            "speaker": load_font(21),
+            "subtitle": load_font(29),
+        }
+        self.background = GradientBackground(WIDTH, HEIGHT, top=(26, 26, 46), bottom=(50, 30, 80))
+        self._bases: Dict[int, Image.Image] = {}
+        self._ready = True
+
+    def _base(self, bg_index: int) -> Image.Image:
+        """背景と動かない部分（VS・枠・名前・議題）を合成したもの（背景フレームごとにキャッシュ）"""
+        base = self._bases.get(bg_index)
+        if base is not None:
+            return base
+
+        base = self.background.image(bg_index)
+        draw = ImageDraw.Draw(base)
+
+        # VS テキスト
+        draw.text((640, 300), "VS", font=self.fonts["vs"], fill='#FFD700', anchor='mm')
+
+        # キャラクター枠（左: 賛成派、右: 反対派）
+        for char, x0 in (("pro", 80), ("con", 880)):
+            color = CHARACTERS[char]['color']
+            draw.rectangle([x0, 120, x0 + 320, 500], outline=color, width=4)
+            draw.rectangle([x0, 500, x0 + 320, 550], fill=color)
+            draw.text((x0 + 160, 525), CHARACTERS[char]['name'], font=self.fonts["name"], fill='white', anchor='mm')
+
+        # 議題表示
+        if self.topic:
+            draw.rectangle([200, 50, 1080, 100], fill='#2d2d5a', outline='#FFD700', width=2)
+            draw.text((640, 75), self.topic, font=self.fonts["topic"], fill='white', anchor='mm')
+
+        self._bases[bg_index] = base
+        return base
+
+    def _cue_index(self, t: float) -> Optional[int]:
+        """時刻tに表示中の発言（最後に始まった発言）"""
+        index = bisect.bisect_right(self.starts, t) - 1
+        return index if index >= 0 else None
+
+    def render(self, frame_index: int) -> Image.Image:
+        """1フレームを描画"""
+        if not self._ready:
+            self._prepare()
+
+        t = frame_index / self.fps
+        frame = self._base(self.background.frame_index(t)).copy()
+        draw = ImageDraw.Draw(frame)
+
+        index = self._cue_index(t)
+        cue = self.cues[index] if index is not None else None
+        expressions = self.expressions[index] if index is not None else {"pro": "normal", "con": "normal"}
+        speaker = cue.speaker if cue is not None and cue.speaker in ("pro", "con") else None
+        mouth_open = speaker is not None and cue.lipsync is not None and cue.lipsync.is_open(t - cue.start)
+
+        # キャラクター画像
+        for char, x in (("pro", 240), ("con", 1040)):
+            mouth = "open" if (char == speaker and mouth_open) else "closed"
+            img = self.images.get(f"{char}_{expressions[char]}_{mouth}")
+            if img is not None:
+                frame.paste(img, (x - img.width // 2, 310 - img.height // 2), img)
+
+        # スピーカーハイライト
+        if speaker == "pro":
+            draw.rectangle([75, 115, 405, 555], outline='#FFFF00', width=6)
+        elif speaker == "con":
+            draw.rectangle([875, 115, 1205, 555], outline='#FFFF00', width=6)
+
+        # 字幕表示（半透明の黒背景・話者名・テキスト）
+        if cue is not None:
+            box = (100, 570, 1180, 650)
+            region = frame.crop(box)
+            frame.paste(Image.blend(region, Image.new("RGB", region.size), 0.5), box[:2])
+            if speaker:
+                draw.text((150, 590), f"【{CHARACTERS[speaker]['name']}】", font=self.fonts["speaker"],
+                          fill=CHARACTERS[speaker]['color'], anchor='lm')
+            lines = wrap_text(cue.text, self.fonts["subtitle"], 1000)
+            draw.multiline_text((640, 620), "\n".join(lines), font=self.fonts["subtitle"], fill='white',
+                                anchor='mm', align='center')
+
+        return frame
+
+
+# ワーカープロセス側の描画器（initializerで受け取る）
+_renderer = None
+
+
+def _init_worker(renderer):
+    global _renderer
+    _renderer = renderer
+
+
+def _render_raw(frames):
+    """フレーム範囲を描画してrgb24の生データで返す（ffmpegに流す用）"""
+    return b"".join(_renderer.render(i).tobytes() for i in frames)
+
+
+def _render_png(job):
+    """フレーム範囲を描画して連番PNGに保存"""
+    frames, directory = job
+    for i in frames:
+        save_frame(_renderer.render(i), directory, i)
+    return len(frames)
+
+
+def render_video(renderer: FrameRenderer, duration: float, output: str, audio_path: str,
+                 workers: Optional[int] = None, encode: bool = True) -> str:
+    """全フレームを並列に描画して書き出す
+
+    Returns:
+        書き出したファイル（MP4）またはフレームのディレクトリ
+    """
+    total = int(math.ceil(duration * renderer.fps))
+    chunk = max(1, renderer.fps // 2)
+    ranges = [range(start, min(start + chunk, total)) for start in range(0, total, chunk)]
+    ffmpeg = find_ffmpeg() if encode else None
+    done = 0
+    started = time.time()
+
+    def report(count):
+        nonlocal done
+        done += count
+        elapsed = time.time() - started
+        print(f"\r{done}/{total} フレーム（{done / renderer.fps / max(elapsed, 1e-6):.1f}倍速）",
+              end="", file=sys.stderr)
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(renderer,)) as pool:
+        if ffmpeg:
+            # 順番どおりに受け取ってffmpegへ流し込む
+            with FfmpegWriter(output, (WIDTH, HEIGHT), renderer.fps, audio_path, ffmpeg=ffmpeg) as writer:
+                for frames, data in zip(ranges, pool.imap(_render_raw, ranges)):
+                    writer.write(data)
+                    report(len(frames))
+            result = output
+        else:
+            result = os.path.splitext(output)[0] + "_frames"
+            os.makedirs(result, exist_ok=True)
+            for count in pool.imap_unordered(_render_png, [(frames, result) for frames in ranges]):
+                report(count)
+    print(file=sys.stderr)
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="YouTube版の討論をウィンドウなしで動画に書き出します")
+    parser.add_argument("timeline", help="記録済みのタイムライン（.jsonl）")
+    parser.add_argument("-o", "--output", default="debate.mp4", help="出力MP4ファイル")
+    parser.add_argument("--fps", type=int, default=30, help="フレームレート（デフォルト: 30）")
+    parser.add_argument("--workers", type=int, help="描画プロセス数（デフォルト: CPU数）")
+    parser.add_argument("--frames", action="store_true", help="ffmpegがあっても連番PNGとWAVで出力（PNG圧縮のぶんMP4より遅い）")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    if find_font() is None:
+        print("⚠️  日本語フォントが見つかりません（環境変数 RENDER_FONT でフォントファイルを指定してください）",
+              file=sys.stderr)
+    topic, cues, clips, duration = load_timeline(args.timeline)
+    renderer = FrameRenderer(topic, cues, args.fps)
+
+    encode = not args.frames and find_ffmpeg() is not None
+    if encode:
+        fd, audio_path = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+    else:
+        audio_path = os.path.splitext(args.output)[0] + ".wav"
+    write_soundtrack(clips, duration, audio_path)
+
+    try:
+        result = render_video(renderer, duration, args.output, audio_path, args.workers, encode)
+    finally:
+        if encode:
+            os.remove(audio_path)
+
+    if encode:
+        print(f"書き出しました: {result}（{duration:.1f}秒）", file=sys.stderr)
+    else:
+        print(f"ffmpegがないため連番PNGとWAVで出力しました: {result}/ , {audio_path}", file=sys.stderr)
+        print(f"  エンコード例: ffmpeg -framerate {args.fps} -i {result}/frame_%06d.png -i {audio_path} "
+              f"-c:v libx264 -pix_fmt yuv420p -c:a aac -shortest {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+AI Debate トーナメント版 - 多数のお題をまとめてディベート・判定するバッチCLI
+機能:
+- お題ファイル（1行1お題、またはJSON行でキャラクター指定）を読み込み
+- 数百件のディベートを並行実行（APIの分あたり制限はQuotaSchedulerで共有管理）
+- 発言履歴と判定結果をJSONLで出力（--resume で途中から再開）
+
+使い方:
+    python ai_debate_tournament.py topics.txt -o results.jsonl --rpm 30 --tpm 6000
+
+入力行の例:
+    AIは人間の仕事を奪う
+    {"id": "school-01", "topic": "制服は必要か", "pro": {"name": "さくら"}, "con": {"name": "あおい"}}
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from debate_core import DEFAULT_CHARACTERS, Character, DebateSession, VerdictFormatError
+from debate_core.config import JUDGE_PERSONAS
+from debate_core.runner import run_debate
+from llm_client import AsyncGroqClient, LLMError, QuotaScheduler
+
+
+def load_matches(path):
+    """お題ファイルを読み込んで対戦リストを返す"""
+    matches = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                entry = json.loads(line)
+            else:
+                entry = {"topic": line}
+            if not entry.get("topic"):
+                raise ValueError(f"{path}:{line_no}: topic がありません")
+            entry.setdefault("id", f"{len(matches) + 1:05d}")
+            matches.append(entry)
+    return matches
+
+
+def load_finished_ids(path):
+    """既存の出力ファイルから完了済み（エラーなし）のIDを集める"""
+    if not os.path.exists(path):
+        return set()
+    finished = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # 中断時の書きかけ行
+            if not record.get("error"):
+                finished.add(record["id"])
+    return finished
+
+
+def make_character(fields, role):
+    """JSONのキャラクター指定をCharacterに変換（未指定ならデフォルト）"""
+    if not fields:
+        return DEFAULT_CHARACTERS[role]
+    return Character(**fields)
+
+
+class Tournament:
+    """ディベートを並行実行して結果をJSONLに書き出す"""
+
+    def __init__(self, client, output, turns, concurrency, ensemble_size=None, quorum=None):
+        self.client = client
+        self.output = output
+        self.turns = turns
+        self.ensemble_size = ensemble_size
+        self.quorum = quorum
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.done = 0
+        self.failed = 0
+        self.total = 0
+        self.started_at = time.monotonic()
+
+    async def run_match(self, match):
+        """1試合を実行して結果を1行書き込む"""
+        async with self.semaphore:
+            try:
+                session = DebateSession(
+                    topic=match["topic"],
+                    pro=make_character(match.get("pro"), "pro"),
+                    con=make_character(match.get("con"), "con"),
+                )
+            except Exception as e:
+                # 不正な行はその試合だけエラーとして記録し、他の試合は続ける
+                self._write({"id": match["id"], "topic": match.get("topic"), "error": f"対戦の指定が不正です: {e}"})
+                return
+
+            record = {
+                "id": match["id"],
+                "topic": session.topic,
+                "pro": session.pro.to_dict(),
+                "con": session.con.to_dict(),
+            }
+            try:
+                verdict = await run_debate(
+                    self.client,
+                    session,
+                    turns=self.turns,
+                    ensemble_size=self.ensemble_size,
+                    quorum=self.quorum,
+                )
+                record["verdict"] = verdict.to_dict()
+            except (LLMError, VerdictFormatError) as e:
+                record["error"] = str(e)
+            except Exception as e:
+                # gatherは例外で全体を止めるので、想定外の失敗も試合単位で記録する
+                record["error"] = f"予期しないエラー: {type(e).__name__}: {e}"
+
+            record["transcript"] = [
+                {
+                    "role": "pro" if i % 2 == 0 else "con",
+                    "name": session.pro.name if i % 2 == 0 else session.con.name,
+                    "text": text,
+                }
+                for i, text in enumerate(session.history)
+            ]
+            self._write(record)
+
+    def _write(self, record):
+        # 書き込みはイベントループのスレッドだけで行うのでロック不要
+        self.output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.output.flush()
+
+        self.done += 1
+        if record.get("error"):
+            self.failed += 1
+        elapsed = time.monotonic() - self.started_at
+        status = f"エラー: {record['error']}" if record.get("error") else "完了"
+        print(
+            f"[{self.done}/{self.total}] {record['id']} {status} "
+            f"({elapsed:.0f}秒経過, 失敗 {self.failed})",
+            file=sys.stderr,
+        )
+
+    async def run(self, matches):
+        self.total = len(matches)
+        await asyncio.gather(*(self.run_match(match) for match in matches))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AIディベートをまとめて実行し、結果をJSONLで出力します")
+    parser.add_argument("topics", help="お題ファイル（1行1お題、またはJSON行）")
+    parser.add_argument("-o", "--output", default="tournament_results.jsonl", help="出力JSONLファイル")
+    parser.add_argument("--turns", type=int, default=6, help="1試合あたりの発言数（デフォルト: 6）")
+    parser.add_argument("--concurrency", type=int, default=200, help="同時に進行する試合数の上限")
+    parser.add_argument("--rpm", type=int, default=30, help="APIの分あたりリクエスト上限")
+    parser.add_argument("--tpm", type=int, default=6000, help="APIの分あたりトークン上限")
+    parser.add_argument("--max-retries", type=int, default=5, help="レート制限時の再試行回数")
+    parser.add_argument(
+        "--ensemble-size", type=int, choices=range(1, len(JUDGE_PERSONAS) + 1),
+        help="審判アンサンブルの人数（省略時は審判1人）",
+    )
+    parser.add_argument("--quorum", type=int, help="早期決着に必要な一致票数")
+    parser.add_argument("--resume", action="store_true", help="出力ファイルの完了済み試合をスキップして追記")
+    args = parser.parse_args(argv)
+    if args.turns < 2:
+        parser.error("--turns は2以上を指定してください")
+    if args.quorum is not None:
+        if args.ensemble_size is None:
+            parser.error("--quorum は --ensemble-size と一緒に指定してください")
+        if not 1 <= args.quorum <= args.ensemble_size:
+            parser.error(f"--quorum は1以上 {args.ensemble_size} 以下を指定してください")
+    return args
+
+
+async def main_async(args):
+    matches = load_matches(args.topics)
+    mode = "w"
+    if args.resume:
+        finished = load_finished_ids(args.output)
+        matches = [m for m in matches if m["id"] not in finished]
+        mode = "a"
+        print(f"完了済み {len(finished)} 件をスキップします", file=sys.stderr)
+
+    scheduler = QuotaScheduler(requests_per_minute=args.rpm, tokens_per_minute=args.tpm)
+    client = AsyncGroqClient(scheduler=scheduler, max_retries=args.max_retries)
+
+    with open(args.output, mode, encoding="utf-8") as output:
+        tournament = Tournament(
+            client,
+            output,
+            turns=args.turns,
+            concurrency=args.concurrency,
+            ensemble_size=args.ensemble_size,
+            quorum=args.quorum,
+        )
+        await tournament.run(matches)
+
+    print(f"全 {tournament.total} 試合終了（失敗 {tournament.failed}）: {args.output}", file=sys.stderr)
+    return 1 if tournament.failed else 0
+
+
+def main():
+    args = parse_args()
+    try:
+        sys.exit(asyncio.run(main_async(args)))
+    except KeyboardInterrupt:
+        print("\n中断しました（--resume で続きから再開できます）", file=sys.stderr)
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,9 @@ AI Debate v2 - AI同士のディベートを観戦するアプリ（進化版）
 
 import time
 import sys
-import subprocess
 import threading
 from concurrent.futures import ThreadPoolExecutor, Future
-from character_window import CharacterWindow
+from character_window import CharacterWindow, player, system_tts
 
 
 class RateLimitError(Exception):
@@ -256,8 +255,7 @@ def print_header():
 
 def speak_simple(text: str, voice: str):
     """シンプルな音声読み上げ（ブロッキング）"""
-    import subprocess
-    subprocess.run(["say", "-v", voice, "-r", "140", text], check=True)
+    player.play(system_tts.synthesize(text, voice, rate=140))
 
 
 def run_debate():
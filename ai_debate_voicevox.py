@@ -8,14 +8,16 @@ from tkinter import Canvas, simpledialog
 from PIL import Image, ImageDraw, ImageTk
 import os
 import threading
-import subprocess
-import tempfile
 import time
 import queue
-import requests
-import wave
 import io
 
+from audio_playback import AudioPlayer, LipSync
+from debate_core.text import SentenceChunker, split_sentences
+from llm_client import GroqClient
+from tts_client import AudioCache, SpeechStream, VoicevoxClient, synthesize_sentences
+from scene import FrameClock, ImageLoader
+
 
 class RateLimitError(Exception):
     """API制限エラー"""
@@ -26,8 +28,11 @@ class RateLimitError(Exception):
 BACKEND = "groq"
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")  # 環境変数から取得
 
-# VOICEVOX設定
-VOICEVOX_URL = "http://localhost:50021"
+# VOICEVOX設定（URLは環境変数 VOICEVOX_URL で変更可能）
+tts = VoicevoxClient(cache=AudioCache())
+player = AudioPlayer()  # 出力ストリームは開いたまま使い回す
+image_loader = ImageLoader()  # 縮小済みの画像をディスクにキャッシュ
+FRAME_RATE = 30  # 描画のフレームレート（口パクの1コマ40msより細かく）
 
 # キャラクター設定（美少女版）
 CHARACTERS = {
@@ -88,48 +93,12 @@ def get_groq_response(prompt: str, system_prompt: str, max_tokens: int = 200) ->
 
 def check_voicevox() -> bool:
     """VOICEVOXが起動しているか確認"""
-    try:
-        response = requests.get(f"{VOICEVOX_URL}/speakers", timeout=2)
-        return response.status_code == 200
-    except:
-        return False
-
-
-def speak_voicevox(text: str, speaker_id: int) -> str:
-    """VOICEVOXで音声合成し、一時ファイルのパスを返す"""
-    # 音声クエリ作成
-    query_response = requests.post(
-        f"{VOICEVOX_URL}/audio_query",
-        params={"text": text, "speaker": speaker_id},
-        timeout=30
-    )
-    query_response.raise_for_status()
-    query = query_response.json()
-
-    # 速度調整
-    query["speedScale"] = 1.2
-
-    # 音声合成
-    synthesis_response = requests.post(
-        f"{VOICEVOX_URL}/synthesis",
-        params={"speaker": speaker_id},
-        json=query,
-        timeout=60
-    )
-    synthesis_response.raise_for_status()
-
-    # 一時ファイルに保存
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-        f.write(synthesis_response.content)
-        return f.name
-
-
-def get_wav_duration(wav_path: str) -> float:
-    """WAVファイルの長さを取得（秒）"""
-    with wave.open(wav_path, 'r') as wav:
-        frames = wav.getnframes()
-        rate = wav.getframerate()
-        return frames / float(rate)
+    return tts.is_available()
+
+
+def speak_voicevox_sentences(text: str, speaker_id: int):
+    """文ごとに並行して音声合成し、WAVデータを順番に返す（1文目ができた時点で再生を始められる）"""
+    return synthesize_sentences(tts, split_sentences(text), speaker_id, speed_scale=1.2)
 
 
 def create_debater_prompt(role: str, topic: str, personality: dict) -> str:
@@ -196,15 +165,21 @@ class DebateApp:
         # メッセージキュー
         self.message_queue = queue.Queue()
 
-        # 口パク用フラグ
+        # 口パク用フラグ（lipsyncは再生中の音声の口の開き、lipsync_startは再生開始時刻）
         self.is_speaking = False
+        self.lipsync = None
+        self.lipsync_start = 0.0
+
+        # キュー処理と口パクは一つのフレームループで回す（描画は1フレーム1回まで）
+        self.clock = FrameClock(self.root, fps=FRAME_RATE, render=self._render)
 
         self._setup_ui()
         self._load_images()
         self._check_voicevox()
 
-        self.root.after(16, self._process_queue)
-        self.root.after(80, self._animate_mouth)  # 口パク専用ループ
+        self.clock.every(self._process_queue)
+        self.clock.every(self._animate_mouth)
+        self.clock.start()
 
     def _check_voicevox(self):
         """VOICEVOX確認"""
@@ -292,15 +267,22 @@ class DebateApp:
         img.save(os.path.join(self.assets_dir, filename))
 
     def _load_images(self):
-        """画像をロード（アスペクト比を維持）"""
+        """画像をロード（アスペクト比を維持、縮小済みの画像をキャッシュから別スレッドで読み込む）"""
         max_size = 300  # 最大サイズ
-        for key in ['pro_closed', 'pro_open', 'con_closed', 'con_open']:
-            path = os.path.join(self.assets_dir, f"{key}.png")
-            if os.path.exists(path):
-                img = Image.open(path)
-                # アスペクト比を維持してリサイズ
-                img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-                self.images[key] = ImageTk.PhotoImage(img)
+        paths = {key: os.path.join(self.assets_dir, f"{key}.png")
+                 for key in ['pro_closed', 'pro_open', 'con_closed', 'con_open']}
+        future = image_loader.load_async(paths, size=(max_size, max_size))
+        future.add_done_callback(lambda f: self.message_queue.put({"action": "images", "future": f}))
+
+    def _set_images(self, future):
+        """読み込んだ画像をTk用に変換（Tkのスレッドで呼ぶ）"""
+        try:
+            loaded = future.result()
+        except OSError as e:
+            print(f"画像の読み込みに失敗しました: {e}")
+            return
+        self.images = {key: ImageTk.PhotoImage(img) for key, img in loaded.items()}
+        self.clock.mark_dirty("characters")
 
     def _setup_ui(self):
         """UIを構築"""
@@ -399,12 +381,18 @@ class DebateApp:
         if self.current_speaker == 'con':
             self.con_canvas.create_oval(2, 2, 308, 308, outline=CHARACTERS['con']['color'], width=4)
 
-    def _animate_mouth(self):
-        """口パク専用アニメーションループ（メインスレッドで直接実行）"""
-        if self.is_speaking:
-            self.mouth_open = not self.mouth_open
+    def _render(self, dirty):
+        """変更のあった部分を再描画（FrameClockから1フレームに1回呼ばれる）"""
+        if "characters" in dirty:
             self._draw_characters()
-        self.root.after(80, self._animate_mouth)  # 約12fps で口パク
+
+    def _animate_mouth(self):
+        """口パク（音量から求めた口の開きを再生位置で引く、変化したときだけ再描画）"""
+        if self.is_speaking and self.lipsync is not None:
+            mouth_open = self.lipsync.is_open(time.monotonic() - self.lipsync_start)
+            if mouth_open != self.mouth_open:
+                self.mouth_open = mouth_open
+                self.clock.mark_dirty("characters")
 
     def _process_queue(self):
         """メッセージキューを処理"""
@@ -413,30 +401,32 @@ class DebateApp:
                 msg = self.message_queue.get_nowait()
                 action = msg.get("action")
 
-                if action == "log":
+                if action == "images":
+                    self._set_images(msg["future"])
+                elif action == "log":
                     self.log_text.insert(tk.END, msg["text"], msg.get("tag", ""))
                     self.log_text.see(tk.END)
                 elif action == "speaker":
                     self.current_speaker = msg["speaker"]
-                    self._draw_characters()
+                    self.clock.mark_dirty("characters")
                 elif action == "speaking":
                     self.is_speaking = msg["value"]
+                    self.lipsync = msg.get("lipsync")
+                    self.lipsync_start = msg.get("start", 0.0)
                     if not self.is_speaking:
                         self.mouth_open = False
-                        self._draw_characters()
+                        self.clock.mark_dirty("characters")
                 elif action == "done":
                     self.is_running = False
                     self.is_speaking = False
                     self.start_btn.config(state=tk.NORMAL)
                     self.stop_btn.config(state=tk.DISABLED)
                     self.current_speaker = None
-                    self._draw_characters()
+                    self.clock.mark_dirty("characters")
 
         except queue.Empty:
             pass
 
-        self.root.after(50, self._process_queue)
-
     def _start_debate(self):
         """討論開始"""
         if not self.voicevox_available:
@@ -465,92 +455,84 @@ class DebateApp:
     def _stop_debate(self):
         """討論終了"""
         self.is_running = False
+        player.stop()
         self.stop_btn.config(state=tk.DISABLED)
 
     def _generate_text_and_audio(self, prompt: str, system: str, speaker_id: int):
-        """テキスト生成と音声生成を連続で行う"""
-        text = get_groq_response(prompt, system).strip()
-        wav_path = speak_voicevox(text, speaker_id)
-        return text, wav_path
+        """テキストをストリーミング生成し、できた文から順に音声合成する
+
+        Returns:
+            (発言全文のFuture, 文ごとの音声を順に返すSpeechStream)
+        """
+        speech = SpeechStream(tts, speaker_id, speed_scale=1.2)
+        text_future = self.executor.submit(self._stream_text, prompt, system, speech)
+        return text_future, speech
+
+    def _stream_text(self, prompt: str, system: str, speech: SpeechStream) -> str:
+        """LLMの出力を受け取りながら、完成した文をすぐ音声合成に回す"""
+        client = GroqClient(api_key=GROQ_API_KEY)
+        chunker = SentenceChunker()
+        parts = []
+        try:
+            for delta in client.stream_response(prompt, system):
+                parts.append(delta)
+                speech.feed_all(chunker.feed(delta), close=False)
+            speech.feed_all(chunker.flush())
+        finally:
+            speech.close()
+        return "".join(parts).strip()
 
     def _debate_loop(self):
-        """討論ループ（テキスト＋音声の先読み最適化版）"""
+        """討論ループ（テキスト生成→音声合成→再生を文単位でつなぐ）"""
         from concurrent.futures import ThreadPoolExecutor
 
-        pro_name = CHARACTERS["pro"]["name"]
-        con_name = CHARACTERS["con"]["name"]
-
-        pro_system = create_debater_prompt("pro", self.topic, CHARACTERS["pro"])
-        con_system = create_debater_prompt("con", self.topic, CHARACTERS["con"])
+        systems = {
+            "pro": create_debater_prompt("pro", self.topic, CHARACTERS["pro"]),
+            "con": create_debater_prompt("con", self.topic, CHARACTERS["con"]),
+        }
 
         initial_prompt = f"「{self.topic}」について、具体例を一つ挙げて自分の意見を言って。"
 
-        executor = ThreadPoolExecutor(max_workers=2)
-        turn = 0
-        next_future = None  # (text, wav_path) を返す
+        # 再生中の発言と、次の発言の生成が同時に動く
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        role = "pro"
+        current = self._generate_text_and_audio(initial_prompt, systems["pro"], CHARACTERS["pro"]["speaker_id"])
 
         while self.is_running:
-            turn += 1
-
-            # === 賛成派の発言 ===
-            if turn == 1:
-                # 初回は同期で生成
-                try:
-                    pro_text = get_groq_response(initial_prompt, pro_system).strip()
-                    pro_wav = speak_voicevox(pro_text, CHARACTERS["pro"]["speaker_id"])
-                except Exception as e:
-                    self.message_queue.put({"action": "log", "text": f"\n[エラー: {e}]\n", "tag": "system"})
-                    break
-            else:
-                # 先読み結果を取得
-                try:
-                    pro_text, pro_wav = next_future.result()
-                except Exception as e:
-                    self.message_queue.put({"action": "log", "text": f"\n[エラー: {e}]\n", "tag": "system"})
-                    break
+            text_future, speech = current
 
-            self.history.append(pro_text)
-            self.message_queue.put({"action": "log", "text": f"{pro_name}: ", "tag": "pro"})
-            self.message_queue.put({"action": "log", "text": f"{pro_text}\n\n"})
+            # 1文目の音声ができしだい再生開始（全文の生成を待たない）
+            playback = self.executor.submit(self._play_stream_with_animation, speech, role)
 
-            # 反対派のテキスト＋音声を先読み開始
-            con_prompt = f"{pro_name}「{pro_text}」\n\n↑この主張に反論して。"
-            next_future = executor.submit(
-                self._generate_text_and_audio,
-                con_prompt, con_system, CHARACTERS["con"]["speaker_id"]
-            )
-
-            # 賛成派の音声再生（既に生成済み）
-            self._play_with_animation(pro_wav, "pro")
-
-            if not self.is_running:
-                break
-
-            # === 反対派の発言 ===
             try:
-                con_text, con_wav = next_future.result()
+                text = text_future.result()
             except Exception as e:
+                playback.result()
                 self.message_queue.put({"action": "log", "text": f"\n[エラー: {e}]\n", "tag": "system"})
                 break
 
-            self.history.append(con_text)
-            self.message_queue.put({"action": "log", "text": f"{con_name}: ", "tag": "con"})
-            self.message_queue.put({"action": "log", "text": f"{con_text}\n\n"})
-
-            # 賛成派のテキスト＋音声を先読み開始
-            pro_prompt = f"{con_name}「{con_text}」\n\n↑この主張に反論して。"
-            next_future = executor.submit(
-                self._generate_text_and_audio,
-                pro_prompt, pro_system, CHARACTERS["pro"]["speaker_id"]
-            )
-
-            # 反対派の音声再生（既に生成済み）
-            self._play_with_animation(con_wav, "con")
+            self.history.append(text)
 
+            # 停止されたら次の発言は生成しない
             if not self.is_running:
+                playback.result()
                 break
 
-        executor.shutdown(wait=False)
+            # 全文がそろった時点で相手の発言を先読み開始（再生の終了は待たない）
+            opponent = "con" if role == "pro" else "pro"
+            next_prompt = f"{CHARACTERS[role]['name']}「{text}」\n\n↑この主張に反論して。"
+            current = self._generate_text_and_audio(
+                next_prompt, systems[opponent], CHARACTERS[opponent]["speaker_id"]
+            )
+
+            playback.result()
+            role = opponent
+
+        # 再生されずに残った先読み（再生中に停止された場合）を止める
+        text_future, speech = current
+        text_future.cancel()
+        speech.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
         # ジャッジ
         if len(self.history) >= 2:
@@ -558,58 +540,28 @@ class DebateApp:
 
         self.message_queue.put({"action": "done"})
 
-    def _play_with_animation(self, wav_path: str, speaker: str):
-        """音声ファイル再生と口パク（音声は生成済み）"""
+    def _play_stream_with_animation(self, speech: SpeechStream, speaker: str):
+        """文ごとに合成された音声を順に再生し、その文をログに追記（口パク付き）"""
         self.message_queue.put({"action": "speaker", "speaker": speaker})
-        self.message_queue.put({"action": "speaking", "value": True})
+        self.message_queue.put({"action": "log", "text": f"{CHARACTERS[speaker]['name']}: ", "tag": speaker})
 
         try:
-            # 再生開始（同期で待つ）
-            play_proc = subprocess.Popen(['afplay', wav_path],
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            play_proc.wait()
+            for sentence, audio in speech.iter_sentences():
+                self.message_queue.put({"action": "log", "text": sentence})
+                self.message_queue.put({
+                    "action": "speaking", "value": True,
+                    "lipsync": LipSync.from_wav(audio), "start": time.monotonic(),
+                })
+                player.play(audio)
+                if not self.is_running:
+                    break
 
         except Exception as e:
             self.message_queue.put({"action": "log", "text": f"[再生エラー: {e}]\n", "tag": "system"})
 
         finally:
             self.message_queue.put({"action": "speaking", "value": False})
-            # クリーンアップ
-            if os.path.exists(wav_path):
-                os.remove(wav_path)
-
-    def _speak_with_animation(self, text: str, speaker: str, speaker_id: int):
-        """VOICEVOX音声再生と口パク"""
-        self.message_queue.put({"action": "speaker", "speaker": speaker})
-
-        try:
-            # VOICEVOX音声生成
-            wav_path = speak_voicevox(text, speaker_id)
-            duration = get_wav_duration(wav_path)
-
-            # 再生開始
-            play_proc = subprocess.Popen(['afplay', wav_path],
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-
-            # 口パク
-            start_time = time.time()
-            while play_proc.poll() is None and (time.time() - start_time) < duration + 1:
-                self.message_queue.put({"action": "mouth", "open": True})
-                time.sleep(0.12)
-                self.message_queue.put({"action": "mouth", "open": False})
-                time.sleep(0.08)
-
-            play_proc.wait()
-
-            # クリーンアップ
-            if os.path.exists(wav_path):
-                os.remove(wav_path)
-
-        except Exception as e:
-            self.message_queue.put({"action": "log", "text": f"[音声エラー: {e}]\n", "tag": "system"})
-
-        finally:
-            self.message_queue.put({"action": "mouth", "open": False})
+            self.message_queue.put({"action": "log", "text": "\n\n"})
 
     def _run_judge(self):
         """ジャッジを実行（音声付き）"""
@@ -625,16 +577,10 @@ class DebateApp:
             result = get_groq_response(judge_prompt, judge_system, max_tokens=300)
             self.message_queue.put({"action": "log", "text": f"👩‍⚖️ {result}\n", "tag": "judge"})
 
-            # ジャッジの音声読み上げ
+            # ジャッジの音声読み上げ（文ごとに合成しながら順に再生）
             self.message_queue.put({"action": "speaker", "speaker": None})
-            wav_path = speak_voicevox(result, CHARACTERS["judge"]["speaker_id"])
-
-            play_proc = subprocess.Popen(['afplay', wav_path],
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            play_proc.wait()
-
-            if os.path.exists(wav_path):
-                os.remove(wav_path)
+            for audio in speak_voicevox_sentences(result, CHARACTERS["judge"]["speaker_id"]):
+                player.play(audio)
 
         except Exception as e:
             self.message_queue.put({"action": "log", "text": f"[判定エラー: {e}]\n", "tag": "system"})
@@ -13,14 +13,26 @@ from tkinter import Canvas, simpledialog
 from PIL import Image, ImageDraw, ImageTk, ImageFilter
 import os
 import threading
-import subprocess
-import tempfile
 import time
 import queue
-import requests
-import wave
-import random
-import math
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from audio_playback import AudioError, AudioPlayer, LipSync, WavFormatError, get_mixer, parse_wav
+from llm_client import GroqClient
+from debate_core.prompts import (
+    create_structured_judge_prompt,
+    create_commentary_prompt,
+    JUDGE_SYSTEM_PROMPT,
+    STRUCTURED_JUDGE_SYSTEM_PROMPT,
+)
+from debate_core.verdict import parse_verdict
+from debate_core.config import EXPRESSIONS, LLM_MAX_TOKENS_JUDGE, LLM_MAX_TOKENS_VERDICT, YOUTUBE_CHARACTERS
+from debate_core.emotion import classify_emotion
+from debate_core.text import SentenceChunker
+from debate_core.timeline import TimelineReader, TimelineWriter
+from tts_client import AudioCache, SpeechStream, VoicevoxClient
+from scene import FrameClock, GradientBackground, ImageLoader, ParticleSystem
 
 
 class RateLimitError(Exception):
@@ -29,48 +41,27 @@ class RateLimitError(Exception):
 
 # API設定
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")  # 環境変数から取得
-VOICEVOX_URL = "http://localhost:50021"
-
-# BGM・効果音設定（ファイルがあれば再生）
+tts = VoicevoxClient(cache=AudioCache())  # URLは環境変数 VOICEVOX_URL で変更可能
+player = AudioPlayer()  # 出力ストリームは開いたまま使い回す
+image_loader = ImageLoader()  # 縮小済みの画像をディスクにキャッシュ
+TIMELINE_DIR = os.getenv("DEBATE_TIMELINE_DIR", "")  # 設定すると討論をタイムラインに記録（--replayで再生・動画書き出しに使える）
+FRAME_RATE = 30  # 描画のフレームレート（口パクの1コマ40msより細かく）
+# 再描画の単位（変更のあったレイヤーだけ更新する）
+SCENE_LAYERS = ("background", "characters", "topic", "subtitle", "particles")
+
+# BGM・効果音設定（PCMのWAVファイルがあれば再生）
 SOUND_DIR = os.path.join(os.path.dirname(__file__), "sounds")
 SOUNDS = {
-    "bgm": "bgm.mp3",           # 討論中のBGM
-    "start": "start.mp3",       # 開始時の効果音
-    "round": "round.mp3",       # ラウンド開始
-    "judge": "judge.mp3",       # ジャッジ開始
-    "winner": "winner.mp3",     # 勝者発表
-}
-
-# キャラクター設定
-CHARACTERS = {
-    "pro": {
-        "name": "さくら",
-        "age": "17歳",
-        "job": "高校生",
-        "tone": "元気で明るい口調",
-        "personality": "ポジティブ、熱血、たまにドジ",
-        "speaker_id": 3,
-        "color": "#FF69B4",
-        "bg_color": "#FFE4E1",
-    },
-    "con": {
-        "name": "あおい",
-        "age": "18歳",
-        "job": "大学生",
-        "tone": "クールで知的な口調",
-        "personality": "冷静、論理的、ちょっと毒舌",
-        "speaker_id": 2,
-        "color": "#4169E1",
-        "bg_color": "#E6E6FA",
-    },
-    "judge": {
-        "name": "ジャッジ",
-        "speaker_id": 8,
-    }
+    "bgm": "bgm.wav",           # 討論中のBGM
+    "start": "start.wav",       # 開始時の効果音
+    "round": "round.wav",       # ラウンド開始
+    "judge": "judge.wav",       # ジャッジ開始
+    "winner": "winner.wav",     # 勝者発表
 }
+BGM_GAIN = 0.3  # BGMの音量（声が聞き取れるように下げる）
 
-# 表情リスト
-EXPRESSIONS = ["normal", "angry", "happy", "surprised"]
+# キャラクター設定（動画書き出しと共通）
+CHARACTERS = YOUTUBE_CHARACTERS
 
 
 def get_groq_response(prompt: str, system_prompt: str, max_tokens: int = 200) -> str:
@@ -98,101 +89,68 @@ def get_groq_response(prompt: str, system_prompt: str, max_tokens: int = 200) ->
 
 
 def check_voicevox() -> bool:
-    try:
-        return requests.get(f"{VOICEVOX_URL}/speakers", timeout=2).status_code == 200
-    except:
-        return False
-
-
-def speak_voicevox(text: str, speaker_id: int) -> str:
-    """VOICEVOX音声合成"""
-    query = requests.post(
-        f"{VOICEVOX_URL}/audio_query",
-        params={"text": text, "speaker": speaker_id}, timeout=30
-    ).json()
-    query["speedScale"] = 1.2
-
-    audio = requests.post(
-        f"{VOICEVOX_URL}/synthesis",
-        params={"speaker": speaker_id}, json=query, timeout=60
-    ).content
+    return tts.is_available()
 
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-        f.write(audio)
-        return f.name
 
-
-def get_wav_duration(wav_path: str) -> float:
-    with wave.open(wav_path, 'r') as wav:
-        return wav.getnframes() / float(wav.getframerate())
+def speak_voicevox(text: str, speaker_id: int) -> bytes:
+    """VOICEVOX音声合成（WAVデータを返す）"""
+    return tts.synthesize(text, speaker_id, speed_scale=1.2)
 
 
 class SoundManager:
-    """BGM・効果音管理"""
+    """BGM・効果音管理（アプリ内ミキサーで声と重ねて再生）"""
     def __init__(self):
-        self.bgm_process = None
+        self.bgm_voice = None
+        self.mixer_available = True
+        self.clips = {}  # 読み込み済みのWAV（ファイルがなければNone）
         self.sounds_available = os.path.exists(SOUND_DIR)
         if not self.sounds_available:
             os.makedirs(SOUND_DIR, exist_ok=True)
 
-    def play_sound(self, sound_key: str, loop: bool = False):
-        """効果音を再生"""
-        if sound_key not in SOUNDS:
-            return
-        path = os.path.join(SOUND_DIR, SOUNDS[sound_key])
-        if not os.path.exists(path):
-            return
+    def _load(self, sound_key: str):
+        """効果音のWAVを読み込む（初回のみ）"""
+        if sound_key not in self.clips:
+            path = os.path.join(SOUND_DIR, SOUNDS[sound_key])
+            wav = None
+            if os.path.exists(path):
+                try:
+                    with open(path, "rb") as f:
+                        wav = parse_wav(f.read())
+                except (OSError, WavFormatError) as e:
+                    print(f"Sound error ({path}): {e}")
+            self.clips[sound_key] = wav
+        return self.clips[sound_key]
+
+    def play_sound(self, sound_key: str, loop: bool = False, gain: float = 1.0):
+        """効果音を再生（loop=Trueなら止めるまで繰り返す）。再生中のボイスを返す"""
+        if sound_key not in SOUNDS or not self.mixer_available:
+            return None
+        wav = self._load(sound_key)
+        if wav is None:
+            return None
         try:
-            if loop:
-                # BGMはループ再生（afplayの--loop）
-                self.bgm_process = subprocess.Popen(
-                    ['afplay', path],
-                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                )
-            else:
-                subprocess.Popen(
-                    ['afplay', path],
-                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                )
-        except:
-            pass
+            return get_mixer().add(wav, gain=gain, loop=loop)
+        except AudioError as e:
+            # 出力を開けない環境では以降の効果音を鳴らさない
+            print(f"Sound disabled: {e}")
+            self.mixer_available = False
+            return None
 
     def stop_bgm(self):
         """BGM停止"""
-        if self.bgm_process:
-            try:
-                self.bgm_process.terminate()
-            except:
-                pass
-            self.bgm_process = None
+        if self.bgm_voice is not None:
+            self.bgm_voice.stop()
+            self.bgm_voice = None
 
     def play_bgm(self):
         """BGM開始"""
         self.stop_bgm()
-        self.play_sound("bgm", loop=True)
+        self.bgm_voice = self.play_sound("bgm", loop=True, gain=BGM_GAIN)
 
 
 sound_manager = SoundManager()
 
 
-def analyze_emotion(text: str) -> str:
-    """テキストから感情を推定"""
-    angry_words = ["違う", "おかしい", "間違", "反論", "そんな", "ありえない", "バカ", "無理"]
-    happy_words = ["そうだ", "いい", "素晴らしい", "確かに", "賛成", "嬉しい", "楽しい", "最高"]
-    surprised_words = ["え？", "まさか", "本当", "驚", "信じられない", "すごい", "！？"]
-
-    for word in angry_words:
-        if word in text:
-            return "angry"
-    for word in surprised_words:
-        if word in text:
-            return "surprised"
-    for word in happy_words:
-        if word in text:
-            return "happy"
-    return "normal"
-
-
 def create_debater_prompt(role: str, topic: str, personality: dict) -> str:
     stance = "賛成" if role == "pro" else "反対"
     return f"""あなたは{personality['name']}という名前の{personality['age']}の{personality['job']}です。
@@ -206,43 +164,10 @@ def create_debater_prompt(role: str, topic: str, personality: dict) -> str:
 性格: {personality['personality']}"""
 
 
-def create_judge_prompt(topic: str, history: list, pro_name: str, con_name: str) -> str:
-    conversation = "\n".join([
-        f"{pro_name if i % 2 == 0 else con_name}: {msg}"
-        for i, msg in enumerate(history)
-    ])
-    return f"""【議題】{topic}
-
-【議論】
-{conversation}
-
-【判定を発表してください】
-「勝者は○○さん！」から始めて、理由を簡潔に述べてください。"""
-
-
-class Particle:
-    """パーティクルエフェクト用"""
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-3, 3)
-        self.vy = random.uniform(-5, -1)
-        self.life = 1.0
-        self.color = color
-        self.size = random.randint(3, 8)
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.2  # 重力
-        self.life -= 0.02
-        return self.life > 0
-
-
 class YouTubeDebateApp:
     """YouTube向けAI討論アプリ"""
 
-    def __init__(self):
+    def __init__(self, replay_path: str = None):
         self.root = tk.Tk()
         self.root.title("AI Debate - YouTube Edition")
         self.root.geometry("1280x720")
@@ -257,25 +182,36 @@ class YouTubeDebateApp:
         self.mouth_open = False
         self.is_running = False
         self.is_speaking = False
+        self.lipsync = None  # 再生中の音声の口の開き
+        self.lipsync_start = 0.0
         self.history = []
         self.topic = ""
-        self.particles = []
+        self.particles = ParticleSystem(capacity=1024)  # 配列でまとめて更新・一枚の画像に合成
+        self.particle_photo = None
         self.subtitle_text = ""
         self.subtitle_speaker = None
-        self.bg_offset = 0
+        self.bg_offset = 0.0
+        self.bg_frame = 0
+        self.background = GradientBackground(1280, 720, top=(26, 26, 46), bottom=(50, 30, 80))
         self.round_num = 0
+        self.turn_num = 0
+        self.replay_path = replay_path  # 記録済みタイムラインを再生する場合
+        self.timeline = None  # 記録中のタイムライン
 
         self.message_queue = queue.Queue()
 
+        # アニメーションと描画は一つのフレームループで回す（描画は1フレーム1回まで）
+        self.clock = FrameClock(self.root, fps=FRAME_RATE, render=self._render)
+
         self._setup_ui()
         self._load_images()
         self._check_voicevox()
 
-        # アニメーションループ
-        self.root.after(16, self._process_queue)
-        self.root.after(80, self._animate_mouth)
-        self.root.after(50, self._animate_background)
-        self.root.after(30, self._animate_particles)
+        self.clock.every(self._process_queue)
+        self.clock.every(self._animate_mouth)
+        self.clock.every(self._animate_background)
+        self.clock.every(self._animate_particles)
+        self.clock.start()
 
     def _ensure_assets(self):
         """画像アセット準備"""
@@ -391,17 +327,26 @@ class YouTubeDebateApp:
         img.save(os.path.join(self.assets_dir, filename))
 
     def _load_images(self):
-        """画像をロード"""
+        """画像をロード（縮小済みの画像をキャッシュから別スレッドで読み込む）"""
         max_size = 280
+        paths = {}
         for char in ["pro", "con"]:
             for expr in EXPRESSIONS:
                 for mouth in ["closed", "open"]:
                     key = f"{char}_{expr}_{mouth}"
-                    path = os.path.join(self.assets_dir, f"{key}.png")
-                    if os.path.exists(path):
-                        img = Image.open(path)
-                        img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-                        self.images[key] = ImageTk.PhotoImage(img)
+                    paths[key] = os.path.join(self.assets_dir, f"{key}.png")
+        future = image_loader.load_async(paths, size=(max_size, max_size))
+        future.add_done_callback(lambda f: self.message_queue.put({"action": "images", "future": f}))
+
+    def _set_images(self, future):
+        """読み込んだ画像をTk用に変換（Tkのスレッドで呼ぶ）"""
+        try:
+            loaded = future.result()
+        except OSError as e:
+            print(f"画像の読み込みに失敗しました: {e}")
+            return
+        self.images = {key: ImageTk.PhotoImage(img) for key, img in loaded.items()}
+        self.clock.mark_dirty("characters")
 
     def _check_voicevox(self):
         self.voicevox_available = check_voicevox()
@@ -437,112 +382,158 @@ class YouTubeDebateApp:
                                   command=self._stop_debate, state=tk.DISABLED, width=12)
         self.stop_btn.pack(side=tk.LEFT, padx=10)
 
-        # 初期描画
-        self._draw_scene()
+        # シーンのキャンバスアイテムは一度だけ作り、以後は差分だけ更新する
+        self._build_scene()
 
-    def _draw_scene(self):
-        """シーン全体を描画"""
-        self.main_canvas.delete("all")
+    def _build_scene(self):
+        """シーンのキャンバスアイテムを作成（起動時に一度だけ）"""
+        canvas = self.main_canvas
 
-        # 背景グラデーション
-        for i in range(720):
-            ratio = i / 720
-            r = int(26 + (50 - 26) * ratio + 10 * math.sin(self.bg_offset + i * 0.01))
-            g = int(26 + (30 - 26) * ratio + 10 * math.sin(self.bg_offset + i * 0.01 + 2))
-            b = int(46 + (80 - 46) * ratio + 10 * math.sin(self.bg_offset + i * 0.01 + 4))
-            r, g, b = max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b))
-            color = f'#{r:02x}{g:02x}{b:02x}'
-            self.main_canvas.create_line(0, i, 1280, i, fill=color)
+        # 背景グラデーション（事前に描いたフレームを差し替える）
+        self.bg_item = canvas.create_image(0, 0, anchor='nw')
 
         # VS テキスト
-        self.main_canvas.create_text(640, 300, text="VS", font=("Helvetica", 72, "bold"),
-                                     fill='#FFD700')
+        canvas.create_text(640, 300, text="VS", font=("Helvetica", 72, "bold"), fill='#FFD700')
 
         # キャラクター枠
         # 左（賛成派）
-        self.main_canvas.create_rectangle(80, 120, 400, 500, outline=CHARACTERS['pro']['color'], width=4)
-        self.main_canvas.create_rectangle(80, 500, 400, 550, fill=CHARACTERS['pro']['color'], outline='')
-        self.main_canvas.create_text(240, 525, text=f"💖 {CHARACTERS['pro']['name']}",
-                                     font=("Helvetica", 18, "bold"), fill='white')
+        canvas.create_rectangle(80, 120, 400, 500, outline=CHARACTERS['pro']['color'], width=4)
+        canvas.create_rectangle(80, 500, 400, 550, fill=CHARACTERS['pro']['color'], outline='')
+        canvas.create_text(240, 525, text=f"💖 {CHARACTERS['pro']['name']}",
+                           font=("Helvetica", 18, "bold"), fill='white')
 
         # 右（反対派）
-        self.main_canvas.create_rectangle(880, 120, 1200, 500, outline=CHARACTERS['con']['color'], width=4)
-        self.main_canvas.create_rectangle(880, 500, 1200, 550, fill=CHARACTERS['con']['color'], outline='')
-        self.main_canvas.create_text(1040, 525, text=f"💙 {CHARACTERS['con']['name']}",
-                                     font=("Helvetica", 18, "bold"), fill='white')
-
-        # キャラクター画像
-        pro_expr = self.current_expression["pro"]
-        con_expr = self.current_expression["con"]
-        pro_mouth = "open" if (self.current_speaker == "pro" and self.mouth_open) else "closed"
-        con_mouth = "open" if (self.current_speaker == "con" and self.mouth_open) else "closed"
-
-        pro_key = f"pro_{pro_expr}_{pro_mouth}"
-        con_key = f"con_{con_expr}_{con_mouth}"
-
-        if pro_key in self.images:
-            self.main_canvas.create_image(240, 310, image=self.images[pro_key])
-        if con_key in self.images:
-            self.main_canvas.create_image(1040, 310, image=self.images[con_key])
-
-        # スピーカーハイライト
+        canvas.create_rectangle(880, 120, 1200, 500, outline=CHARACTERS['con']['color'], width=4)
+        canvas.create_rectangle(880, 500, 1200, 550, fill=CHARACTERS['con']['color'], outline='')
+        canvas.create_text(1040, 525, text=f"💙 {CHARACTERS['con']['name']}",
+                           font=("Helvetica", 18, "bold"), fill='white')
+
+        # キャラクター画像（画像は_update_charactersで差し替え）
+        self.char_items = {
+            "pro": canvas.create_image(240, 310),
+            "con": canvas.create_image(1040, 310),
+        }
+
+        # スピーカーハイライト（話者に合わせて移動）
+        self.highlight_item = canvas.create_rectangle(0, 0, 0, 0, outline='#FFFF00', width=6,
+                                                      state='hidden')
+
+        # 議題表示
+        self.topic_items = [
+            canvas.create_rectangle(200, 50, 1080, 100, fill='#2d2d5a', outline='#FFD700', width=2,
+                                    state='hidden'),
+            canvas.create_text(640, 75, font=("Helvetica", 20, "bold"), fill='white', state='hidden'),
+        ]
+
+        # 字幕表示（背景・話者名・テキスト）
+        self.subtitle_bg = canvas.create_rectangle(100, 570, 1180, 650, fill='#000000', stipple='gray50',
+                                                   state='hidden')
+        self.subtitle_name = canvas.create_text(150, 590, font=("Helvetica", 16, "bold"), anchor='w',
+                                                state='hidden')
+        self.subtitle_item = canvas.create_text(640, 620, font=("Helvetica", 22), fill='white', width=1000,
+                                                state='hidden')
+
+        # パーティクル（全粒子を合成した一枚の画像）
+        self.particle_item = canvas.create_image(0, 0, anchor='nw', state='hidden')
+
+        self._render(set(SCENE_LAYERS))
+
+    def _render(self, dirty):
+        """変更のあったレイヤーだけ更新（FrameClockから1フレームに1回呼ばれる）"""
+        if "background" in dirty:
+            self._update_background()
+        if "characters" in dirty:
+            self._update_characters()
+        if "topic" in dirty:
+            self._update_topic()
+        if "subtitle" in dirty:
+            self._update_subtitle()
+        if "particles" in dirty:
+            self._update_particles()
+
+    def _update_background(self):
+        """背景グラデーションのフレームを差し替え"""
+        self.main_canvas.itemconfig(self.bg_item, image=self.background.photo(self.bg_offset))
+
+    def _update_characters(self):
+        """表情・口・話者ハイライトを更新"""
+        for char, item in self.char_items.items():
+            mouth = "open" if (self.current_speaker == char and self.mouth_open) else "closed"
+            key = f"{char}_{self.current_expression[char]}_{mouth}"
+            self.main_canvas.itemconfig(item, image=self.images.get(key, ''))
+
         if self.current_speaker == "pro":
-            self.main_canvas.create_rectangle(75, 115, 405, 555, outline='#FFFF00', width=6)
+            self.main_canvas.coords(self.highlight_item, 75, 115, 405, 555)
+            self.main_canvas.itemconfig(self.highlight_item, state='normal')
         elif self.current_speaker == "con":
-            self.main_canvas.create_rectangle(875, 115, 1205, 555, outline='#FFFF00', width=6)
+            self.main_canvas.coords(self.highlight_item, 875, 115, 1205, 555)
+            self.main_canvas.itemconfig(self.highlight_item, state='normal')
+        else:
+            self.main_canvas.itemconfig(self.highlight_item, state='hidden')
+
+    def _update_topic(self):
+        """議題表示を更新"""
+        state = 'normal' if self.topic else 'hidden'
+        self.main_canvas.itemconfig(self.topic_items[1], text=f"📢 {self.topic}")
+        for item in self.topic_items:
+            self.main_canvas.itemconfig(item, state=state)
+
+    def _update_subtitle(self):
+        """字幕を更新"""
+        if not self.subtitle_text:
+            for item in (self.subtitle_bg, self.subtitle_name, self.subtitle_item):
+                self.main_canvas.itemconfig(item, state='hidden')
+            return
 
-        # 議題表示
-        if self.topic:
-            self.main_canvas.create_rectangle(200, 50, 1080, 100, fill='#2d2d5a', outline='#FFD700', width=2)
-            self.main_canvas.create_text(640, 75, text=f"📢 {self.topic}",
-                                        font=("Helvetica", 20, "bold"), fill='white')
-
-        # 字幕表示
-        if self.subtitle_text:
-            # 字幕背景
-            self.main_canvas.create_rectangle(100, 570, 1180, 650, fill='#000000', stipple='gray50')
-            # 話者名
-            if self.subtitle_speaker:
-                speaker_color = CHARACTERS[self.subtitle_speaker]['color']
-                speaker_name = CHARACTERS[self.subtitle_speaker]['name']
-                self.main_canvas.create_text(150, 590, text=f"【{speaker_name}】",
-                                            font=("Helvetica", 16, "bold"), fill=speaker_color, anchor='w')
-            # 字幕テキスト
-            self.main_canvas.create_text(640, 620, text=self.subtitle_text,
-                                        font=("Helvetica", 22), fill='white', width=1000)
-
-        # パーティクル
-        for p in self.particles:
-            alpha = int(p.life * 255)
-            self.main_canvas.create_oval(p.x - p.size, p.y - p.size,
-                                         p.x + p.size, p.y + p.size,
-                                         fill=p.color, outline='')
+        self.main_canvas.itemconfig(self.subtitle_bg, state='normal')
+        self.main_canvas.itemconfig(self.subtitle_item, text=self.subtitle_text, state='normal')
+        if self.subtitle_speaker:
+            self.main_canvas.itemconfig(self.subtitle_name,
+                                        text=f"【{CHARACTERS[self.subtitle_speaker]['name']}】",
+                                        fill=CHARACTERS[self.subtitle_speaker]['color'], state='normal')
+        else:
+            self.main_canvas.itemconfig(self.subtitle_name, state='hidden')
+
+    def _update_particles(self):
+        """パーティクル画像を差し替え（粒子のある範囲だけ合成）"""
+        rendered = self.particles.render(1280, 720)
+        if rendered is None:
+            self.particle_photo = None
+            self.main_canvas.itemconfig(self.particle_item, state='hidden')
+            return
+
+        x, y, image = rendered
+        self.particle_photo = ImageTk.PhotoImage(image)  # 参照を保持しないと表示されない
+        self.main_canvas.coords(self.particle_item, x, y)
+        self.main_canvas.itemconfig(self.particle_item, image=self.particle_photo, state='normal')
 
     def _animate_background(self):
         """背景アニメーション"""
-        self.bg_offset += 0.05
         if self.is_running or self.particles:
-            self._draw_scene()
-        self.root.after(50, self._animate_background)
+            self.bg_offset += self.clock.dt
+            # 事前描画したフレームが切り替わるときだけ描き直す
+            frame = self.background.frame_index(self.bg_offset)
+            if frame != self.bg_frame:
+                self.bg_frame = frame
+                self.clock.mark_dirty("background")
 
     def _animate_mouth(self):
-        """口パクアニメーション"""
-        if self.is_speaking:
-            self.mouth_open = not self.mouth_open
-            self._draw_scene()
-        self.root.after(80, self._animate_mouth)
+        """口パクアニメーション（音量から求めた口の開きに合わせる）"""
+        if self.is_speaking and self.lipsync is not None:
+            mouth_open = self.lipsync.is_open(time.monotonic() - self.lipsync_start)
+            if mouth_open != self.mouth_open:
+                self.mouth_open = mouth_open
+                self.clock.mark_dirty("characters")
 
     def _animate_particles(self):
         """パーティクルアニメーション"""
-        self.particles = [p for p in self.particles if p.update()]
         if self.particles:
-            self._draw_scene()
-        self.root.after(30, self._animate_particles)
+            self.particles.update(self.clock.dt)
+            self.clock.mark_dirty("particles")
 
     def _spawn_particles(self, x, y, color, count=20):
         """パーティクル生成"""
-        for _ in range(count):
-            self.particles.append(Particle(x, y, color))
+        self.particles.spawn(x, y, color, count)
 
     def _process_queue(self):
         """メッセージキュー処理"""
@@ -551,21 +542,25 @@ class YouTubeDebateApp:
                 msg = self.message_queue.get_nowait()
                 action = msg.get("action")
 
-                if action == "speaker":
+                if action == "images":
+                    self._set_images(msg["future"])
+                elif action == "speaker":
                     self.current_speaker = msg["speaker"]
-                    self._draw_scene()
+                    self.clock.mark_dirty("characters")
                 elif action == "expression":
                     self.current_expression[msg["speaker"]] = msg["value"]
-                    self._draw_scene()
+                    self.clock.mark_dirty("characters")
                 elif action == "speaking":
                     self.is_speaking = msg["value"]
+                    self.lipsync = msg.get("lipsync")
+                    self.lipsync_start = msg.get("start", 0.0)
                     if not self.is_speaking:
                         self.mouth_open = False
-                        self._draw_scene()
+                        self.clock.mark_dirty("characters")
                 elif action == "subtitle":
                     self.subtitle_text = msg["text"]
                     self.subtitle_speaker = msg.get("speaker")
-                    self._draw_scene()
+                    self.clock.mark_dirty("subtitle")
                 elif action == "round":
                     self.round_num = msg["value"]
                     self.round_label.config(text=f"🔔 Round {self.round_num}")
@@ -587,15 +582,17 @@ class YouTubeDebateApp:
                     self.current_speaker = None
                     self.subtitle_text = ""
                     sound_manager.stop_bgm()
-                    self._draw_scene()
+                    self.clock.mark_dirty("characters", "subtitle")
 
         except queue.Empty:
             pass
 
-        self.root.after(16, self._process_queue)
-
     def _start_debate(self):
         """討論開始"""
+        if self.replay_path:
+            self._start_replay()
+            return
+
         if not self.voicevox_available:
             self._check_voicevox()
             if not self.voicevox_available:
@@ -609,12 +606,19 @@ class YouTubeDebateApp:
         self.topic = topic
         self.history = []
         self.round_num = 0
+        self.turn_num = 0
+
+        if TIMELINE_DIR:
+            os.makedirs(TIMELINE_DIR, exist_ok=True)
+            path = os.path.join(TIMELINE_DIR, time.strftime("debate_%Y%m%d_%H%M%S.jsonl"))
+            self.timeline = TimelineWriter(path, topic=topic, app="youtube")
+            print(f"タイムラインを記録します: {path}")
 
         self.is_running = True
         self.start_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
 
-        self._draw_scene()
+        self.clock.mark_dirty("topic")
 
         # 開始効果音 & BGM
         sound_manager.play_sound("start")
@@ -626,105 +630,124 @@ class YouTubeDebateApp:
 
     def _stop_debate(self):
         self.is_running = False
+        player.stop()
         self.stop_btn.config(state=tk.DISABLED)
 
     def _generate_text_and_audio(self, prompt: str, system: str, speaker_id: int):
-        """テキスト＋音声生成"""
-        text = get_groq_response(prompt, system).strip()
-        wav_path = speak_voicevox(text, speaker_id)
-        return text, wav_path
+        """テキストをストリーミング生成し、できた文から順に音声合成する
+
+        Returns:
+            (発言全文のFuture, 文ごとの音声を順に返すSpeechStream)
+        """
+        speech = SpeechStream(tts, speaker_id, speed_scale=1.2)
+        text_future = self.executor.submit(self._stream_text, prompt, system, speech)
+        return text_future, speech
+
+    def _stream_text(self, prompt: str, system: str, speech: SpeechStream, max_tokens: int = 200) -> str:
+        """LLMの出力を受け取りながら、完成した文をすぐ音声合成に回す"""
+        client = GroqClient(api_key=GROQ_API_KEY)
+        chunker = SentenceChunker()
+        parts = []
+        try:
+            for delta in client.stream_response(prompt, system, max_tokens=max_tokens):
+                parts.append(delta)
+                speech.feed_all(chunker.feed(delta), close=False)
+            speech.feed_all(chunker.flush())
+        finally:
+            speech.close()
+        return "".join(parts).strip()
 
     def _debate_loop(self):
-        """討論ループ"""
-        from concurrent.futures import ThreadPoolExecutor
-
-        pro_name = CHARACTERS["pro"]["name"]
-        con_name = CHARACTERS["con"]["name"]
-        pro_system = create_debater_prompt("pro", self.topic, CHARACTERS["pro"])
-        con_system = create_debater_prompt("con", self.topic, CHARACTERS["con"])
+        """討論ループ（テキスト生成→音声合成→再生を文単位でつなぐ）"""
+        systems = {
+            "pro": create_debater_prompt("pro", self.topic, CHARACTERS["pro"]),
+            "con": create_debater_prompt("con", self.topic, CHARACTERS["con"]),
+        }
 
         initial_prompt = f"「{self.topic}」について、自分の意見を言って。"
-        executor = ThreadPoolExecutor(max_workers=2)
-        next_future = None
-
-        while self.is_running:
-            self.round_num += 1
-            self.message_queue.put({"action": "round", "value": self.round_num})
 
-            # === 賛成派 ===
-            if self.round_num == 1:
-                try:
-                    pro_text = get_groq_response(initial_prompt, pro_system).strip()
-                    pro_wav = speak_voicevox(pro_text, CHARACTERS["pro"]["speaker_id"])
-                except Exception as e:
-                    self.message_queue.put({"action": "subtitle", "text": f"[エラー: {e}]"})
-                    break
-            else:
-                try:
-                    pro_text, pro_wav = next_future.result()
-                except Exception as e:
-                    self.message_queue.put({"action": "subtitle", "text": f"[エラー: {e}]"})
-                    break
+        # 再生中の発言と、次の発言の生成が同時に動く
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        role = "pro"
+        current = self._generate_text_and_audio(initial_prompt, systems["pro"], CHARACTERS["pro"]["speaker_id"])
 
-            self.history.append(pro_text)
-            emotion = analyze_emotion(pro_text)
-            self.message_queue.put({"action": "expression", "speaker": "pro", "value": emotion})
-            self.message_queue.put({"action": "subtitle", "text": pro_text, "speaker": "pro"})
+        while self.is_running:
+            if role == "pro":
+                self.round_num += 1
+                self.message_queue.put({"action": "round", "value": self.round_num})
+                if self.timeline:
+                    self.timeline.event("round", round=self.round_num)
 
-            # 先読み開始
-            con_prompt = f"{pro_name}「{pro_text}」\n\n↑反論して。"
-            next_future = executor.submit(
-                self._generate_text_and_audio,
-                con_prompt, con_system, CHARACTERS["con"]["speaker_id"]
-            )
+            text_future, speech = current
 
-            self._play_with_animation(pro_wav, "pro")
-            if not self.is_running:
-                break
+            # 1文目の音声ができしだい再生開始（全文の生成を待たない）
+            playback = self.executor.submit(self._play_stream_with_animation, speech, role)
 
-            # === 反対派 ===
             try:
-                con_text, con_wav = next_future.result()
+                text = text_future.result()
             except Exception as e:
+                playback.result()
                 self.message_queue.put({"action": "subtitle", "text": f"[エラー: {e}]"})
                 break
 
-            self.history.append(con_text)
-            emotion = analyze_emotion(con_text)
-            self.message_queue.put({"action": "expression", "speaker": "con", "value": emotion})
-            self.message_queue.put({"action": "subtitle", "text": con_text, "speaker": "con"})
+            self.history.append(text)
 
-            # 先読み開始
-            pro_prompt = f"{con_name}「{con_text}」\n\n↑反論して。"
-            next_future = executor.submit(
-                self._generate_text_and_audio,
-                pro_prompt, pro_system, CHARACTERS["pro"]["speaker_id"]
-            )
-
-            self._play_with_animation(con_wav, "con")
+            # 停止されたら次の発言は生成しない
             if not self.is_running:
+                playback.result()
                 break
 
-        executor.shutdown(wait=False)
+            # 全文がそろった時点で相手の発言を先読み開始（再生の終了は待たない）
+            opponent = "con" if role == "pro" else "pro"
+            next_prompt = f"{CHARACTERS[role]['name']}「{text}」\n\n↑反論して。"
+            current = self._generate_text_and_audio(
+                next_prompt, systems[opponent], CHARACTERS[opponent]["speaker_id"]
+            )
+
+            playback.result()
+            role = opponent
+
+        # 再生されずに残った先読み（再生中に停止された場合）を止める
+        text_future, speech = current
+        text_future.cancel()
+        speech.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
         if len(self.history) >= 2:
             self._run_judge()
 
+        if self.timeline:
+            self.timeline.close()
+            self.timeline = None
         self.message_queue.put({"action": "done"})
 
-    def _play_with_animation(self, wav_path: str, speaker: str):
-        """音声再生＋アニメーション"""
+    def _play_stream_with_animation(self, speech: SpeechStream, speaker: str):
+        """文ごとに合成された音声を順に再生（字幕と表情も文ごとに更新）"""
         self.message_queue.put({"action": "speaker", "speaker": speaker})
-        self.message_queue.put({"action": "speaking", "value": True})
+        self.turn_num += 1
+        spoken = ""
+        emotion = "normal"
 
         try:
-            play_proc = subprocess.Popen(['afplay', wav_path],
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            play_proc.wait()
+            for sentence, audio in speech.iter_sentences():
+                spoken += sentence
+                # 文ごとに判定し、感情語のない文では直前の表情を保つ
+                emotion = classify_emotion(sentence, default=emotion)
+                self.message_queue.put({"action": "expression", "speaker": speaker, "value": emotion})
+                self.message_queue.put({"action": "subtitle", "text": spoken, "speaker": speaker})
+                if self.timeline:
+                    self.timeline.utterance(speaker, sentence, audio, emotion=emotion, turn=self.turn_num)
+                self.message_queue.put({
+                    "action": "speaking", "value": True,
+                    "lipsync": LipSync.from_wav(audio), "start": time.monotonic(),
+                })
+                player.play(audio)
+                if not self.is_running:
+                    break
+        except Exception as e:
+            self.message_queue.put({"action": "subtitle", "text": f"[再生エラー: {e}]"})
         finally:
             self.message_queue.put({"action": "speaking", "value": False})
-            if os.path.exists(wav_path):
-                os.remove(wav_path)
 
     def _run_judge(self):
         """ジャッジ実行"""
@@ -733,31 +756,134 @@ class YouTubeDebateApp:
 
         self.message_queue.put({"action": "judge_start"})
         self.message_queue.put({"action": "subtitle", "text": "⚖️ 判定中..."})
+        if self.timeline:
+            self.timeline.event("judge_start", hold=1.5)
 
-        judge_system = "あなたは元気なディベートの審判です。判定を発表してください。"
-        judge_prompt = create_judge_prompt(self.topic, self.history, pro_name, con_name)
+        client = GroqClient(api_key=GROQ_API_KEY)
+        try:
+            # 採点と勝者だけを小さなJSONで先に取得（講評は別に生成するので途中で切れない）
+            judge_prompt = create_structured_judge_prompt(
+                self.topic, self.history, pro_name, con_name, include_commentary=False
+            )
+            data = client.get_json_response(judge_prompt, STRUCTURED_JUDGE_SYSTEM_PROMPT, max_tokens=LLM_MAX_TOKENS_VERDICT)
+            verdict = parse_verdict(data, pro_name, con_name)
+        except Exception as e:
+            self.message_queue.put({"action": "subtitle", "text": f"[判定エラー: {e}]"})
+            return
 
+        if self.timeline:
+            self.timeline.event("verdict", hold=3.0, **verdict.to_dict())
+        self._announce_winner(verdict.winner, verdict.winner_name, verdict.totals)
+
+        # 講評をストリーミング生成し、できた文から読み上げる
+        commentary_prompt = create_commentary_prompt(self.topic, self.history, pro_name, con_name, verdict)
+        speech = SpeechStream(tts, CHARACTERS["judge"]["speaker_id"], speed_scale=1.2)
+        executor = ThreadPoolExecutor(max_workers=1)
+        text_future = executor.submit(
+            self._stream_text, commentary_prompt, JUDGE_SYSTEM_PROMPT, speech, LLM_MAX_TOKENS_JUDGE
+        )
+        self.turn_num += 1
+        spoken = ""
         try:
-            result = get_groq_response(judge_prompt, judge_system, max_tokens=300)
-            self.message_queue.put({"action": "subtitle", "text": result})
-
-            # 勝者演出
-            self.message_queue.put({"action": "winner"})
-            time.sleep(0.3)
-            if pro_name in result[:50]:
-                self.message_queue.put({"action": "particles", "x": 240, "y": 310, "color": "#FF69B4", "count": 100})
-            elif con_name in result[:50]:
-                self.message_queue.put({"action": "particles", "x": 1040, "y": 310, "color": "#4169E1", "count": 100})
-
-            # 音声
-            wav_path = speak_voicevox(result, CHARACTERS["judge"]["speaker_id"])
-            play_proc = subprocess.Popen(['afplay', wav_path],
-                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            play_proc.wait()
-            os.remove(wav_path)
+            for sentence, audio in speech.iter_sentences():
+                spoken += sentence
+                self.message_queue.put({"action": "subtitle", "text": spoken})
+                if self.timeline:
+                    self.timeline.utterance("judge", sentence, audio, turn=self.turn_num)
+                player.play(audio)
+                if not self.is_running:
+                    break
+            text_future.result()
+        except Exception as e:
+            self.message_queue.put({"action": "subtitle", "text": f"[講評エラー: {e}]"})
+        finally:
+            speech.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _announce_winner(self, winner: str, winner_name: str, totals: dict):
+        """勝者発表（字幕・効果音・パーティクル）"""
+        pro_name = CHARACTERS["pro"]["name"]
+        con_name = CHARACTERS["con"]["name"]
+        self.message_queue.put({
+            "action": "subtitle",
+            "text": f"🏆 勝者は{winner_name}さん！（{pro_name} {totals['pro']}点 / {con_name} {totals['con']}点）",
+        })
+
+        # 勝者演出
+        self.message_queue.put({"action": "winner"})
+        time.sleep(0.3)
+        if winner == "pro":
+            self.message_queue.put({"action": "particles", "x": 240, "y": 310, "color": "#FF69B4", "count": 100})
+        else:
+            self.message_queue.put({"action": "particles", "x": 1040, "y": 310, "color": "#4169E1", "count": 100})
+
+    def _start_replay(self):
+        """記録済みタイムラインの再生を開始"""
+        try:
+            timeline = TimelineReader(self.replay_path)
+        except (OSError, ValueError) as e:
+            self.status_label.config(text=f"⚠️ タイムラインを開けません: {e}", fg="#FFD700")
+            return
 
+        self.topic = timeline.topic
+        self.is_running = True
+        self.start_btn.config(state=tk.DISABLED)
+        self.stop_btn.config(state=tk.NORMAL)
+        self.clock.mark_dirty("topic")
+        sound_manager.play_bgm()
+
+        thread = threading.Thread(target=self._replay_loop, args=(timeline,), daemon=True)
+        thread.start()
+
+    def _replay_loop(self, timeline: TimelineReader):
+        """タイムラインの出来事を記録された時刻どおりに再生（LLM・音声合成は使わない）"""
+        start = time.monotonic()
+        spoken = {}  # ターンごとの話した内容（字幕用）
+        emotions = {}  # ターンごとの現在の表情
+
+        try:
+            for event in timeline:
+                if not self.is_running:
+                    break
+                delay = start + event.t - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+                if event.type == "round":
+                    self.message_queue.put({"action": "round", "value": event.data["round"]})
+                elif event.type == "judge_start":
+                    self.message_queue.put({"action": "judge_start"})
+                    self.message_queue.put({"action": "subtitle", "text": "⚖️ 判定中..."})
+                elif event.type == "verdict":
+                    self._announce_winner(event.data["winner"], event.data["winner_name"], event.data["totals"])
+                elif event.type == "utterance":
+                    speaker = event.data["speaker"]
+                    turn = event.data.get("turn")
+                    spoken[turn] = spoken.get(turn, "") + event.data["text"]
+                    if speaker in ("pro", "con"):
+                        self.message_queue.put({"action": "speaker", "speaker": speaker})
+                        # 感情のないタイムラインはライブと同じく文ごとに判定（感情語がなければ直前の表情）
+                        emotion = event.data.get("emotion") or classify_emotion(
+                            event.data["text"], default=emotions.get(turn, "normal")
+                        )
+                        emotions[turn] = emotion
+                        self.message_queue.put({"action": "expression", "speaker": speaker, "value": emotion})
+                        self.message_queue.put({"action": "subtitle", "text": spoken[turn], "speaker": speaker})
+                    else:
+                        self.message_queue.put({"action": "subtitle", "text": spoken[turn]})
+
+                    audio = timeline.read_audio(event)
+                    if audio:
+                        self.message_queue.put({
+                            "action": "speaking", "value": True,
+                            "lipsync": LipSync.from_wav(audio), "start": time.monotonic(),
+                        })
+                        player.play(audio)
+                        self.message_queue.put({"action": "speaking", "value": False})
         except Exception as e:
-            self.message_queue.put({"action": "subtitle", "text": f"[判定エラー: {e}]"})
+            self.message_queue.put({"action": "subtitle", "text": f"[再生エラー: {e}]"})
+
+        self.message_queue.put({"action": "done"})
 
     def run(self):
         self.root.mainloop()
@@ -767,7 +893,10 @@ if __name__ == "__main__":
     print("=" * 50)
     print("AI Debate YouTube Edition")
     print("=" * 50)
-    print("\n⚠️  VOICEVOXを起動してから実行してください\n")
+    # python ai_debate_youtube.py --replay debate.jsonl で記録済みの討論を再生
+    replay_path = sys.argv[2] if len(sys.argv) > 2 and sys.argv[1] == "--replay" else None
+    if not replay_path:
+        print("\n⚠️  VOICEVOXを起動してから実行してください\n")
 
-    app = YouTubeDebateApp()
+    app = YouTubeDebateApp(replay_path)
     app.run()
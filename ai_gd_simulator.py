@@ -14,16 +14,20 @@ AI グループディスカッション シミュレーター
 import tkinter as tk
 from tkinter import Canvas, simpledialog, ttk
 from PIL import Image, ImageDraw, ImageTk
+import logging
 import os
 import threading
-import subprocess
-import tempfile
 import time
 import queue
-import requests
-import wave
 import random
 import math
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from audio_playback import AudioError, AudioPlayer, LipSync
+from debate_core.text import split_sentences
+from tts_client import AudioCache, TTSError, VoicevoxClient, synthesize_sentences
+from scene import FrameClock, ImageLoader
 
 
 class RateLimitError(Exception):
@@ -32,7 +36,14 @@ class RateLimitError(Exception):
 
 # API設定
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")  # 環境変数から取得
-VOICEVOX_URL = "http://localhost:50021"
+tts = VoicevoxClient(cache=AudioCache())  # URLは環境変数 VOICEVOX_URL で変更可能
+player = AudioPlayer()  # 出力ストリームは開いたまま使い回す
+image_loader = ImageLoader()  # 縮小済みの画像をディスクにキャッシュ
+logger = logging.getLogger(__name__)  # 先読みパイプラインの診断用
+FRAME_RATE = 30  # 描画のフレームレート（口パクの1コマ40msより細かく）
+PREFETCH_DEPTH = 3  # 議論フェーズで先に準備しておく発言の数
+TTS_WORKERS = 2  # 先読みの音声合成を並行して行う数（VOICEVOXはCPUだと2〜3で頭打ち）
+TEXT_RETRY_SECONDS = 2  # テキスト生成に失敗したときの再試行までの待ち時間
 
 # 役職定義
 ROLES = ["司会", "書記", "タイムキーパー", "アイデアマン", "発表役"]
@@ -122,39 +133,176 @@ def get_groq_response(prompt: str, system_prompt: str, max_tokens: int = 300) ->
 
 
 def check_voicevox() -> bool:
-    try:
-        return requests.get(f"{VOICEVOX_URL}/speakers", timeout=2).status_code == 200
-    except:
-        return False
+    return tts.is_available()
 
 
-def speak_voicevox(text: str, speaker_id: int) -> str:
-    """VOICEVOX音声合成"""
+def speak_voicevox(text: str, speaker_id: int) -> bytes:
+    """VOICEVOX音声合成（WAVデータを返す。失敗時はNone）"""
     try:
-        query = requests.post(
-            f"{VOICEVOX_URL}/audio_query",
-            params={"text": text, "speaker": speaker_id}, timeout=30
-        ).json()
-        query["speedScale"] = 1.0
-
-        audio = requests.post(
-            f"{VOICEVOX_URL}/synthesis",
-            params={"speaker": speaker_id}, json=query, timeout=60
-        ).content
-
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            f.write(audio)
-            return f.name
-    except Exception as e:
+        return tts.synthesize(text, speaker_id, speed_scale=1.0)
+    except TTSError as e:
         print(f"VOICEVOX error: {e}")
         return None
 
 
+def speak_voicevox_sentences(text: str, speaker_id: int):
+    """文ごとに並行して音声合成し、WAVデータを順番に返す（1文目ができた時点で再生を始められる）"""
+    return synthesize_sentences(tts, split_sentences(text), speaker_id, speed_scale=1.0)
+
+
 def get_total_score(stats: dict) -> int:
     """総合スコアを計算"""
     return sum(stats.values())
 
 
+@dataclass
+class Turn:
+    """先読みした議論の発言
+
+    Attributes:
+        epoch: 生成を始めたときの巻き戻し回数（古いものは捨てる）
+        round_num: 議論の何番目の発言か
+        speaker_idx: 発言者
+        context: 生成時の文脈（直前の発言者と、直前2発言の (名前, 本文)）
+        text: 発言内容
+        audio: 音声合成の結果（WAVデータ、失敗時はNone）
+    """
+
+    epoch: int
+    round_num: int
+    speaker_idx: int
+    context: tuple
+    text: str
+    audio: Future
+
+
+def discussion_context(log: list, last_speaker_idx: int) -> tuple:
+    """次の発言の生成に使う文脈（発言者の決定と直前2発言のプロンプトに使う分だけ）"""
+    return last_speaker_idx, tuple((d["speaker"], d["text"]) for d in log[-2:])
+
+
+class TurnPipeline:
+    """議論フェーズの発言を先読みするパイプライン
+
+    テキスト生成 → 音声合成 → 再生 の3段をキューでつなぎ、最大 depth 件先の
+    発言まで準備しておく。テキスト生成は直前の発言を文脈にするので1本のスレッドで
+    順番に行い、まだ再生していない生成済みの発言を文脈に次を生成する。音声合成は
+    複数スレッドで並行に行うので、VOICEVOXが再生より遅くても発言の間が空かない。
+
+    再生しようとした発言の文脈が実際に再生された発言と食い違ったときだけ、
+    その発言とそれを前提に生成した後続を捨て、再生済みの発言から生成し直す。
+    """
+
+    def __init__(self, app, depth: int = PREFETCH_DEPTH, tts_workers: int = TTS_WORKERS):
+        self.app = app
+        self._slots = threading.Semaphore(depth)  # 準備中＋準備済みの発言数の上限
+        self._turns: "queue.Queue[Turn]" = queue.Queue()
+        self._tts = ThreadPoolExecutor(max_workers=tts_workers, thread_name_prefix="gd-tts")
+        self._lock = threading.Lock()
+        self._epoch = 0
+        self._planned = []  # 生成済みの発言（再生済み＋先読み分）
+        self._planned_last = -1
+        self._round = 0
+        self._running = False
+
+    def start(self, round_num: int = 0):
+        """再生済みの発言の続きから先読みを始める"""
+        self._rewind(round_num)
+        self._running = True
+        threading.Thread(target=self._text_stage, daemon=True).start()
+
+    def stop(self):
+        """先読みをやめ、未再生の発言を捨てる"""
+        self._running = False
+        self._drain()
+        self._tts.shutdown(wait=False, cancel_futures=True)
+
+    def next_turn(self, round_num: int, timeout: float = 0.5):
+        """次に再生する発言（テキストが揃っていなければ timeout 秒待ってNone）
+
+        文脈が再生済みの発言と合わない発言は捨て、round_num から生成し直す。
+        """
+        try:
+            turn = self._turns.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        self._slots.release()
+
+        with self._lock:
+            stale = turn.epoch != self._epoch
+        if stale:
+            turn.audio.cancel()
+            return None
+        if turn.context != discussion_context(self.app.discussion_log, self.app.last_speaker_idx):
+            logger.debug("Prefetched turn %d is out of context, regenerating", turn.round_num)
+            turn.audio.cancel()
+            self._rewind(round_num)
+            return None
+        return turn
+
+    def _rewind(self, round_num: int):
+        with self._lock:
+            self._epoch += 1
+            self._planned = list(self.app.discussion_log[-2:])
+            self._planned_last = self.app.last_speaker_idx
+            self._round = round_num
+        self._drain()
+
+    def _drain(self):
+        while True:
+            try:
+                turn = self._turns.get_nowait()
+            except queue.Empty:
+                return
+            turn.audio.cancel()
+            self._slots.release()
+
+    def _text_stage(self):
+        """テキスト生成（生成できたらすぐ音声合成に回す）"""
+        while self._running:
+            if not self._slots.acquire(timeout=0.5):
+                continue
+
+            with self._lock:
+                epoch, round_num = self._epoch, self._round
+                context = discussion_context(self._planned, self._planned_last)
+            speaker_idx = round_num % 5
+            if speaker_idx == context[0]:
+                speaker_idx = (speaker_idx + 1) % 5
+            char = self.app.characters[speaker_idx]
+            recent = [{"speaker": name, "text": text} for name, text in context[1]]
+
+            try:
+                text = get_groq_response(
+                    self.app._create_discuss_prompt(round_num, recent),
+                    self.app._create_character_prompt(char),
+                    max_tokens=150,
+                ).strip()
+            except Exception as e:
+                logger.debug("Text error in round %d: %s", round_num, e)
+                self._slots.release()
+                time.sleep(TEXT_RETRY_SECONDS)
+                continue
+
+            with self._lock:
+                current = epoch == self._epoch and self._running
+                if current:
+                    self._planned = self._planned[-1:] + [
+                        {"speaker": char["name"], "role": char["role"], "text": text}
+                    ]
+                    self._planned_last = speaker_idx
+                    self._round += 1
+            if not current:
+                self._slots.release()  # 生成中に巻き戻された
+                continue
+
+            try:
+                audio = self._tts.submit(speak_voicevox, text, char["speaker_id"])
+            except RuntimeError:
+                return  # stop() 済み
+            self._turns.put(Turn(epoch, round_num, speaker_idx, context, text, audio))
+
+
 class GDSimulatorApp:
     """グループディスカッション シミュレーター"""
 
@@ -177,6 +325,8 @@ class GDSimulatorApp:
         self.mouth_open = False
         self.is_running = False
         self.is_speaking = False
+        self.lipsync = None  # 再生中の音声の口の開き
+        self.lipsync_start = 0.0
         self.topic = ""
         self.gd_time_minutes = 15
         self.discussion_log = []
@@ -186,13 +336,17 @@ class GDSimulatorApp:
 
         self.message_queue = queue.Queue()
 
+        # キュー処理・口パク・タイマーは一つのフレームループで回す（描画は1フレーム1回まで）
+        self.clock = FrameClock(self.root, fps=FRAME_RATE, render=self._render)
+
         self._setup_ui()
         self._load_images()
         self._check_voicevox()
 
-        self.root.after(16, self._process_queue)
-        self.root.after(80, self._animate_mouth)
-        self.root.after(1000, self._update_timer)
+        self.clock.every(self._process_queue)
+        self.clock.every(self._animate_mouth)
+        self.clock.every(self._update_timer, interval=1.0)
+        self.clock.start()
 
     def _ensure_assets(self):
         """画像アセット準備"""
@@ -258,16 +412,26 @@ class GDSimulatorApp:
         img.save(os.path.join(self.assets_dir, f"char{char_idx}_{mouth_state}.png"))
 
     def _load_images(self):
-        """画像をロード"""
+        """画像をロード（縮小済みの画像をキャッシュから別スレッドで読み込む）"""
         max_size = 150
+        paths = {}
         for i in range(len(self.characters)):
             for mouth in ["closed", "open"]:
                 key = f"char{i}_{mouth}"
-                path = os.path.join(self.assets_dir, f"{key}.png")
-                if os.path.exists(path):
-                    img = Image.open(path)
-                    img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-                    self.images[key] = ImageTk.PhotoImage(img)
+                paths[key] = os.path.join(self.assets_dir, f"{key}.png")
+        future = image_loader.load_async(paths, size=(max_size, max_size))
+        future.add_done_callback(lambda f: self.message_queue.put({"action": "images", "future": f}))
+
+    def _set_images(self, future):
+        """読み込んだ画像をTk用に変換（Tkのスレッドで呼ぶ）"""
+        try:
+            loaded = future.result()
+        except OSError as e:
+            print(f"画像の読み込みに失敗しました: {e}")
+            return
+        self.images = {key: ImageTk.PhotoImage(img) for key, img in loaded.items()}
+        self.char_states = [None] * len(self.char_items)  # 画像を設定し直す
+        self.clock.mark_dirty("characters")
 
     def _check_voicevox(self):
         self.voicevox_available = check_voicevox()
@@ -399,32 +563,25 @@ class GDSimulatorApp:
                                   command=self._stop_gd, state=tk.DISABLED, width=12)
         self.stop_btn.pack(side=tk.LEFT, padx=5)
 
-        self._draw_characters()
-
-    def _draw_characters(self):
-        """キャラクター描画"""
-        self.char_canvas.delete("all")
+        self._build_characters()
 
+    def _build_characters(self):
+        """キャラクターのキャンバスアイテムを作成（起動時に一度だけ）"""
         # 5人を配置
         positions = [
             (80, 200), (240, 100), (400, 200), (560, 100), (720, 200)
         ]
 
+        self.char_items = []
         for i, (x, y) in enumerate(positions):
             char = self.characters[i]
-
-            # 背景円
-            is_speaking = (self.current_speaker_idx == i)
-            outline_color = '#FFFF00' if is_speaking else char["color"]
-            outline_width = 4 if is_speaking else 2
-            self.char_canvas.create_oval(x-70, y-70, x+70, y+70,
-                                         outline=outline_color, width=outline_width, fill='#3d3d6a')
-
-            # キャラ画像
-            mouth = "open" if (is_speaking and self.mouth_open) else "closed"
-            key = f"char{i}_{mouth}"
-            if key in self.images:
-                self.char_canvas.create_image(x, y, image=self.images[key])
+            items = {
+                # 背景円
+                "oval": self.char_canvas.create_oval(x-70, y-70, x+70, y+70,
+                                                     outline=char["color"], width=2, fill='#3d3d6a'),
+                # キャラ画像（画像は_draw_charactersで設定）
+                "image": self.char_canvas.create_image(x, y),
+            }
 
             # 名前と役職
             self.char_canvas.create_text(x, y + 85, text=char["name"],
@@ -433,16 +590,47 @@ class GDSimulatorApp:
                                         font=("Helvetica", 10), fill=char["color"])
 
             # 総合スコア表示
-            total = get_total_score(char["stats"])
-            self.char_canvas.create_text(x, y + 118, text=f"総合:{total}",
-                                        font=("Helvetica", 9), fill='#aaaaaa')
+            items["score"] = self.char_canvas.create_text(x, y + 118, font=("Helvetica", 9), fill='#aaaaaa')
+            self.char_items.append(items)
 
-    def _animate_mouth(self):
-        """口パクアニメーション"""
-        if self.is_speaking:
-            self.mouth_open = not self.mouth_open
+        # 各参加者の表示中の状態（変わった人だけ更新する）
+        self.char_states = [None] * len(self.char_items)
+        self._draw_scores()
+
+    def _draw_characters(self):
+        """話者の枠と口を更新（表示が変わった参加者だけ）"""
+        for i, items in enumerate(self.char_items):
+            is_speaking = (self.current_speaker_idx == i)
+            mouth = "open" if (is_speaking and self.mouth_open) else "closed"
+            state = (is_speaking, mouth)
+            if state == self.char_states[i]:
+                continue
+            self.char_states[i] = state
+
+            outline_color = '#FFFF00' if is_speaking else self.characters[i]["color"]
+            outline_width = 4 if is_speaking else 2
+            self.char_canvas.itemconfig(items["oval"], outline=outline_color, width=outline_width)
+            self.char_canvas.itemconfig(items["image"], image=self.images.get(f"char{i}_{mouth}", ''))
+
+    def _draw_scores(self):
+        """総合スコアを更新"""
+        for char, items in zip(self.characters, self.char_items):
+            self.char_canvas.itemconfig(items["score"], text=f"総合:{get_total_score(char['stats'])}")
+
+    def _render(self, dirty):
+        """変更のあった部分を再描画（FrameClockから1フレームに1回呼ばれる）"""
+        if "characters" in dirty:
             self._draw_characters()
-        self.root.after(80, self._animate_mouth)
+        if "scores" in dirty:
+            self._draw_scores()
+
+    def _animate_mouth(self):
+        """口パクアニメーション（音量から求めた口の開きに合わせる）"""
+        if self.is_speaking and self.lipsync is not None:
+            mouth_open = self.lipsync.is_open(time.monotonic() - self.lipsync_start)
+            if mouth_open != self.mouth_open:
+                self.mouth_open = mouth_open
+                self.clock.mark_dirty("characters")
 
     def _update_timer(self):
         """タイマー更新"""
@@ -461,7 +649,6 @@ class GDSimulatorApp:
                 color = '#00FF00'  # 緑
 
             self.timer_label.config(text=f"⏱ {mins:02d}:{secs:02d}", fg=color)
-        self.root.after(1000, self._update_timer)
 
     def _get_remaining_time_str(self) -> str:
         """残り時間の文字列を取得"""
@@ -478,14 +665,18 @@ class GDSimulatorApp:
                 msg = self.message_queue.get_nowait()
                 action = msg.get("action")
 
-                if action == "speaker":
+                if action == "images":
+                    self._set_images(msg["future"])
+                elif action == "speaker":
                     self.current_speaker_idx = msg["idx"]
-                    self._draw_characters()
+                    self.clock.mark_dirty("characters")
                 elif action == "speaking":
                     self.is_speaking = msg["value"]
+                    self.lipsync = msg.get("lipsync")
+                    self.lipsync_start = msg.get("start", 0.0)
                     if not self.is_speaking:
                         self.mouth_open = False
-                        self._draw_characters()
+                        self.clock.mark_dirty("characters")
                 elif action == "subtitle":
                     speaker_name = msg.get("speaker", "")
                     text = msg.get("text", "")
@@ -502,13 +693,11 @@ class GDSimulatorApp:
                     self.start_btn.config(state=tk.NORMAL)
                     self.stop_btn.config(state=tk.DISABLED)
                     self.current_speaker_idx = None
-                    self._draw_characters()
+                    self.clock.mark_dirty("characters")
 
         except queue.Empty:
             pass
 
-        self.root.after(16, self._process_queue)
-
     def _apply_stat_settings(self):
         """設定を適用"""
         for i, stat_dict in enumerate(self.stat_vars):
@@ -541,13 +730,14 @@ class GDSimulatorApp:
         self.start_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.NORMAL)
 
-        self._draw_characters()
+        self.clock.mark_dirty("characters", "scores")
 
         thread = threading.Thread(target=self._gd_loop, daemon=True)
         thread.start()
 
     def _stop_gd(self):
         self.is_running = False
+        player.stop()
         self.stop_btn.config(state=tk.DISABLED)
 
     def _create_character_prompt(self, char: dict) -> str:
@@ -578,18 +768,19 @@ class GDSimulatorApp:
 - 「えーと」「あの」など自然な言葉を入れる
 - 基本的に直接自分の意見を言う（「〜を踏まえて」「皆さんの意見を〜」は毎回使わない）"""
 
-    def _create_discuss_prompt(self, round_num: int) -> str:
-        """議論プロンプトを生成（簡潔版）"""
+    def _create_discuss_prompt(self, round_num: int, recent: list = None) -> str:
+        """議論プロンプトを生成（簡潔版、recentを渡せばそれを直前の発言とする）"""
         if round_num == 0:
             return f"「{self.topic}」について意見を1文で。"
         else:
             # 直前の2発言だけ
-            recent = self.discussion_log[-2:] if len(self.discussion_log) >= 2 else self.discussion_log
+            if recent is None:
+                recent = self.discussion_log[-2:]
             recent_text = " / ".join([f"{d['speaker']}:{d['text'][:30]}" for d in recent])
             return f"お題:{self.topic}\n直前:{recent_text}\n→あなたの意見を1文で。"
 
-    def _speak(self, char_idx: int, text: str, wav_path: str = None):
-        """発言処理（wav_pathが渡されれば音声生成をスキップ）"""
+    def _speak(self, char_idx: int, text: str, audio: bytes = None):
+        """発言処理（audioが渡されれば音声生成をスキップ）"""
         char = self.characters[char_idx]
         self.discussion_log.append({"speaker": char["name"], "role": char["role"], "text": text})
         self.last_speaker_idx = char_idx
@@ -598,19 +789,24 @@ class GDSimulatorApp:
         self.message_queue.put({"action": "subtitle", "speaker": char["name"], "text": text})
 
         # 音声生成（先読みされていなければ）
-        if wav_path is None:
-            wav_path = speak_voicevox(text, char["speaker_id"])
+        if audio is None:
+            audio = speak_voicevox(text, char["speaker_id"])
 
-        if wav_path:
-            self.message_queue.put({"action": "speaking", "value": True})
-            try:
-                proc = subprocess.Popen(['afplay', wav_path],
-                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                proc.wait()
-            finally:
-                self.message_queue.put({"action": "speaking", "value": False})
-                if os.path.exists(wav_path):
-                    os.remove(wav_path)
+        if audio:
+            self._play(audio)
+
+    def _play(self, audio: bytes):
+        """WAVデータを再生（口パク付き、終わるまで待つ）"""
+        try:
+            self.message_queue.put({
+                "action": "speaking", "value": True,
+                "lipsync": LipSync.from_wav(audio), "start": time.monotonic(),
+            })
+            player.play(audio)
+        except AudioError as e:
+            print(f"Audio error: {e}")
+        finally:
+            self.message_queue.put({"action": "speaking", "value": False})
 
     def _gd_loop(self):
         """GDメインループ"""
@@ -663,111 +859,50 @@ class GDSimulatorApp:
         # === 議論 ===
         self.message_queue.put({"action": "phase", "value": "議論"})
 
-        from concurrent.futures import ThreadPoolExecutor, Future
-
         round_num = 0
-        executor = ThreadPoolExecutor(max_workers=3)
+        pipeline = TurnPipeline(self)
+        pipeline.start()
 
-        # 次の発言者の準備用
-        next_text_future: Future = None
-        next_wav_future: Future = None
-        next_speaker_idx = None
-
-        while self.is_running:
-            # 残り時間チェック
-            elapsed = time.time() - self.start_time
-            remaining = self.gd_time_minutes * 60 - elapsed
-            print(f"[DEBUG] Round {round_num}, remaining: {remaining:.0f}s")
-
-            # 残り10%でまとめに移行
-            if remaining < self.gd_time_minutes * 60 * 0.10:
-                # タイムキーパーがアナウンス
-                msg = f"あ、{self._get_remaining_time_str()}です、まとめに入りましょう。"
-                wav = speak_voicevox(msg, self.characters[timekeeper_idx]["speaker_id"])
-                self._speak(timekeeper_idx, msg, wav)
-                break
-
-            # 発言者を決定
-            speaker_idx = round_num % 5
-            if speaker_idx == self.last_speaker_idx:
-                speaker_idx = (speaker_idx + 1) % 5
-
-            # 先読み結果があれば使う
-            try:
-                if next_text_future and next_speaker_idx == speaker_idx:
-                    response = next_text_future.result(timeout=30)
-                    wav_path = next_wav_future.result(timeout=60)
-                else:
-                    # 初回または先読みが使えない場合
-                    discuss_prompt = self._create_discuss_prompt(round_num)
-                    system = self._create_character_prompt(self.characters[speaker_idx])
-                    response = get_groq_response(discuss_prompt, system, max_tokens=150).strip()
-                    wav_path = speak_voicevox(response, self.characters[speaker_idx]["speaker_id"])
-            except Exception as e:
-                print(f"[DEBUG] Error in round {round_num}: {e}")
-                # エラー時は新規生成を試みる
-                discuss_prompt = self._create_discuss_prompt(round_num)
-                system = self._create_character_prompt(self.characters[speaker_idx])
-                response = get_groq_response(discuss_prompt, system, max_tokens=150).strip()
-                wav_path = speak_voicevox(response, self.characters[speaker_idx]["speaker_id"])
-
-            # ログに追加
-            speaker_name = self.characters[speaker_idx]["name"]
-            self.discussion_log.append({
-                "speaker": speaker_name,
-                "role": self.characters[speaker_idx]["role"],
-                "text": response
-            })
-            self.last_speaker_idx = speaker_idx
-
-            # 次の発言者を決定
-            next_speaker_idx = (speaker_idx + 1) % 5
-            if next_speaker_idx == self.last_speaker_idx:
-                next_speaker_idx = (next_speaker_idx + 1) % 5
-
-            # テキスト生成が終わった瞬間に次のテキスト生成を開始
-            try:
-                next_prompt = self._create_discuss_prompt(round_num + 1)
-                next_system = self._create_character_prompt(self.characters[next_speaker_idx])
-                next_text_future = executor.submit(
-                    lambda p=next_prompt, s=next_system: get_groq_response(p, s, max_tokens=150).strip()
-                )
-
-                # 音声生成も並列で開始（テキスト生成完了後）
-                def generate_next_wav(text_future, spk_id):
-                    try:
-                        text = text_future.result(timeout=30)
-                        return speak_voicevox(text, spk_id)
-                    except Exception as e:
-                        print(f"[DEBUG] Prefetch wav error: {e}")
-                        return None
-
-                next_wav_future = executor.submit(
-                    generate_next_wav, next_text_future, self.characters[next_speaker_idx]["speaker_id"]
-                )
-            except Exception as e:
-                print(f"[DEBUG] Prefetch submit error: {e}")
-                next_text_future = None
-                next_wav_future = None
+        try:
+            while self.is_running:
+                # 残り時間チェック
+                elapsed = time.time() - self.start_time
+                remaining = self.gd_time_minutes * 60 - elapsed
+
+                # 残り10%でまとめに移行
+                if remaining < self.gd_time_minutes * 60 * 0.10:
+                    pipeline.stop()  # 先読み中の発言は使わない
+                    # タイムキーパーがアナウンス
+                    msg = f"あ、{self._get_remaining_time_str()}です、まとめに入りましょう。"
+                    self._speak(timekeeper_idx, msg)
+                    break
+
+                # 先読みされた発言を待つ（準備できるまでは残り時間のチェックを続ける）
+                turn = pipeline.next_turn(round_num)
+                if turn is None:
+                    continue
+                print(f"[DEBUG] Round {round_num}, remaining: {remaining:.0f}s")
+                try:
+                    audio = turn.audio.result()
+                except Exception as e:
+                    print(f"[DEBUG] Audio error in round {round_num}: {e}")
+                    audio = None
 
-            # 現在の発言を再生（この間に次の準備が進む）
-            self.message_queue.put({"action": "speaker", "idx": speaker_idx})
-            self.message_queue.put({"action": "subtitle", "speaker": speaker_name, "text": response})
+                # ログに追加
+                char = self.characters[turn.speaker_idx]
+                self.discussion_log.append({"speaker": char["name"], "role": char["role"], "text": turn.text})
+                self.last_speaker_idx = turn.speaker_idx
 
-            if wav_path:
-                self.message_queue.put({"action": "speaking", "value": True})
-                try:
-                    proc = subprocess.Popen(['afplay', wav_path],
-                                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    proc.wait()
-                finally:
-                    self.message_queue.put({"action": "speaking", "value": False})
-                    if os.path.exists(wav_path):
-                        os.remove(wav_path)
+                # 再生（この間に後続の発言の準備が進む）
+                self.message_queue.put({"action": "speaker", "idx": turn.speaker_idx})
+                self.message_queue.put({"action": "subtitle", "speaker": char["name"], "text": turn.text})
 
-            round_num += 1
+                if audio:
+                    self._play(audio)
 
-        executor.shutdown(wait=False)
+                round_num += 1
+        finally:
+            pipeline.stop()
 
         if not self.is_running:
             self.message_queue.put({"action": "done"})
@@ -861,16 +996,12 @@ class GDSimulatorApp:
 
         self.message_queue.put({"action": "subtitle", "speaker": "評価AI", "text": result})
 
-        # 音声で発表
-        wav_path = speak_voicevox(result, JUDGE_SPEAKER_ID)
-        if wav_path:
-            try:
-                proc = subprocess.Popen(['afplay', wav_path],
-                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                proc.wait()
-            finally:
-                if os.path.exists(wav_path):
-                    os.remove(wav_path)
+        # 音声で発表（1位から順に、合成できた文から読み上げる）
+        try:
+            for audio in speak_voicevox_sentences(result, JUDGE_SPEAKER_ID):
+                player.play(audio)
+        except (TTSError, AudioError) as e:
+            print(f"VOICEVOX error: {e}")
 
     def run(self):
         self.root.mainloop()
@@ -0,0 +1,151 @@
+"""Background debate jobs (server-side full debates)"""
+
+import asyncio
+import logging
+import os
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Awaitable, Callable, Literal, Optional
+
+from debate_core import DebateSession
+
+logger = logging.getLogger("api_server")
+
+JobStatus = Literal["queued", "running", "completed", "failed"]
+
+
+@dataclass
+class DebateJob:
+    """A debate scheduled to run entirely on the server"""
+    session: DebateSession
+    turns: int
+    job_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: JobStatus = "queued"
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    events: list[dict] = field(default_factory=list)
+    verdict: Optional[dict] = None
+    error: Optional[str] = None
+    _changed: asyncio.Condition = field(default_factory=asyncio.Condition, repr=False)
+    _task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    async def add_event(self, event: dict) -> None:
+        """Record an event and wake up feed listeners"""
+        async with self._changed:
+            self.events.append(event)
+            self._changed.notify_all()
+
+    async def iter_events(self, start: int = 0) -> AsyncIterator[dict]:
+        """Yield events from index `start`, waiting for new ones until the job finishes"""
+        index = start
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: len(self.events) > index or self.finished)
+                new_events = self.events[index:]
+                finished = self.finished
+            for event in new_events:
+                yield event
+            index += len(new_events)
+            if finished and index >= len(self.events):
+                return
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "session_id": self.session.session_id,
+            "topic": self.session.topic,
+            "turns": self.turns,
+            "turns_done": self.session.turn_count,
+            "created_at": self.created_at.isoformat() + "Z",
+            "finished_at": self.finished_at.isoformat() + "Z" if self.finished_at else None,
+            "history": self.session.history,
+            "verdict": self.verdict,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """Runs debate jobs in the background with bounded concurrency"""
+
+    def __init__(self, max_workers: int = 2, max_active_jobs: int = 20, retention_minutes: int = 60):
+        self._jobs: dict[str, DebateJob] = {}
+        self._max_workers = max_workers
+        self._max_active_jobs = max_active_jobs
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._retention = timedelta(minutes=retention_minutes)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Create the semaphore lazily inside the running event loop"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_workers)
+        return self._semaphore
+
+    def submit(
+        self,
+        job: DebateJob,
+        run: Callable[[DebateJob], Awaitable[dict]],
+    ) -> DebateJob:
+        """Schedule a job
+
+        Args:
+            job: The job to run
+            run: Coroutine function executing the debate; returns the verdict dict
+
+        Returns:
+            The scheduled job
+        """
+        self._cleanup_finished()
+        self._jobs[job.job_id] = job
+        job._task = asyncio.create_task(self._run(job, run))
+        return job
+
+    async def _run(self, job: DebateJob, run: Callable[[DebateJob], Awaitable[dict]]) -> None:
+        async with self._get_semaphore():
+            job.status = "running"
+            await job.add_event({"type": "status", "status": "running"})
+            try:
+                job.verdict = await run(job)
+                job.status = "completed"
+            except Exception as e:
+                logger.error(str({"job_id": job.job_id, "error": str(e)}))
+                job.error = str(e)
+                job.status = "failed"
+            job.finished_at = datetime.utcnow()
+            await job.add_event({"type": "status", "status": job.status, "error": job.error})
+
+    def get_job(self, job_id: str) -> Optional[DebateJob]:
+        """Get a job by ID"""
+        return self._jobs.get(job_id)
+
+    def _cleanup_finished(self) -> None:
+        """Forget finished jobs older than the retention period"""
+        now = datetime.utcnow()
+        expired = [
+            jid for jid, job in self._jobs.items()
+            if job.finished and now - job.finished_at > self._retention
+        ]
+        for jid in expired:
+            del self._jobs[jid]
+
+    @property
+    def active_job_count(self) -> int:
+        """Number of queued or running jobs"""
+        return sum(1 for job in self._jobs.values() if not job.finished)
+
+    @property
+    def at_capacity(self) -> bool:
+        """Whether the queue is full and new jobs should be rejected"""
+        return self.active_job_count >= self._max_active_jobs
+
+
+# Global job manager
+job_manager = JobManager(
+    max_workers=int(os.getenv("DEBATE_JOB_WORKERS", "2")),
+    max_active_jobs=int(os.getenv("DEBATE_JOB_MAX_ACTIVE", "20")),
+)
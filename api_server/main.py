@@ -3,15 +3,14 @@
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Request
 
 # Load environment variables
 load_dotenv()
 
 from api_server.middleware import setup_cors, setup_rate_limit, setup_logging, LoggingMiddleware
-from api_server.routes import health_router, debate_router
+from api_server.routes import health_router, debate_router, debate_ws_router, tts_router
+from api_server.static import CachedStaticFiles
 
 # Setup logging
 logger = setup_logging()
@@ -31,23 +30,27 @@ app.add_middleware(LoggingMiddleware)
 # Include routers
 app.include_router(health_router)
 app.include_router(debate_router)
+app.include_router(debate_ws_router)
+app.include_router(tts_router)
 
-# Serve static files (web frontend)
+# Serve static files (web frontend, including the web_build output in web/dist)
 web_dir = Path(__file__).parent.parent / "web"
+web_static = None
 if web_dir.exists():
-    app.mount("/static", StaticFiles(directory=str(web_dir)), name="static")
+    web_static = CachedStaticFiles(directory=str(web_dir))
+    app.mount("/static", web_static, name="static")
 
 # Serve character assets
 assets_dir = Path(__file__).parent.parent / "assets"
 if assets_dir.exists():
-    app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
+    app.mount("/assets", CachedStaticFiles(directory=str(assets_dir)), name="assets")
 
     @app.get("/")
-    async def serve_index():
-        """Serve the main frontend page"""
-        index_path = web_dir / "index.html"
-        if index_path.exists():
-            return FileResponse(str(index_path))
+    async def serve_index(request: Request):
+        """Serve the main frontend page (the built page when web_build has run)"""
+        for index_path in ("dist/index.html", "index.html"):
+            if web_static is not None and (web_dir / index_path).exists():
+                return await web_static.get_response(index_path, request.scope)
         return {"message": "Frontend not found. Access /docs for API documentation."}
 else:
     @app.get("/")
@@ -4,6 +4,9 @@ import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+# Lip sync data of /tts responses, read by the web client
+LIPSYNC_HEADERS = ["X-Visemes", "X-Viseme-Frame-Ms"]
+
 
 def setup_cors(app: FastAPI) -> None:
     """Configure CORS middleware
@@ -22,6 +25,7 @@ def setup_cors(app: FastAPI) -> None:
             allow_credentials=True,
             allow_methods=["GET", "POST", "OPTIONS"],
             allow_headers=["*"],
+            expose_headers=LIPSYNC_HEADERS,
         )
     else:
         # 指定がない場合は全てのオリジンを許可（開発・デモ用）
@@ -31,4 +35,5 @@ def setup_cors(app: FastAPI) -> None:
             allow_credentials=False,  # allow_origins=["*"]の場合はFalseにする必要がある
             allow_methods=["GET", "POST", "OPTIONS"],
             allow_headers=["*"],
+            expose_headers=LIPSYNC_HEADERS,
         )
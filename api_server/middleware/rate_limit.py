@@ -1,7 +1,11 @@
 """Rate limiting configuration"""
 
 import os
+import time
+from typing import Optional
+
 from fastapi import FastAPI, Request
+from limits import parse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -35,3 +39,25 @@ def get_rate_limit_string() -> str:
     """Get the rate limit string from environment"""
     per_minute = os.getenv("RATE_LIMIT_PER_MINUTE", "30")
     return f"{per_minute}/minute"
+
+
+def consume_rate_limit(scope: str, key: str) -> Optional[int]:
+    """Count one request against the shared limiter outside a decorated route
+
+    Used by the WebSocket channel, whose messages the slowapi decorator
+    cannot see. Uses the same storage and limit as the HTTP routes.
+
+    Args:
+        scope: Name of the counter (like the route name for decorated routes)
+        key: Client key, usually the client IP
+
+    Returns:
+        None if allowed, otherwise the seconds until the limit resets
+    """
+    if not limiter.enabled:
+        return None
+    item = parse(get_rate_limit_string())
+    if limiter.limiter.hit(item, scope, key):
+        return None
+    reset_time, _ = limiter.limiter.get_window_stats(item, scope, key)
+    return max(1, int(reset_time - time.time()))
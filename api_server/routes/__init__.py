@@ -2,5 +2,7 @@
 
 from .health import router as health_router
 from .debate import router as debate_router
+from .debate_ws import router as debate_ws_router
+from .tts import router as tts_router
 
-__all__ = ["health_router", "debate_router"]
+__all__ = ["health_router", "debate_router", "debate_ws_router", "tts_router"]
@@ -1,27 +1,33 @@
 """Debate API endpoints"""
 
-from typing import Optional
+import json
+from typing import Iterator, Optional
 from fastapi import APIRouter, HTTPException, Request, Header
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from debate_core import (
     SessionManager,
     Character,
-    TurnResult,
     JudgeResult,
-    Speaker,
     DEFAULT_TOPIC,
+    DebateSession,
+    VerdictFormatError,
+    parse_verdict,
 )
+from debate_core.config import JUDGE_PERSONAS
+from debate_core.ensemble import judge_ensemble
+from debate_core.runner import prepare_turn, commit_turn, run_debate
 from debate_core.prompts import (
-    create_debater_prompt,
-    create_judge_prompt,
-    create_initial_prompt,
-    create_rebuttal_prompt,
+    create_structured_judge_prompt,
+    create_commentary_prompt,
     JUDGE_SYSTEM_PROMPT,
+    STRUCTURED_JUDGE_SYSTEM_PROMPT,
 )
-from debate_core.config import LLM_MAX_TOKENS_DEBATE, LLM_MAX_TOKENS_JUDGE
-from llm_client import GroqClient, RateLimitError, APIKeyError, LLMError
+from debate_core.config import LLM_MAX_TOKENS_DEBATE, LLM_MAX_TOKENS_JUDGE, LLM_MAX_TOKENS_VERDICT
+from llm_client import GroqClient, AsyncGroqClient, RateLimitError, APIKeyError, LLMError
 from api_server.middleware.rate_limit import limiter, get_rate_limit_string
+from api_server.jobs import DebateJob, job_manager
 
 router = APIRouter(prefix="/debate", tags=["debate"])
 
@@ -44,6 +50,32 @@ def get_llm_client(api_key: Optional[str] = None) -> GroqClient:
         )
 
 
+def get_async_llm_client(api_key: Optional[str] = None) -> AsyncGroqClient:
+    """Get async LLM client with the provided API key
+
+    Args:
+        api_key: API key from request header (takes priority) or env var
+    """
+    try:
+        return AsyncGroqClient(api_key=api_key)
+    except APIKeyError:
+        raise HTTPException(
+            status_code=401,
+            detail="APIキーが必要です。Groq APIキーを入力してください。"
+        )
+
+
+def _to_http_error(e: Exception) -> HTTPException:
+    """Convert an LLM or verdict error to an HTTPException"""
+    if isinstance(e, RateLimitError):
+        return HTTPException(
+            status_code=429,
+            detail=f"Rate limit exceeded. Retry after {e.retry_after} seconds.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    return HTTPException(status_code=500, detail=str(e))
+
+
 # Request/Response models
 class CharacterInput(BaseModel):
     """Character configuration input"""
@@ -67,6 +99,20 @@ class SessionRequest(BaseModel):
     session_id: str
 
 
+class JudgeRequest(BaseModel):
+    """Request for judge evaluation"""
+    session_id: str
+    ensemble_size: Optional[int] = Field(default=None, ge=2, le=len(JUDGE_PERSONAS))
+    quorum: Optional[int] = Field(default=None, ge=1, le=len(JUDGE_PERSONAS))
+
+
+class RunRequest(StartRequest):
+    """Request to run a full debate in the background"""
+    turns: int = Field(default=6, ge=2, le=20)
+    ensemble_size: Optional[int] = Field(default=None, ge=2, le=len(JUDGE_PERSONAS))
+    quorum: Optional[int] = Field(default=None, ge=1, le=len(JUDGE_PERSONAS))
+
+
 class StartResponse(BaseModel):
     """Response when starting a debate"""
     session_id: str
@@ -90,6 +136,24 @@ class JudgeResponse(BaseModel):
     turn_count: int
 
 
+def _create_session(body: StartRequest) -> DebateSession:
+    """Create a session from a start request"""
+    # Convert input to Character objects
+    pro_char = None
+    con_char = None
+
+    if body.pro_character:
+        pro_char = Character(**body.pro_character.model_dump())
+    if body.con_character:
+        con_char = Character(**body.con_character.model_dump())
+
+    return session_manager.create_session(
+        topic=body.topic,
+        pro_character=pro_char,
+        con_character=con_char,
+    )
+
+
 @router.post("/start", response_model=StartResponse, status_code=201)
 @limiter.limit(get_rate_limit_string())
 async def start_debate(
@@ -105,20 +169,7 @@ async def start_debate(
     # Validate API key is available
     get_llm_client(x_api_key)
 
-    # Convert input to Character objects
-    pro_char = None
-    con_char = None
-
-    if body.pro_character:
-        pro_char = Character(**body.pro_character.model_dump())
-    if body.con_character:
-        con_char = Character(**body.con_character.model_dump())
-
-    session = session_manager.create_session(
-        topic=body.topic,
-        pro_character=pro_char,
-        con_character=con_char,
-    )
+    session = _create_session(body)
 
     return StartResponse(**session.to_dict())
 
@@ -139,71 +190,27 @@ async def debate_turn(
         raise HTTPException(status_code=404, detail="Session not found or expired")
 
     client = get_llm_client(x_api_key)
-
-    # Determine current speaker
-    current_role = session.get_next_speaker()
-    current_char = session.pro if current_role == "pro" else session.con
-    opponent_char = session.con if current_role == "pro" else session.pro
-
-    # Create prompts
-    system_prompt = create_debater_prompt(current_role, session.topic, current_char)
-
-    if session.turn_count == 0:
-        # First turn
-        user_prompt = create_initial_prompt(session.topic)
-    else:
-        # Rebuttal to previous statement
-        last_statement = session.history[-1]
-        user_prompt = create_rebuttal_prompt(opponent_char.name, last_statement)
+    turn = prepare_turn(session)
 
     # Get response from LLM
     try:
         text = client.get_response(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
+            prompt=turn.user_prompt,
+            system_prompt=turn.system_prompt,
             max_tokens=LLM_MAX_TOKENS_DEBATE,
         ).strip()
-    except RateLimitError as e:
-        raise HTTPException(
-            status_code=429,
-            detail=f"Rate limit exceeded. Retry after {e.retry_after} seconds.",
-            headers={"Retry-After": str(e.retry_after)},
-        )
     except LLMError as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _to_http_error(e)
 
     # Update session
-    session.add_turn(text, current_role)
-
-    # Build response
-    next_speaker = "con" if current_role == "pro" else "pro"
-
-    result = TurnResult(
-        turn_number=session.turn_count,
-        speaker=Speaker(
-            role=current_role,
-            name=current_char.name,
-            color=current_char.color,
-        ),
-        text=text,
-        next_speaker=next_speaker,
-    )
+    result = commit_turn(session, turn.role, text)
 
     return TurnResponse(**result.to_dict())
 
 
-@router.post("/judge", response_model=JudgeResponse)
-@limiter.limit(get_rate_limit_string())
-async def judge_debate(
-    request: Request,
-    body: SessionRequest,
-    x_api_key: Optional[str] = Header(None, alias="X-API-Key"),
-):
-    """Get judge evaluation for the debate
-
-    Evaluates the debate and returns the verdict with winner.
-    """
-    session = session_manager.get_session(body.session_id)
+def _get_judgeable_session(session_id: str) -> DebateSession:
+    """Look up a session and check that it has enough turns to judge"""
+    session = session_manager.get_session(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found or expired")
 
@@ -212,53 +219,235 @@ async def judge_debate(
             status_code=400,
             detail="At least 2 turns required for judging"
         )
+    return session
 
-    client = get_llm_client(x_api_key)
 
-    # Create judge prompt
-    judge_prompt = create_judge_prompt(
+def _request_verdict(
+    client: GroqClient,
+    session: DebateSession,
+    include_commentary: bool,
+) -> JudgeResult:
+    """Ask the LLM for a JSON verdict and validate it
+
+    Raises:
+        HTTPException: On rate limiting, API errors or a malformed verdict
+    """
+    judge_prompt = create_structured_judge_prompt(
         topic=session.topic,
         history=session.history,
         pro_name=session.pro.name,
         con_name=session.con.name,
+        include_commentary=include_commentary,
     )
 
-    # Get judge response
     try:
-        judge_text = client.get_response(
+        data = client.get_json_response(
             prompt=judge_prompt,
-            system_prompt=JUDGE_SYSTEM_PROMPT,
-            max_tokens=LLM_MAX_TOKENS_JUDGE,
-        ).strip()
-    except RateLimitError as e:
-        raise HTTPException(
-            status_code=429,
-            detail=f"Rate limit exceeded. Retry after {e.retry_after} seconds.",
-            headers={"Retry-After": str(e.retry_after)},
+            system_prompt=STRUCTURED_JUDGE_SYSTEM_PROMPT,
+            max_tokens=LLM_MAX_TOKENS_JUDGE if include_commentary else LLM_MAX_TOKENS_VERDICT,
         )
-    except LLMError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-    # Determine winner from text
-    winner = "pro"
-    winner_name = session.pro.name
-    if session.con.name in judge_text and "勝者" in judge_text:
-        # Check if con name appears near "勝者"
-        con_idx = judge_text.find(session.con.name)
-        pro_idx = judge_text.find(session.pro.name)
-        winner_idx = judge_text.find("勝者")
-        if con_idx != -1 and (pro_idx == -1 or abs(con_idx - winner_idx) < abs(pro_idx - winner_idx)):
-            winner = "con"
-            winner_name = session.con.name
-
-    verdict = JudgeResult(
-        winner=winner,
-        winner_name=winner_name,
-        text=judge_text,
+        return parse_verdict(data, session.pro.name, session.con.name)
+    except (LLMError, VerdictFormatError) as e:
+        raise _to_http_error(e)
+
+
+async def _request_ensemble_verdict(
+    body: JudgeRequest,
+    session: DebateSession,
+    api_key: Optional[str],
+) -> JudgeResult:
+    """Score the debate with a judge ensemble (no commentary)
+
+    Raises:
+        HTTPException: On rate limiting, API errors or if every judge failed
+    """
+    if body.quorum is not None and body.quorum > body.ensemble_size:
+        raise HTTPException(status_code=400, detail="quorum must not exceed ensemble_size")
+
+    try:
+        return await judge_ensemble(
+            get_async_llm_client(api_key),
+            topic=session.topic,
+            history=session.history,
+            pro_name=session.pro.name,
+            con_name=session.con.name,
+            personas=JUDGE_PERSONAS[:body.ensemble_size],
+            quorum=body.quorum,
+        )
+    except (LLMError, VerdictFormatError) as e:
+        raise _to_http_error(e)
+
+
+def _create_session_commentary_prompt(session: DebateSession, verdict: JudgeResult) -> str:
+    """Create the spoken commentary prompt for a scored session"""
+    return create_commentary_prompt(
+        topic=session.topic,
+        history=session.history,
+        pro_name=session.pro.name,
+        con_name=session.con.name,
+        verdict=verdict,
     )
 
+
+def _sse_event(event: str, data: dict) -> str:
+    """Format a server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/judge", response_model=JudgeResponse)
+@limiter.limit(get_rate_limit_string())
+async def judge_debate(
+    request: Request,
+    body: JudgeRequest,
+    x_api_key: Optional[str] = Header(None, alias="X-API-Key"),
+):
+    """Get judge evaluation for the debate
+
+    Asks the judge for a JSON verdict (scores per criterion, winner and
+    commentary) in a single call and returns it validated. With
+    `ensemble_size`, several judges score in parallel and the commentary is
+    generated for the aggregated verdict.
+    """
+    session = _get_judgeable_session(body.session_id)
+    client = get_llm_client(x_api_key)
+
+    if body.ensemble_size:
+        verdict = await _request_ensemble_verdict(body, session, x_api_key)
+        try:
+            verdict.text = client.get_response(
+                prompt=_create_session_commentary_prompt(session, verdict),
+                system_prompt=JUDGE_SYSTEM_PROMPT,
+                max_tokens=LLM_MAX_TOKENS_JUDGE,
+            ).strip()
+        except LLMError as e:
+            raise _to_http_error(e)
+    else:
+        verdict = _request_verdict(client, session, include_commentary=True)
+
     return JudgeResponse(
         verdict=verdict.to_dict(),
         history=session.history,
         turn_count=session.turn_count,
     )
+
+
+@router.post("/judge/stream")
+@limiter.limit(get_rate_limit_string())
+async def judge_debate_stream(
+    request: Request,
+    body: JudgeRequest,
+    x_api_key: Optional[str] = Header(None, alias="X-API-Key"),
+):
+    """Stream the judge evaluation as server-sent events
+
+    Events:
+        verdict: Scores and winner, sent as soon as the JSON verdict is ready
+        commentary: Text deltas of the spoken commentary
+        done: Full verdict including the complete commentary text
+        error: Error while streaming the commentary
+    """
+    session = _get_judgeable_session(body.session_id)
+    client = get_llm_client(x_api_key)
+
+    # Scores first (small JSON response), so the UI can render them immediately
+    if body.ensemble_size:
+        verdict = await _request_ensemble_verdict(body, session, x_api_key)
+    else:
+        verdict = _request_verdict(client, session, include_commentary=False)
+
+    commentary_prompt = _create_session_commentary_prompt(session, verdict)
+
+    def event_stream() -> Iterator[str]:
+        yield _sse_event("verdict", verdict.to_dict())
+
+        parts = []
+        try:
+            for delta in client.stream_response(
+                prompt=commentary_prompt,
+                system_prompt=JUDGE_SYSTEM_PROMPT,
+                max_tokens=LLM_MAX_TOKENS_JUDGE,
+            ):
+                parts.append(delta)
+                yield _sse_event("commentary", {"delta": delta})
+        except LLMError as e:
+            yield _sse_event("error", {"detail": str(e)})
+            return
+
+        verdict.text = "".join(parts).strip()
+        yield _sse_event("done", {
+            "verdict": verdict.to_dict(),
+            "history": session.history,
+            "turn_count": session.turn_count,
+        })
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@router.post("/run", status_code=202)
+@limiter.limit(get_rate_limit_string())
+async def run_debate_job(
+    request: Request,
+    body: RunRequest,
+    x_api_key: Optional[str] = Header(None, alias="X-API-Key"),
+):
+    """Run a full debate (N turns plus judging) as a background job
+
+    Returns immediately with the job ID. Progress can be polled with
+    GET /debate/run/{job_id} or followed with GET /debate/run/{job_id}/events.
+    """
+    if body.quorum is not None and (body.ensemble_size is None or body.quorum > body.ensemble_size):
+        raise HTTPException(status_code=400, detail="quorum requires ensemble_size and must not exceed it")
+    if job_manager.at_capacity:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many debate jobs in progress, please retry later",
+            headers={"Retry-After": "30"},
+        )
+
+    client = get_async_llm_client(x_api_key)
+    session = _create_session(body)
+    job = DebateJob(session=session, turns=body.turns)
+
+    async def run(job: DebateJob) -> dict:
+        verdict = await run_debate(
+            client,
+            job.session,
+            turns=job.turns,
+            on_event=job.add_event,
+            ensemble_size=body.ensemble_size,
+            quorum=body.quorum,
+        )
+        return verdict.to_dict()
+
+    job_manager.submit(job, run)
+    return job.to_dict()
+
+
+def _get_job(job_id: str) -> DebateJob:
+    """Look up a job or raise 404"""
+    job = job_manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
+
+
+@router.get("/run/{job_id}")
+async def get_debate_job(job_id: str):
+    """Get the status of a background debate job"""
+    return _get_job(job_id).to_dict()
+
+
+@router.get("/run/{job_id}/events")
+async def stream_debate_job_events(job_id: str, start: int = 0):
+    """Stream the events of a background debate job as server-sent events
+
+    Replays the events from index `start` and then follows the job until it
+    finishes. Events: status, turn, verdict.
+    """
+    job = _get_job(job_id)
+
+    async def event_stream():
+        async for event in job.iter_events(start):
+            yield _sse_event(event["type"], event)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
@@ -0,0 +1,327 @@
+"""WebSocket debate channel
+
+One connection carries a whole debate. The client sends commands and the
+server pushes streamed tokens, committed turns and verdicts.
+
+Client -> server:
+    {"type": "start", "topic": "...", "api_key": "...", "pro_character": {...}, "con_character": {...}}
+    {"type": "turn"}
+    {"type": "pause"} / {"type": "resume"}
+    {"type": "judge", "ensemble_size": 3, "quorum": 2}
+
+Server -> client:
+    {"type": "started", ...session}
+    {"type": "token", "role": "pro", "delta": "..."}
+    {"type": "turn", ...turn}
+    {"type": "verdict", ...verdict}
+    {"type": "commentary", "delta": "..."}
+    {"type": "judged", "verdict": {...}, "history": [...], "turn_count": n}
+    {"type": "error", "detail": "..."}
+
+While not paused, the server generates the next turn in the background as
+soon as the previous one is committed, so a "turn" command is usually
+answered immediately. Pausing cancels that background generation.
+
+Every connection, command and background generation counts against the
+same per-IP limit as the HTTP routes (RATE_LIMIT_PER_MINUTE), and each IP
+may hold at most WS_MAX_CONNECTIONS_PER_IP sockets at once.
+"""
+
+import asyncio
+import logging
+import os
+from collections import Counter
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+
+from debate_core import DebateSession, VerdictFormatError, parse_verdict
+from debate_core.config import JUDGE_PERSONAS, LLM_MAX_TOKENS_DEBATE, LLM_MAX_TOKENS_JUDGE, LLM_MAX_TOKENS_VERDICT
+from debate_core.ensemble import judge_ensemble
+from debate_core.prompts import (
+    create_structured_judge_prompt,
+    create_commentary_prompt,
+    JUDGE_SYSTEM_PROMPT,
+    STRUCTURED_JUDGE_SYSTEM_PROMPT,
+)
+from debate_core.runner import prepare_turn, commit_turn
+from llm_client import AsyncGroqClient, APIKeyError, LLMError, RateLimitError
+from api_server.middleware.rate_limit import consume_rate_limit, get_client_ip
+from api_server.routes.debate import StartRequest, JudgeRequest, _create_session
+
+router = APIRouter(prefix="/debate", tags=["debate"])
+
+logger = logging.getLogger("api_server")
+
+# Open sockets allowed per client IP
+WS_MAX_CONNECTIONS_PER_IP = int(os.getenv("WS_MAX_CONNECTIONS_PER_IP", "2"))
+
+# Limiter counter shared by all sockets of an IP
+RATE_LIMIT_SCOPE = "debate_ws"
+
+# WebSocket close code for policy violations
+WS_POLICY_VIOLATION = 1008
+
+_open_connections: Counter = Counter()
+
+
+class _TurnPrefetch:
+    """Next turn being generated in the background"""
+
+    def __init__(self, client: AsyncGroqClient, session: DebateSession):
+        self.session = session
+        self.base_turn_count = session.turn_count
+        self.turn = prepare_turn(session)
+        self.deltas: list[str] = []
+        self.done = False
+        self.error: Optional[Exception] = None
+        self._changed = asyncio.Condition()
+        self._task = asyncio.create_task(self._run(client))
+
+    async def _run(self, client: AsyncGroqClient) -> None:
+        try:
+            async for delta in client.stream_response(
+                prompt=self.turn.user_prompt,
+                system_prompt=self.turn.system_prompt,
+                max_tokens=LLM_MAX_TOKENS_DEBATE,
+            ):
+                async with self._changed:
+                    self.deltas.append(delta)
+                    self._changed.notify_all()
+        except Exception as e:
+            self.error = e
+        finally:
+            async with self._changed:
+                self.done = True
+                self._changed.notify_all()
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the session moved on since the prefetch was started"""
+        return self.session.turn_count != self.base_turn_count
+
+    async def iter_deltas(self) -> AsyncIterator[str]:
+        """Yield buffered deltas, then follow the generation until it is done"""
+        index = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: len(self.deltas) > index or self.done)
+                new_deltas = self.deltas[index:]
+                done = self.done
+            for delta in new_deltas:
+                yield delta
+            index += len(new_deltas)
+            if done and index >= len(self.deltas):
+                return
+
+    def cancel(self) -> None:
+        self._task.cancel()
+
+
+class DebateChannel:
+    """State of one WebSocket debate connection"""
+
+    def __init__(self, websocket: WebSocket, client_ip: str):
+        self.websocket = websocket
+        self.client_ip = client_ip
+        self.client: Optional[AsyncGroqClient] = None
+        self.session: Optional[DebateSession] = None
+        self.paused = False
+        self.prefetch: Optional[_TurnPrefetch] = None
+
+    async def send(self, message: dict) -> None:
+        await self.websocket.send_json(message)
+
+    async def send_error(self, detail: str) -> None:
+        await self.send({"type": "error", "detail": detail})
+
+    def consume_budget(self) -> Optional[int]:
+        """Count one request for this client (see consume_rate_limit)"""
+        return consume_rate_limit(RATE_LIMIT_SCOPE, self.client_ip)
+
+    def _start_prefetch(self) -> None:
+        """Start generating the next turn unless paused, already running or over budget"""
+        if self.paused or self.session is None:
+            return
+        if self.prefetch is not None and not self.prefetch.is_stale:
+            return
+        self._cancel_prefetch()
+        if self.consume_budget() is not None:
+            return  # the next "turn" command generates it (and is limited itself)
+        self.prefetch = _TurnPrefetch(self.client, self.session)
+
+    def _cancel_prefetch(self) -> None:
+        if self.prefetch is not None:
+            self.prefetch.cancel()
+            self.prefetch = None
+
+    async def handle(self, message: dict) -> None:
+        """Dispatch one client command"""
+        retry_after = self.consume_budget()
+        if retry_after is not None:
+            await self.send_error(f"Rate limit exceeded. Retry after {retry_after} seconds.")
+            return
+
+        command = message.get("type")
+        if command == "start":
+            await self.on_start(message)
+        elif self.session is None:
+            await self.send_error("Send a start command first")
+        elif command == "turn":
+            await self.on_turn()
+        elif command == "pause":
+            self.paused = True
+            self._cancel_prefetch()
+        elif command == "resume":
+            self.paused = False
+            self._start_prefetch()
+        elif command == "judge":
+            await self.on_judge(message)
+        else:
+            await self.send_error(f"Unknown command: {command}")
+
+    async def on_start(self, message: dict) -> None:
+        try:
+            body = StartRequest(**{k: v for k, v in message.items() if k not in ("type", "api_key")})
+        except ValidationError as e:
+            await self.send_error(str(e))
+            return
+
+        try:
+            self.client = AsyncGroqClient(api_key=message.get("api_key"))
+        except APIKeyError:
+            await self.send_error("APIキーが必要です。Groq APIキーを入力してください。")
+            return
+
+        self._cancel_prefetch()
+        self.paused = False
+        self.session = _create_session(body)
+        await self.send({"type": "started", **self.session.to_dict()})
+        self._start_prefetch()
+
+    async def on_turn(self) -> None:
+        if self.prefetch is None or self.prefetch.is_stale:
+            self._cancel_prefetch()
+            self.prefetch = _TurnPrefetch(self.client, self.session)
+        prefetch = self.prefetch
+
+        async for delta in prefetch.iter_deltas():
+            await self.send({"type": "token", "role": prefetch.turn.role, "delta": delta})
+
+        self.prefetch = None
+        if prefetch.error is not None:
+            await self.send_error(_error_detail(prefetch.error))
+            return
+
+        result = commit_turn(self.session, prefetch.turn.role, "".join(prefetch.deltas).strip())
+        await self.send({"type": "turn", **result.to_dict()})
+        self._start_prefetch()
+
+    async def on_judge(self, message: dict) -> None:
+        self._cancel_prefetch()
+        self.paused = True
+
+        try:
+            body = JudgeRequest(session_id=self.session.session_id, **{
+                k: v for k, v in message.items() if k in ("ensemble_size", "quorum")
+            })
+        except ValidationError as e:
+            await self.send_error(str(e))
+            return
+        if body.quorum is not None and (body.ensemble_size is None or body.quorum > body.ensemble_size):
+            await self.send_error("quorum requires ensemble_size and must not exceed it")
+            return
+
+        session = self.session
+        if len(session.history) < 2:
+            await self.send_error("At least 2 turns required for judging")
+            return
+
+        try:
+            if body.ensemble_size:
+                verdict = await judge_ensemble(
+                    self.client,
+                    topic=session.topic,
+                    history=session.history,
+                    pro_name=session.pro.name,
+                    con_name=session.con.name,
+                    personas=JUDGE_PERSONAS[:body.ensemble_size],
+                    quorum=body.quorum,
+                )
+            else:
+                data = await self.client.get_json_response(
+                    prompt=create_structured_judge_prompt(
+                        session.topic, session.history, session.pro.name, session.con.name,
+                        include_commentary=False,
+                    ),
+                    system_prompt=STRUCTURED_JUDGE_SYSTEM_PROMPT,
+                    max_tokens=LLM_MAX_TOKENS_VERDICT,
+                )
+                verdict = parse_verdict(data, session.pro.name, session.con.name)
+            await self.send({"type": "verdict", **verdict.to_dict()})
+
+            parts = []
+            async for delta in self.client.stream_response(
+                prompt=create_commentary_prompt(
+                    session.topic, session.history, session.pro.name, session.con.name, verdict,
+                ),
+                system_prompt=JUDGE_SYSTEM_PROMPT,
+                max_tokens=LLM_MAX_TOKENS_JUDGE,
+            ):
+                parts.append(delta)
+                await self.send({"type": "commentary", "delta": delta})
+        except (LLMError, VerdictFormatError) as e:
+            await self.send_error(_error_detail(e))
+            return
+
+        verdict.text = "".join(parts).strip()
+        await self.send({
+            "type": "judged",
+            "verdict": verdict.to_dict(),
+            "history": session.history,
+            "turn_count": session.turn_count,
+        })
+
+    def close(self) -> None:
+        self._cancel_prefetch()
+
+
+def _error_detail(e: Exception) -> str:
+    """Error message sent to the client"""
+    if isinstance(e, RateLimitError):
+        return f"Rate limit exceeded. Retry after {e.retry_after} seconds."
+    return str(e)
+
+
+@router.websocket("/ws")
+async def debate_websocket(websocket: WebSocket):
+    """Run a debate over a single WebSocket connection (see module docstring)"""
+    client_ip = get_client_ip(websocket)
+    await websocket.accept()
+    if (
+        _open_connections[client_ip] >= WS_MAX_CONNECTIONS_PER_IP
+        or consume_rate_limit(RATE_LIMIT_SCOPE, client_ip) is not None
+    ):
+        await websocket.close(code=WS_POLICY_VIOLATION, reason="Too many connections")
+        return
+
+    _open_connections[client_ip] += 1
+    channel = DebateChannel(websocket, client_ip)
+
+    try:
+        while True:
+            message = await websocket.receive_json()
+            if not isinstance(message, dict):
+                await channel.send_error("Messages must be JSON objects")
+                continue
+            await channel.handle(message)
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(str({"path": "/debate/ws", "error": str(e)}))
+    finally:
+        channel.close()
+        _open_connections[client_ip] -= 1
+        if _open_connections[client_ip] <= 0:
+            del _open_connections[client_ip]
@@ -0,0 +1,74 @@
+"""Server-side speech endpoints (VOICEVOX audio with lip sync data)"""
+
+from typing import Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+from pydantic import BaseModel, Field
+
+from audio_playback import AudioError, LipSync
+from debate_core.config import VOICEVOX_SPEAKERS
+from tts_client import AudioCache, EngineUnavailableError, TTSError, VoicevoxClient
+from api_server.middleware.rate_limit import limiter, get_rate_limit_string
+
+router = APIRouter(prefix="/tts", tags=["tts"])
+
+_client: Optional[VoicevoxClient] = None
+
+
+def get_tts_client() -> VoicevoxClient:
+    """Shared VOICEVOX client (engine URL from VOICEVOX_URL)"""
+    global _client
+    if _client is None:
+        _client = VoicevoxClient(cache=AudioCache())
+    return _client
+
+
+class SpeechRequest(BaseModel):
+    """Request to synthesize one utterance"""
+    text: str = Field(..., min_length=1, max_length=500)
+    role: Literal["pro", "con", "judge"]
+    speed_scale: float = Field(default=1.2, ge=0.5, le=2.0)
+
+
+@router.get("/status")
+async def tts_status():
+    """Whether server-side speech is available
+
+    The web client falls back to the Web Speech API when it is not.
+    """
+    available = await run_in_threadpool(get_tts_client().is_available)
+    return {"available": available}
+
+
+@router.post("")
+@limiter.limit(get_rate_limit_string())
+async def synthesize(request: Request, body: SpeechRequest):
+    """Synthesize speech for a debate role
+
+    Returns the WAV file. Lip sync data computed from its loudness
+    envelope is sent in headers: `X-Visemes` holds one mouth openness
+    digit (0 = closed ... 3 = wide open) per `X-Viseme-Frame-Ms`
+    milliseconds of audio.
+    """
+    client = get_tts_client()
+    try:
+        audio = await run_in_threadpool(
+            client.synthesize, body.text, VOICEVOX_SPEAKERS[body.role], body.speed_scale
+        )
+        lipsync = await run_in_threadpool(LipSync.from_wav, audio)
+    except EngineUnavailableError:
+        raise HTTPException(status_code=503, detail="Speech engine is not available")
+    except (TTSError, AudioError) as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+    return Response(
+        content=audio,
+        media_type="audio/wav",
+        headers={
+            "X-Visemes": lipsync.encode(),
+            "X-Viseme-Frame-Ms": str(round(lipsync.frame_seconds * 1000)),
+            "Cache-Control": "no-store",
+        },
+    )
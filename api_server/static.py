@@ -0,0 +1,113 @@
+"""Static file serving with long-lived caching and precompressed variants"""
+
+import hashlib
+import os
+import re
+from mimetypes import guess_type
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+# Files whose name carries a content hash (written by web_build) never change
+HASHED_NAME = re.compile(r"\.(?P<hash>[0-9a-f]{12})\.[A-Za-z0-9]+$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Precompressed sibling suffixes, preferred first
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_encodings(request_headers: Headers) -> set[str]:
+    """Encodings the client accepts (ignoring q=0 entries)"""
+    accepted = set()
+    for item in request_headers.get("accept-encoding", "").split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                pass
+        if name.strip() and quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with Cache-Control, strong ETags and precompressed files
+
+    - Content-hashed files are sent with `Cache-Control: immutable` for a
+      year; everything else must be revalidated (`no-cache`).
+    - ETags are derived from the file content (the name hash when present),
+      so they are stable across deploys and machines.
+    - If `<file>.br` or `<file>.gz` exists and the client accepts that
+      encoding, the sibling is sent with Content-Encoding instead.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._digests: dict[tuple[str, int, int], str] = {}
+
+    def _content_digest(self, full_path: str, stat_result: os.stat_result) -> str:
+        """Content hash of a file, cached by path, mtime and size"""
+        match = HASHED_NAME.search(os.path.basename(full_path))
+        if match:
+            return match.group("hash")
+
+        key = (full_path, stat_result.st_mtime_ns, stat_result.st_size)
+        digest = self._digests.get(key)
+        if digest is None:
+            with open(full_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()[:16]
+            self._digests[key] = digest
+        return digest
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope,
+        status_code: int = 200,
+    ) -> Response:
+        full_path = str(full_path)
+        request_headers = Headers(scope=scope)
+        media_type = guess_type(full_path)[0] or "application/octet-stream"
+        digest = self._content_digest(full_path, stat_result)
+
+        headers = {
+            "cache-control": (
+                IMMUTABLE_CACHE_CONTROL
+                if HASHED_NAME.search(os.path.basename(full_path))
+                else REVALIDATE_CACHE_CONTROL
+            ),
+            "vary": "Accept-Encoding",
+        }
+
+        serve_path, serve_stat = full_path, stat_result
+        accepted = _accepted_encodings(request_headers)
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+            try:
+                sibling_stat = os.stat(full_path + suffix)
+            except OSError:
+                continue
+            serve_path, serve_stat = full_path + suffix, sibling_stat
+            headers["content-encoding"] = encoding
+            digest = f"{digest}-{encoding}"
+            break
+        headers["etag"] = f'"{digest}"'
+
+        response = FileResponse(
+            serve_path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            stat_result=serve_stat,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
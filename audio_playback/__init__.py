@@ -0,0 +1,43 @@
+"""Audio Playback - In-memory WAV parsing, playback and lip sync for the Tk apps"""
+
+from .exceptions import AudioError, WavFormatError
+from .wav import WavAudio, parse_wav, wav_duration, to_float_frames
+from .backends import (
+    PlaybackBackend,
+    SoundDeviceBackend,
+    AlsaBackend,
+    PulseBackend,
+    AfplayBackend,
+    MixerBackend,
+    NullBackend,
+    FileBackend,
+    create_backend,
+)
+from .mixer import Mixer, get_mixer
+from .lipsync import LipSync, LIPSYNC_FRAME_SECONDS, rms_envelope, mouth_levels
+from .player import AudioPlayer
+
+__all__ = [
+    "AudioError",
+    "WavFormatError",
+    "WavAudio",
+    "parse_wav",
+    "wav_duration",
+    "to_float_frames",
+    "PlaybackBackend",
+    "SoundDeviceBackend",
+    "AlsaBackend",
+    "PulseBackend",
+    "AfplayBackend",
+    "MixerBackend",
+    "NullBackend",
+    "FileBackend",
+    "create_backend",
+    "Mixer",
+    "get_mixer",
+    "LipSync",
+    "LIPSYNC_FRAME_SECONDS",
+    "rms_envelope",
+    "mouth_levels",
+    "AudioPlayer",
+]
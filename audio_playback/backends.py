@@ -0,0 +1,478 @@
+"""Playback backends: PortAudio, ALSA/PulseAudio pipes, an in-process mixer and null/file sinks"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import wave
+from typing import Optional
+
+from .exceptions import AudioError
+from .wav import WavAudio
+
+# PortAudio sample formats by sample width (8-bit WAV is unsigned)
+SAMPLE_FORMATS = {1: "uint8", 2: "int16", 3: "int24", 4: "int32"}
+
+
+def _import_sounddevice():
+    """Lazy import of sounddevice (None when it or the PortAudio library is missing)"""
+    try:
+        import sounddevice
+    except (ImportError, OSError):
+        # OSError: the module is installed but libportaudio is not
+        return None
+    return sounddevice
+
+
+def _has_output_device(sd, device: Optional[str] = None) -> bool:
+    """Whether PortAudio can see an output device (none on headless boxes and in containers)"""
+    try:
+        device = int(device) if device and device.isdigit() else device
+        info = sd.query_devices(device, kind="output")
+    except Exception:
+        # sounddevice raises PortAudioError or ValueError when there is no such device
+        return False
+    return bool(info) and info.get("max_output_channels", 0) > 0
+
+
+class PlaybackBackend:
+    """Audio output used by AudioPlayer
+
+    `play` blocks until the audio has been heard (or `stop` is called from
+    another thread). AudioPlayer serializes calls, so a backend only ever
+    plays one clip at a time.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self._stopped = threading.Event()
+
+    def play(self, wav: WavAudio) -> None:
+        raise NotImplementedError
+
+    def stop(self) -> None:
+        """Cut the current clip off (safe to call from any thread)"""
+        self._stopped.set()
+
+    def close(self) -> None:
+        """Release the output device"""
+        self.stop()
+
+
+class SoundDeviceBackend(PlaybackBackend):
+    """PortAudio output stream kept open between clips
+
+    The stream is only reopened when the sample format changes. Samples
+    are written straight from the WAV buffer in blocks, so `stop()` takes
+    effect within one block.
+    """
+
+    name = "sounddevice"
+
+    def __init__(self, device: Optional[str] = None, blocksize: int = 1024):
+        """Initialize the backend
+
+        Args:
+            device: Output device (sounddevice index or name; default device if None)
+            blocksize: Frames written per block
+        """
+        super().__init__()
+        self._sd = _import_sounddevice()
+        if self._sd is None:
+            raise AudioError("sounddevice (PortAudio) is not available")
+        self.device = int(device) if device and device.isdigit() else device
+        self.blocksize = blocksize
+        self._stream = None
+        self._stream_format: Optional[tuple] = None
+
+    def _get_stream(self, wav: WavAudio):
+        """Return the open stream, reopening it for a new sample format"""
+        stream_format = (wav.sample_rate, wav.channels, wav.sample_width)
+        if self._stream is not None and self._stream_format == stream_format:
+            return self._stream
+
+        self._close_stream()
+        try:
+            stream = self._sd.RawOutputStream(
+                samplerate=wav.sample_rate,
+                channels=wav.channels,
+                dtype=SAMPLE_FORMATS[wav.sample_width],
+                device=self.device,
+                blocksize=self.blocksize,
+            )
+            stream.start()
+        except Exception as e:
+            raise AudioError(f"Could not open audio output: {e}")
+        self._stream, self._stream_format = stream, stream_format
+        return stream
+
+    def play(self, wav: WavAudio) -> None:
+        self._stopped.clear()
+        stream = self._get_stream(wav)
+        block_bytes = self.blocksize * wav.frame_size
+        frames = wav.frames
+        try:
+            for start in range(0, len(frames), block_bytes):
+                if self._stopped.is_set():
+                    self._close_stream()  # drops what is still buffered
+                    return
+                stream.write(frames[start:start + block_bytes])
+        except Exception as e:
+            self._close_stream()
+            raise AudioError(f"Audio output failed: {e}")
+
+        # write() returns once the last block is buffered; wait until it is audible
+        self._stopped.wait(stream.latency)
+
+    def _close_stream(self):
+        if self._stream is not None:
+            try:
+                self._stream.abort()
+                self._stream.close()
+            except Exception:
+                pass  # the device may already be gone
+            self._stream, self._stream_format = None, None
+
+    def close(self) -> None:
+        super().close()
+        self._close_stream()
+
+
+class PipeBackend(PlaybackBackend):
+    """Raw PCM piped into a long-running player process
+
+    One process per sample format is kept alive, so a clip costs a pipe
+    write instead of a process spawn. Subclasses build the command line.
+    """
+
+    # Sample width -> format name understood by the player
+    FORMATS: dict = {}
+
+    def __init__(self, device: Optional[str] = None, latency: float = 0.1, block_seconds: float = 0.05):
+        """Initialize the backend
+
+        Args:
+            device: Output device passed to the player (its default if None)
+            latency: Seconds between writing the last sample and hearing it
+            block_seconds: Audio written per pipe write (bounds stop() latency)
+        """
+        super().__init__()
+        self.device = device
+        self.latency = latency
+        self.block_seconds = block_seconds
+        self._process: Optional[subprocess.Popen] = None
+        self._process_format: Optional[tuple] = None
+
+    def _command(self, wav: WavAudio) -> list:
+        raise NotImplementedError
+
+    def _get_process(self, wav: WavAudio) -> subprocess.Popen:
+        stream_format = (wav.sample_rate, wav.channels, wav.sample_width)
+        if self._process is not None and self._process.poll() is None and self._process_format == stream_format:
+            return self._process
+
+        self._close_process()
+        if wav.sample_width not in self.FORMATS:
+            raise AudioError(f"{self.name} cannot play {wav.sample_width * 8}-bit audio")
+        try:
+            self._process = subprocess.Popen(
+                self._command(wav),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise AudioError(f"Could not start {self.name} player: {e}")
+        self._process_format = stream_format
+        return self._process
+
+    def play(self, wav: WavAudio) -> None:
+        self._stopped.clear()
+        process = self._get_process(wav)
+        started = time.monotonic()
+        block_bytes = max(1, int(wav.sample_rate * self.block_seconds)) * wav.frame_size
+        frames = wav.frames
+        try:
+            # The player reads at playback speed, so writes block once its buffer is full
+            for start in range(0, len(frames), block_bytes):
+                if self._stopped.is_set():
+                    break
+                process.stdin.write(frames[start:start + block_bytes])
+            process.stdin.flush()
+        except OSError as e:
+            self._close_process()
+            if self._stopped.is_set():
+                return  # stop() killed the player mid-write
+            raise AudioError(f"{self.name} player exited: {e}")
+
+        remaining = started + wav.duration + self.latency - time.monotonic()
+        if self._stopped.wait(max(0.0, remaining)):
+            self._close_process()
+
+    def stop(self) -> None:
+        super().stop()
+        process = self._process
+        if process is not None:
+            # A pipe cannot be flushed (and a write may be blocked on it), so
+            # the buffered audio goes with the process
+            process.kill()
+
+    def _close_process(self):
+        if self._process is not None:
+            try:
+                self._process.kill()
+                self._process.wait(timeout=1)
+            except Exception:
+                pass
+            self._process, self._process_format = None, None
+
+    def close(self) -> None:
+        super().close()
+        self._close_process()
+
+
+class AlsaBackend(PipeBackend):
+    """ALSA output through `aplay` (Linux)"""
+
+    name = "alsa"
+    FORMATS = {1: "U8", 2: "S16_LE", 3: "S24_3LE", 4: "S32_LE"}
+
+    def _command(self, wav: WavAudio) -> list:
+        command = [
+            "aplay", "-q", "-t", "raw",
+            "-f", self.FORMATS[wav.sample_width],
+            "-r", str(wav.sample_rate),
+            "-c", str(wav.channels),
+        ]
+        if self.device:
+            command += ["-D", self.device]
+        return command
+
+
+class PulseBackend(PipeBackend):
+    """PulseAudio / PipeWire output through `pacat` (Linux)"""
+
+    name = "pulse"
+    FORMATS = {1: "u8", 2: "s16le", 3: "s24le", 4: "s32le"}
+
+    def _command(self, wav: WavAudio) -> list:
+        command = [
+            "pacat", "--playback", "--raw",
+            f"--format={self.FORMATS[wav.sample_width]}",
+            f"--rate={wav.sample_rate}",
+            f"--channels={wav.channels}",
+            f"--latency-msec={int(self.latency * 1000)}",
+        ]
+        if self.device:
+            command.append(f"--device={self.device}")
+        return command
+
+
+def _write_wav(target, wav: WavAudio) -> None:
+    with wave.open(target, "wb") as out:
+        out.setnchannels(wav.channels)
+        out.setsampwidth(wav.sample_width)
+        out.setframerate(wav.sample_rate)
+        out.writeframes(wav.frames)
+
+
+class AfplayBackend(PlaybackBackend):
+    """macOS `afplay` with a temp file per clip (last resort without PortAudio)"""
+
+    name = "afplay"
+
+    def __init__(self):
+        super().__init__()
+        self._process: Optional[subprocess.Popen] = None
+
+    def play(self, wav: WavAudio) -> None:
+        self._stopped.clear()
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            _write_wav(f, wav)
+        try:
+            self._process = subprocess.Popen(
+                ["afplay", f.name], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            self._process.wait()
+        except OSError as e:
+            raise AudioError(f"Could not start afplay: {e}")
+        finally:
+            self._process = None
+            os.remove(f.name)
+
+    def stop(self) -> None:
+        super().stop()
+        process = self._process
+        if process is not None:
+            process.terminate()
+
+
+class NullBackend(PlaybackBackend):
+    """Discards audio and advances a clock (headless runs and benchmarks)
+
+    Attributes:
+        clock: Seconds of audio "played" so far
+        clips: Number of clips played
+    """
+
+    name = "null"
+
+    def __init__(self, realtime: bool = False):
+        """Initialize the sink
+
+        Args:
+            realtime: Block for each clip's duration, as a real device would.
+                When False, play() returns immediately so a run is bound
+                only by generation and synthesis.
+        """
+        super().__init__()
+        self.realtime = realtime
+        self.clock = 0.0
+        self.clips = 0
+
+    def play(self, wav: WavAudio) -> None:
+        self._stopped.clear()
+        played = wav.duration
+        if self.realtime:
+            started = time.monotonic()
+            if self._stopped.wait(played):
+                played = time.monotonic() - started
+        self.clock += played
+        self.clips += 1
+
+
+class FileBackend(NullBackend):
+    """Appends everything played to one WAV file (headless recording)"""
+
+    name = "file"
+
+    def __init__(self, path: str, realtime: bool = False):
+        """Initialize the sink
+
+        Args:
+            path: Output WAV file (overwritten). Its format is taken from the
+                first clip; later clips must match it.
+            realtime: See NullBackend
+        """
+        super().__init__(realtime=realtime)
+        self.path = path
+        self._file: Optional[wave.Wave_write] = None
+        self._file_format: Optional[tuple] = None
+
+    def play(self, wav: WavAudio) -> None:
+        stream_format = (wav.sample_rate, wav.channels, wav.sample_width)
+        if self._file is None:
+            self._file = wave.open(self.path, "wb")
+            self._file.setnchannels(wav.channels)
+            self._file.setsampwidth(wav.sample_width)
+            self._file.setframerate(wav.sample_rate)
+            self._file_format = stream_format
+        elif stream_format != self._file_format:
+            raise AudioError(f"Clip format {stream_format} does not match {self.path} {self._file_format}")
+        self._file.writeframes(wav.frames)
+        super().play(wav)
+
+    def close(self) -> None:
+        super().close()
+        if self._file is not None:
+            self._file.close()  # patches the header sizes
+            self._file = None
+
+
+class MixerBackend(PlaybackBackend):
+    """Clip playback through the shared in-process Mixer
+
+    Every MixerBackend on the same device feeds one output stream, so
+    several AudioPlayers (speech, effects, BGM) can sound at once without
+    opening the device more than once.
+    """
+
+    name = "mixer"
+
+    def __init__(self, device: Optional[str] = None):
+        super().__init__()
+        from .mixer import get_mixer
+        self.mixer = get_mixer(device)
+        self._voice = None
+
+    def play(self, wav: WavAudio) -> None:
+        self._stopped.clear()
+        self._voice = self.mixer.add(wav)
+        try:
+            self._voice.done.wait()
+        finally:
+            self._voice = None
+        if not self._stopped.is_set():
+            self._stopped.wait(self.mixer.latency)
+
+    def stop(self) -> None:
+        super().stop()
+        voice = self._voice
+        if voice is not None:
+            voice.stop()
+
+
+def _auto_backend(device: Optional[str] = None) -> PlaybackBackend:
+    """Best available output on this machine"""
+    sd = _import_sounddevice()
+    if sd is not None and _has_output_device(sd, device):
+        return SoundDeviceBackend(device)
+    if shutil.which("pacat"):
+        return PulseBackend(device)
+    if shutil.which("aplay"):
+        return AlsaBackend(device)
+    if shutil.which("afplay"):
+        return AfplayBackend()
+    # No audio output at all (e.g. a server): keep the apps' timing intact
+    return NullBackend(realtime=True)
+
+
+def create_backend(spec: Optional[str] = None) -> PlaybackBackend:
+    """Create a backend from a spec string
+
+    Specs are `name` or `name:arg`:
+        auto[:device]         PortAudio (if it has an output device), then pacat, aplay,
+                              afplay, else null:realtime
+        sounddevice[:device]  PortAudio stream (macOS/Linux/Windows)
+        mixer[:device]        Shared in-process mixer on a PortAudio stream
+        pulse[:device]        PulseAudio/PipeWire via pacat
+        alsa[:device]         ALSA via aplay (e.g. alsa:hw:0)
+        afplay                macOS afplay with temp files
+        null[:realtime]       Discard audio; advance a clock
+        file:<path>           Write all audio to one WAV file
+
+    Args:
+        spec: Backend spec. If not provided, reads AUDIO_BACKEND env var (default auto).
+
+    Returns:
+        Backend instance
+
+    Raises:
+        AudioError: If the spec is unknown or the backend is unavailable
+    """
+    spec = spec or os.getenv("AUDIO_BACKEND") or "auto"
+    name, _, arg = spec.partition(":")
+    arg = arg or None
+
+    if name == "auto":
+        return _auto_backend(arg)
+    if name == "sounddevice":
+        return SoundDeviceBackend(arg)
+    if name == "mixer":
+        return MixerBackend(arg)
+    if name == "pulse":
+        return PulseBackend(arg)
+    if name == "alsa":
+        return AlsaBackend(arg)
+    if name == "afplay":
+        return AfplayBackend()
+    if name == "null":
+        return NullBackend(realtime=arg == "realtime")
+    if name == "file":
+        if not arg:
+            raise AudioError("The file backend needs a path (file:<path>)")
+        return FileBackend(arg)
+    raise AudioError(f"Unknown audio backend: {spec}")
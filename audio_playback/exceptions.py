@@ -0,0 +1,11 @@
+"""Exceptions for audio playback"""
+
+
+class AudioError(Exception):
+    """Base exception for audio playback errors"""
+    pass
+
+
+class WavFormatError(AudioError):
+    """Raised when audio data is not a playable PCM WAV"""
+    pass
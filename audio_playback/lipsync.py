@@ -0,0 +1,103 @@
+"""Lip sync from the loudness envelope of a clip"""
+
+from dataclasses import dataclass
+from typing import Union
+
+from .wav import BytesLike, WavAudio, _import_numpy, parse_wav, to_float_frames
+
+# One mouth shape per 40ms (25fps), about one mora of fast speech
+LIPSYNC_FRAME_SECONDS = 0.04
+
+# Mouth openness levels: 0 = closed ... 3 = wide open
+MOUTH_LEVELS = 4
+
+# Frames quieter than this fraction of the clip's loud level keep the mouth closed
+NOISE_GATE = 0.15
+
+
+def rms_envelope(wav: WavAudio, frame_seconds: float = LIPSYNC_FRAME_SECONDS):
+    """RMS loudness of each frame of a clip
+
+    Args:
+        wav: Parsed WAV audio (channels are averaged)
+        frame_seconds: Frame length
+
+    Returns:
+        float32 array with one value per frame (the last frame is zero-padded)
+    """
+    np = _import_numpy()
+    samples = to_float_frames(wav, channels=1)[:, 0]
+    frame_length = max(1, int(round(wav.sample_rate * frame_seconds)))
+    count = -(-len(samples) // frame_length)
+    padded = np.zeros(count * frame_length, dtype=np.float32)
+    padded[:len(samples)] = samples
+    return np.sqrt(np.mean(np.square(padded.reshape(count, frame_length)), axis=1))
+
+
+def mouth_levels(envelope, levels: int = MOUTH_LEVELS, gate: float = NOISE_GATE):
+    """Quantize a loudness envelope into mouth openness levels
+
+    Loudness is measured against the clip's 95th percentile, so quiet and
+    loud voices open the mouth alike. Single closed frames between open
+    ones are filled in, which keeps the mouth from flickering on short
+    consonants.
+
+    Returns:
+        uint8 array of levels in [0, levels - 1]
+    """
+    np = _import_numpy()
+    if len(envelope) == 0:
+        return np.zeros(0, dtype=np.uint8)
+    reference = float(np.percentile(envelope, 95))
+    if reference <= 1e-4:
+        return np.zeros(len(envelope), dtype=np.uint8)
+
+    relative = (envelope / reference - gate) / (1.0 - gate)
+    quantized = np.clip(np.ceil(relative * (levels - 1)), 0, levels - 1).astype(np.uint8)
+
+    gaps = (quantized[1:-1] == 0) & (quantized[:-2] > 0) & (quantized[2:] > 0)
+    quantized[1:-1][gaps] = 1
+    return quantized
+
+
+@dataclass(frozen=True)
+class LipSync:
+    """Precomputed mouth shapes of one clip
+
+    Computed once per clip (vectorized), then looked up by playback time,
+    instead of toggling the mouth on a timer.
+
+    Attributes:
+        levels: Mouth openness per frame (0 = closed)
+        frame_seconds: Frame length
+    """
+
+    levels: bytes
+    frame_seconds: float = LIPSYNC_FRAME_SECONDS
+
+    @classmethod
+    def from_wav(
+        cls,
+        audio: Union[BytesLike, WavAudio],
+        frame_seconds: float = LIPSYNC_FRAME_SECONDS,
+    ) -> "LipSync":
+        """Analyze a WAV buffer (or parsed audio)"""
+        wav = audio if isinstance(audio, WavAudio) else parse_wav(audio)
+        return cls(bytes(mouth_levels(rms_envelope(wav, frame_seconds))), frame_seconds)
+
+    @property
+    def duration(self) -> float:
+        return len(self.levels) * self.frame_seconds
+
+    def level_at(self, seconds: float) -> int:
+        """Mouth openness at a playback position (closed outside the clip)"""
+        index = int(seconds / self.frame_seconds)
+        return self.levels[index] if 0 <= index < len(self.levels) else 0
+
+    def is_open(self, seconds: float) -> bool:
+        """Whether the mouth is open at a playback position"""
+        return self.level_at(seconds) > 0
+
+    def encode(self) -> str:
+        """Compact form for clients: one digit per frame (e.g. "0012321000")"""
+        return "".join(str(level) for level in self.levels)
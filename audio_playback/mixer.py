@@ -0,0 +1,148 @@
+"""In-process software mixer on one persistent PortAudio stream"""
+
+import threading
+from typing import Optional
+
+from .exceptions import AudioError
+from .wav import WavAudio, to_float_frames
+
+MIXER_SAMPLE_RATE = 48000
+MIXER_CHANNELS = 2
+
+_mixers: dict = {}
+_mixers_lock = threading.Lock()
+
+
+class Voice:
+    """One clip being mixed
+
+    Attributes:
+        done: Set when the clip has been fully mixed or stopped
+    """
+
+    def __init__(self, frames, gain: float = 1.0, loop: bool = False):
+        self.frames = frames
+        self.gain = gain
+        self.loop = loop
+        self.position = 0
+        self.done = threading.Event()
+
+    def stop(self) -> None:
+        self.loop = False
+        self.position = len(self.frames)
+        self.done.set()
+
+
+class Mixer:
+    """Sums any number of voices into one always-open output stream
+
+    The stream runs from the first `add` until `close`; between clips it
+    outputs silence, so starting a clip never opens the device.
+    """
+
+    def __init__(
+        self,
+        device: Optional[str] = None,
+        sample_rate: int = MIXER_SAMPLE_RATE,
+        channels: int = MIXER_CHANNELS,
+        blocksize: int = 512,
+    ):
+        self.device = int(device) if device and device.isdigit() else device
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.blocksize = blocksize
+        self._voices: list = []
+        self._lock = threading.Lock()
+        self._stream = None
+
+    @property
+    def latency(self) -> float:
+        """Output latency of the stream in seconds"""
+        return self._stream.latency if self._stream is not None else 0.0
+
+    def _ensure_stream(self):
+        if self._stream is not None:
+            return
+        from .backends import _import_sounddevice
+        sd = _import_sounddevice()
+        if sd is None:
+            raise AudioError("The mixer backend requires sounddevice (PortAudio)")
+        try:
+            self._stream = sd.OutputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype="float32",
+                device=self.device,
+                blocksize=self.blocksize,
+                callback=self._callback,
+            )
+            self._stream.start()
+        except Exception as e:
+            self._stream = None
+            raise AudioError(f"Could not open audio output: {e}")
+
+    def add(self, wav: WavAudio, gain: float = 1.0, loop: bool = False) -> Voice:
+        """Start mixing a clip
+
+        Args:
+            wav: Parsed WAV audio
+            gain: Linear volume
+            loop: Repeat until stopped (BGM)
+
+        Returns:
+            The voice; wait on `voice.done` or call `voice.stop()`
+        """
+        voice = Voice(to_float_frames(wav, self.sample_rate, self.channels), gain, loop)
+        if len(voice.frames) == 0:
+            voice.done.set()
+            return voice
+        with self._lock:
+            self._ensure_stream()
+            self._voices.append(voice)
+        return voice
+
+    def _callback(self, outdata, frames, time_info, status):
+        outdata.fill(0)
+        with self._lock:
+            voices = list(self._voices)
+
+        finished = []
+        for voice in voices:
+            written = 0
+            while written < frames and not voice.done.is_set():
+                chunk = voice.frames[voice.position:voice.position + frames - written]
+                outdata[written:written + len(chunk)] += chunk * voice.gain
+                written += len(chunk)
+                voice.position += len(chunk)
+                if voice.position >= len(voice.frames):
+                    if voice.loop:
+                        voice.position = 0
+                    else:
+                        voice.done.set()
+            if voice.done.is_set():
+                finished.append(voice)
+
+        if finished:
+            with self._lock:
+                self._voices = [v for v in self._voices if v not in finished]
+        outdata.clip(-1.0, 1.0, out=outdata)
+
+    def close(self) -> None:
+        """Stop all voices and close the stream"""
+        with self._lock:
+            for voice in self._voices:
+                voice.stop()
+            self._voices = []
+            stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.abort()
+            stream.close()
+
+
+def get_mixer(device: Optional[str] = None) -> Mixer:
+    """Shared mixer for an output device (created on first use)"""
+    with _mixers_lock:
+        mixer = _mixers.get(device)
+        if mixer is None:
+            mixer = _mixers[device] = Mixer(device)
+        return mixer
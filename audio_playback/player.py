@@ -0,0 +1,80 @@
+"""WAV playback from memory through a configurable backend"""
+
+import threading
+from typing import Optional, Union
+
+from .backends import PlaybackBackend, create_backend
+from .wav import BytesLike, WavAudio, parse_wav
+
+
+class AudioPlayer:
+    """Play WAV data from memory, one utterance at a time
+
+    Audio never touches the disk: the WAV buffer is parsed in place and
+    its samples are handed to the backend, which keeps its output (a
+    PortAudio stream, an aplay/pacat process, the shared mixer) open
+    between utterances. The backend is chosen by `create_backend`, i.e.
+    the AUDIO_BACKEND env var unless one is passed in; `null` runs
+    without audio hardware.
+
+    Example:
+        player = AudioPlayer()
+        for audio in speech:
+            player.play(audio)
+    """
+
+    def __init__(self, backend: Optional[Union[str, PlaybackBackend]] = None):
+        """Initialize the player
+
+        Args:
+            backend: Backend instance or spec (see create_backend). The
+                device is opened on first use.
+        """
+        self._backend_spec = backend
+        self._backend: Optional[PlaybackBackend] = backend if isinstance(backend, PlaybackBackend) else None
+        self._play_lock = threading.Lock()
+
+    @property
+    def backend(self) -> PlaybackBackend:
+        """The backend in use (created on first access)"""
+        if self._backend is None:
+            self._backend = create_backend(self._backend_spec)
+        return self._backend
+
+    def play(self, audio: Union[BytesLike, WavAudio]) -> float:
+        """Play a WAV buffer and wait until it has been heard
+
+        Calls from several threads are serialized.
+
+        Args:
+            audio: WAV file contents (bytes/bytearray/memoryview) or parsed audio
+
+        Returns:
+            Duration of the audio in seconds
+
+        Raises:
+            WavFormatError: If the data is not a PCM WAV
+            AudioError: If the output fails
+        """
+        wav = audio if isinstance(audio, WavAudio) else parse_wav(audio)
+        with self._play_lock:
+            self.backend.play(wav)
+        return wav.duration
+
+    def stop(self) -> None:
+        """Stop the current playback (safe to call from any thread)"""
+        if self._backend is not None:
+            self._backend.stop()
+
+    def close(self) -> None:
+        """Stop playback and release the output device"""
+        self.stop()
+        with self._play_lock:
+            if self._backend is not None:
+                self._backend.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
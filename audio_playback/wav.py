@@ -0,0 +1,151 @@
+"""In-memory WAV parsing (replaces get_wav_duration's wave.open on a temp file)"""
+
+import struct
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from .exceptions import AudioError, WavFormatError
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+@dataclass(frozen=True)
+class WavAudio:
+    """PCM samples of a WAV file, viewed without copying
+
+    Attributes:
+        sample_rate: Frames per second
+        channels: Interleaved channels per frame
+        sample_width: Bytes per sample (1 = unsigned 8-bit, 2/3/4 = signed)
+        frames: View of the `data` chunk inside the original buffer
+    """
+
+    sample_rate: int
+    channels: int
+    sample_width: int
+    frames: memoryview
+
+    @property
+    def frame_size(self) -> int:
+        return self.channels * self.sample_width
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.frames) // self.frame_size
+
+    @property
+    def duration(self) -> float:
+        """Length in seconds"""
+        return self.frame_count / self.sample_rate
+
+
+def parse_wav(data: BytesLike) -> WavAudio:
+    """Parse a RIFF/WAVE buffer in memory
+
+    Only the chunk headers are read; the sample data is returned as a
+    memoryview slice of `data`, so nothing is copied.
+
+    Args:
+        data: Complete WAV file contents (e.g. VOICEVOX /synthesis output)
+
+    Returns:
+        Parsed audio
+
+    Raises:
+        WavFormatError: If the data is not an uncompressed PCM WAV
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < 12 or view[0:4] != b"RIFF" or view[8:12] != b"WAVE":
+        raise WavFormatError("Not a RIFF/WAVE file")
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset:offset + 4])
+        (chunk_size,) = struct.unpack_from("<I", view, offset + 4)
+        body = offset + 8
+
+        if chunk_id == b"fmt ":
+            if chunk_size < 16:
+                raise WavFormatError("fmt chunk is too short")
+            tag, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", view, body)
+            if tag == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                # The real format tag is the first field of the SubFormat GUID
+                (tag,) = struct.unpack_from("<H", view, body + 24)
+            if tag != WAVE_FORMAT_PCM:
+                raise WavFormatError(f"Unsupported WAV format tag: {tag:#06x}")
+            if channels == 0 or sample_rate == 0 or bits % 8 or not 8 <= bits <= 32:
+                raise WavFormatError("Invalid fmt chunk")
+            fmt = (sample_rate, channels, bits // 8)
+
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise WavFormatError("data chunk before fmt chunk")
+            # Streamed WAVs may leave the size at 0 or 0xFFFFFFFF; clamp to the buffer
+            end = min(body + chunk_size, len(view)) if chunk_size else len(view)
+            frame_size = fmt[1] * fmt[2]
+            end -= (end - body) % frame_size
+            return WavAudio(*fmt, frames=view[body:end])
+
+        # Chunks are word aligned
+        offset = body + chunk_size + (chunk_size & 1)
+
+    raise WavFormatError("No data chunk")
+
+
+def wav_duration(data: BytesLike) -> float:
+    """Length of a WAV buffer in seconds"""
+    return parse_wav(data).duration
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise AudioError("Sample processing (mixer, lip sync) requires numpy")
+    return numpy
+
+
+def to_float_frames(wav: WavAudio, sample_rate: Optional[int] = None, channels: Optional[int] = None):
+    """Convert PCM WAV samples to float32 frames (for mixing and analysis)
+
+    Args:
+        wav: Parsed WAV audio (any PCM width, rate and channel count)
+        sample_rate: Target rate (linear interpolation when it differs; default: keep)
+        channels: Target channels (mono is duplicated, others are downmixed; default: keep)
+
+    Returns:
+        float32 array of shape (frames, channels) in [-1, 1]
+    """
+    np = _import_numpy()
+    sample_rate = sample_rate or wav.sample_rate
+    channels = channels or wav.channels
+    raw = wav.frames
+    if wav.sample_width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif wav.sample_width == 3:
+        # Sign-extend little-endian 24-bit samples into int32
+        triples = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        ints = triples[:, 0] | (triples[:, 1] << 8) | (triples[:, 2] << 16)
+        ints = np.where(ints & 0x800000, ints - 0x1000000, ints)
+        samples = ints.astype(np.float32) / float(1 << 23)
+    else:
+        dtype = {2: "<i2", 4: "<i4"}[wav.sample_width]
+        scale = float(1 << (wav.sample_width * 8 - 1))
+        samples = np.frombuffer(raw, dtype=dtype).astype(np.float32) / scale
+    frames = samples.reshape(-1, wav.channels)
+
+    if wav.channels != channels:
+        mono = frames.mean(axis=1, keepdims=True) if wav.channels > 1 else frames
+        frames = np.repeat(mono, channels, axis=1)
+
+    if wav.sample_rate != sample_rate and len(frames):
+        count = int(round(len(frames) * sample_rate / wav.sample_rate))
+        positions = np.arange(count, dtype=np.float64) * (wav.sample_rate / sample_rate)
+        source = np.arange(len(frames), dtype=np.float64)
+        frames = np.stack([np.interp(positions, source, frames[:, c]) for c in range(channels)], axis=1)
+
+    return np.ascontiguousarray(frames, dtype=np.float32)
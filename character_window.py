@@ -8,10 +8,17 @@ from tkinter import Canvas
 from PIL import Image, ImageDraw, ImageTk
 import os
 import threading
-import subprocess
-import tempfile
 import time
 
+from audio_playback import LIPSYNC_FRAME_SECONDS, AudioPlayer, LipSync
+from tts_client import SystemTTS
+from scene import ImageLoader
+
+# 読み上げ（macOSはsay、Linuxはespeak-ng。再生先は環境変数 AUDIO_BACKEND）
+system_tts = SystemTTS()
+player = AudioPlayer()
+image_loader = ImageLoader()  # 縮小済みの画像をディスクにキャッシュ
+
 
 class CharacterWindow:
     """キャラクター表示用のTkinterウィンドウ"""
@@ -147,7 +154,7 @@ class CharacterWindow:
         self.root.mainloop()
 
     def _load_images(self):
-        """画像をロード"""
+        """画像をロード（縮小済みの画像をキャッシュから別スレッドで読み込む）"""
         image_files = {
             'pro_closed': 'pro_closed.png',
             'pro_open': 'pro_open.png',
@@ -155,12 +162,19 @@ class CharacterWindow:
             'con_open': 'con_open.png',
         }
 
-        for key, filename in image_files.items():
-            path = os.path.join(self.assets_dir, filename)
-            if os.path.exists(path):
-                img = Image.open(path)
-                img = img.resize((150, 150), Image.Resampling.LANCZOS)
-                self.images[key] = ImageTk.PhotoImage(img)
+        paths = {key: os.path.join(self.assets_dir, filename) for key, filename in image_files.items()}
+        future = image_loader.load_async(paths, size=(150, 150), fit=False)
+        future.add_done_callback(lambda f: self.root.after(0, self._set_images, f))
+
+    def _set_images(self, future):
+        """読み込んだ画像をTk用に変換（Tkのスレッドで呼ぶ）"""
+        try:
+            loaded = future.result()
+        except OSError as e:
+            print(f"画像の読み込みに失敗しました: {e}")
+            return
+        self.images = {key: ImageTk.PhotoImage(img) for key, img in loaded.items()}
+        self._draw_characters()
 
     def _draw_characters(self):
         """キャラクターを描画"""
@@ -191,33 +205,25 @@ class CharacterWindow:
         self.is_speaking = True
         self.stop_animation = False
 
-        # 音声ファイルを生成
-        with tempfile.NamedTemporaryFile(suffix='.aiff', delete=False) as f:
-            audio_path = f.name
-
         try:
-            # 音声ファイル生成
-            subprocess.run(['say', '-v', voice, '-r', '140', '-o', audio_path, text],
-                          check=True, capture_output=True)
+            # 音声生成（WAVデータをメモリ上で受け取る）
+            audio = system_tts.synthesize(text, voice, rate=140)
 
-            # 音声ファイルの長さを取得（afinfo使用）
-            result = subprocess.run(['afinfo', '-b', audio_path],
-                                   capture_output=True, text=True)
-            # 長さを推定（文字数ベース）
-            duration = len(text) * 0.1 + 0.5  # 大まかな推定
+            lipsync = LipSync.from_wav(audio)
 
             # 音声再生とアニメーションを開始
-            play_thread = threading.Thread(target=lambda: subprocess.run(
-                ['afplay', audio_path], capture_output=True))
+            play_thread = threading.Thread(target=player.play, args=(audio,))
+            start = time.monotonic()
             play_thread.start()
 
-            # 口パクアニメーション
-            start_time = time.time()
+            # 口パクアニメーション（音量から求めた口の開きに合わせ、変化したときだけ再描画）
             while play_thread.is_alive() and not self.stop_animation:
-                self.mouth_open = not self.mouth_open
-                if self.root:
-                    self.root.after(0, self._draw_characters)
-                time.sleep(0.1)
+                mouth_open = lipsync.is_open(time.monotonic() - start)
+                if mouth_open != self.mouth_open:
+                    self.mouth_open = mouth_open
+                    if self.root:
+                        self.root.after(0, self._draw_characters)
+                time.sleep(LIPSYNC_FRAME_SECONDS)
 
             play_thread.join()
 
@@ -228,14 +234,11 @@ class CharacterWindow:
             if self.root:
                 self.root.after(0, self._draw_characters)
 
-            # 一時ファイル削除
-            if os.path.exists(audio_path):
-                os.remove(audio_path)
-
     def stop(self):
         """アニメーションを停止"""
         self.stop_animation = True
         self.is_speaking = False
+        player.stop()
 
     def close(self):
         """ウィンドウを閉じる"""
@@ -1,9 +1,12 @@
 """Debate Core - Core logic for AI debate simulation"""
 
-from .types import Character, DebateSession, TurnResult, JudgeResult, Speaker
+from .types import Character, DebateSession, TurnResult, JudgeResult, Speaker, TimelineEvent
 from .config import DEFAULT_CHARACTERS, DEFAULT_TOPIC
 from .prompts import create_debater_prompt, create_judge_prompt
 from .session import SessionManager
+from .verdict import JUDGE_CRITERIA, VerdictFormatError, parse_verdict
+from .timeline import TimelineWriter, TimelineReader, TimelineFormatError
+from .emotion import EmotionClassifier, classify_emotion
 
 __all__ = [
     "Character",
@@ -11,9 +14,18 @@ __all__ = [
     "TurnResult",
     "JudgeResult",
     "Speaker",
+    "TimelineEvent",
     "DEFAULT_CHARACTERS",
     "DEFAULT_TOPIC",
     "create_debater_prompt",
     "create_judge_prompt",
     "SessionManager",
+    "JUDGE_CRITERIA",
+    "VerdictFormatError",
+    "parse_verdict",
+    "TimelineWriter",
+    "TimelineReader",
+    "TimelineFormatError",
+    "EmotionClassifier",
+    "classify_emotion",
 ]
@@ -1,6 +1,6 @@
 """Default configuration for AI debate"""
 
-from .types import Character
+from .types import Character, JudgePersona
 
 # Default characters (from ai_debate_voicevox.py lines 33-56)
 DEFAULT_CHARACTERS = {
@@ -22,6 +22,54 @@ DEFAULT_CHARACTERS = {
     ),
 }
 
+# VOICEVOX style IDs for server-side speech (from ai_debate_voicevox.py CHARACTERS)
+VOICEVOX_SPEAKERS = {
+    "pro": 3,    # ずんだもん
+    "con": 2,    # 四国めたん
+    "judge": 8,  # 春日部つむぎ
+}
+
+# Characters of the YouTube edition (ai_debate_youtube.py and the headless
+# renderer ai_debate_render.py), as plain dicts with their VOICEVOX style IDs
+YOUTUBE_CHARACTERS = {
+    "pro": {
+        "name": "さくら",
+        "age": "17歳",
+        "job": "高校生",
+        "tone": "元気で明るい口調",
+        "personality": "ポジティブ、熱血、たまにドジ",
+        "speaker_id": 3,
+        "color": "#FF69B4",
+        "bg_color": "#FFE4E1",
+    },
+    "con": {
+        "name": "あおい",
+        "age": "18歳",
+        "job": "大学生",
+        "tone": "クールで知的な口調",
+        "personality": "冷静、論理的、ちょっと毒舌",
+        "speaker_id": 2,
+        "color": "#4169E1",
+        "bg_color": "#E6E6FA",
+    },
+    "judge": {
+        "name": "ジャッジ",
+        "speaker_id": 8,
+    },
+}
+
+# Character expressions with their own images (see debate_core.emotion)
+EXPRESSIONS = ["normal", "angry", "happy", "surprised"]
+
+# Judge personas for the judge ensemble (each judges independently)
+JUDGE_PERSONAS = [
+    JudgePersona(name="論理派の審判", focus="主張の一貫性と論理の飛躍がないか"),
+    JudgePersona(name="実例重視の審判", focus="具体例やデータの質と正確さ"),
+    JudgePersona(name="ディベート講師", focus="相手の主張への反論の的確さ"),
+    JudgePersona(name="観客代表の審判", focus="聞き手として納得できたかどうか"),
+    JudgePersona(name="辛口の審判", focus="議論の弱点や根拠の乏しさ"),
+]
+
 # Default topic
 DEFAULT_TOPIC = "AIは人間の仕事を奪う"
 
@@ -29,3 +77,4 @@ DEFAULT_TOPIC = "AIは人間の仕事を奪う"
 LLM_MODEL = "llama-3.3-70b-versatile"
 LLM_MAX_TOKENS_DEBATE = 500
 LLM_MAX_TOKENS_JUDGE = 800
+LLM_MAX_TOKENS_VERDICT = 200  # JSON scores only (commentary streamed separately)
@@ -0,0 +1,130 @@
+"""Keyword-based emotion classification for character expressions"""
+
+import bisect
+import re
+from typing import Iterable, Optional
+
+from .text import split_sentences
+
+NEUTRAL_EMOTION = "normal"
+
+# Keyword weights per emotion; stronger words count for more
+EMOTION_KEYWORDS: dict[str, dict[str, float]] = {
+    "angry": {
+        "違う": 1.0, "おかしい": 1.0, "間違": 1.0, "反論": 1.0,
+        "そんな": 1.0, "ありえない": 1.5, "バカ": 2.0, "無理": 1.0,
+    },
+    "surprised": {
+        "え？": 1.0, "まさか": 1.5, "本当": 1.0, "驚": 1.0,
+        "信じられない": 1.5, "すごい": 1.0, "！？": 1.5,
+    },
+    "happy": {
+        "そうだ": 1.0, "いい": 1.0, "素晴らしい": 1.5, "確かに": 1.0,
+        "賛成": 1.0, "嬉しい": 1.5, "楽しい": 1.5, "最高": 1.5,
+    },
+}
+
+# Tie-break order when two emotions score the same
+EMOTION_PRIORITY = ("angry", "surprised", "happy")
+
+# Joins texts for a batch scan; never part of a keyword, so no match spans two texts
+_BATCH_SEPARATOR = "\0"
+
+
+class EmotionClassifier:
+    """Scores text against all emotion keywords in a single pass
+
+    The keywords are compiled once into one regex alternation (longest
+    first) inside a lookahead, so a scan visits each position of the text
+    once and still counts keywords that overlap, instead of one substring
+    search per keyword.
+    """
+
+    def __init__(
+        self,
+        keywords: Optional[dict[str, dict[str, float]]] = None,
+        priority: Iterable[str] = EMOTION_PRIORITY,
+        default: str = NEUTRAL_EMOTION,
+    ):
+        """Compile the matcher
+
+        Args:
+            keywords: Emotion -> {keyword: weight}. Defaults to EMOTION_KEYWORDS.
+            priority: Emotions in tie-break order (others rank after them)
+            default: Emotion for text without any keyword
+        """
+        keywords = EMOTION_KEYWORDS if keywords is None else keywords
+        self.default = default
+        self.priority = list(priority) + [e for e in keywords if e not in priority]
+        self._weights: dict[str, list[tuple[str, float]]] = {}
+        for emotion, words in keywords.items():
+            for word, weight in words.items():
+                self._weights.setdefault(word, []).append((emotion, weight))
+
+        alternation = "|".join(
+            re.escape(word) for word in sorted(self._weights, key=len, reverse=True)
+        )
+        self._pattern = re.compile(f"(?=({alternation}))") if alternation else None
+
+    def scores(self, text: str) -> dict[str, float]:
+        """Summed keyword weights per emotion (emotions without a match are omitted)"""
+        return self._score_matches(self._matches(text))
+
+    def classify(self, text: str, default: Optional[str] = None) -> str:
+        """Highest-scoring emotion of a text
+
+        Args:
+            text: Text to classify
+            default: Returned when no keyword matches (defaults to the
+                classifier's default, e.g. to keep the previous expression)
+        """
+        return self._pick(self.scores(text), default)
+
+    def classify_sentences(self, text: str) -> list[tuple[str, str]]:
+        """Emotion of each sentence, for utterances played sentence by sentence
+
+        Returns:
+            (sentence, emotion) pairs in order
+        """
+        sentences = split_sentences(text)
+        return list(zip(sentences, self.classify_many(sentences)))
+
+    def classify_many(self, texts: Iterable[str]) -> list[str]:
+        """Classify a batch of texts (e.g. a whole transcript) with one scan"""
+        texts = list(texts)
+        if not texts:
+            return []
+        starts, offset = [], 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(_BATCH_SEPARATOR)
+
+        per_text: list[list[tuple[int, str]]] = [[] for _ in texts]
+        for position, word in self._matches(_BATCH_SEPARATOR.join(texts)):
+            per_text[bisect.bisect_right(starts, position) - 1].append((position, word))
+        return [self._pick(self._score_matches(matches)) for matches in per_text]
+
+    def _matches(self, text: str) -> list[tuple[int, str]]:
+        if self._pattern is None:
+            return []
+        return [(m.start(), m.group(1)) for m in self._pattern.finditer(text)]
+
+    def _score_matches(self, matches: Iterable[tuple[int, str]]) -> dict[str, float]:
+        totals: dict[str, float] = {}
+        for _, word in matches:
+            for emotion, weight in self._weights[word]:
+                totals[emotion] = totals.get(emotion, 0.0) + weight
+        return totals
+
+    def _pick(self, totals: dict[str, float], default: Optional[str] = None) -> str:
+        if not totals:
+            return self.default if default is None else default
+        return min(totals, key=lambda e: (-totals[e], self.priority.index(e)))
+
+
+_default_classifier = EmotionClassifier()
+
+
+def classify_emotion(text: str, default: Optional[str] = None) -> str:
+    """Classify text with the default keywords (see EmotionClassifier.classify)"""
+    return _default_classifier.classify(text, default)
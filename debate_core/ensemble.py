@@ -0,0 +1,148 @@
+"""Judge ensemble: several judges in parallel with early consensus"""
+
+import asyncio
+from collections import Counter
+from typing import Optional
+
+from .config import LLM_MAX_TOKENS_VERDICT
+from .prompts import create_structured_judge_prompt, create_judge_persona_system_prompt
+from .types import JudgePersona, JudgeResult
+from .verdict import JUDGE_CRITERIA, parse_verdict
+
+
+def aggregate_verdicts(
+    verdicts: list[JudgeResult],
+    pro_name: str,
+    con_name: str,
+) -> JudgeResult:
+    """Combine several verdicts into one
+
+    Scores are averaged per criterion. The winner is the debater with the
+    higher averaged total, the same rule parse_verdict applies to a single
+    judge, so the totals shown next to the winner always support it. The
+    votes only break a tie in the totals (a tie in both goes to pro);
+    they are returned so clients can show how many judges agreed.
+
+    Args:
+        verdicts: Verdicts with scores (at least one)
+        pro_name: Name of the pro debater
+        con_name: Name of the con debater
+
+    Returns:
+        Aggregated JudgeResult (text is left empty)
+    """
+    if not verdicts:
+        raise ValueError("At least one verdict is required")
+
+    scores = {
+        role: {
+            criterion: round(sum(v.scores[role][criterion] for v in verdicts) / len(verdicts))
+            for criterion in JUDGE_CRITERIA
+        }
+        for role in ("pro", "con")
+    }
+
+    votes = Counter(v.winner for v in verdicts)
+    totals = {role: sum(s.values()) for role, s in scores.items()}
+    if totals["pro"] != totals["con"]:
+        winner = "pro" if totals["pro"] > totals["con"] else "con"
+    else:
+        winner = "con" if votes["con"] > votes["pro"] else "pro"
+
+    return JudgeResult(
+        winner=winner,
+        winner_name=pro_name if winner == "pro" else con_name,
+        text="",
+        scores=scores,
+        votes={"pro": votes["pro"], "con": votes["con"]},
+    )
+
+
+async def judge_ensemble(
+    client,
+    topic: str,
+    history: list[str],
+    pro_name: str,
+    con_name: str,
+    personas: list[JudgePersona],
+    quorum: Optional[int] = None,
+    max_tokens: int = LLM_MAX_TOKENS_VERDICT,
+) -> JudgeResult:
+    """Run several judges concurrently and stop as soon as a quorum agrees
+
+    Each persona scores the debate independently (JSON verdict without
+    commentary). As soon as `quorum` judges have picked the same winner the
+    remaining requests are cancelled and the finished verdicts are
+    aggregated (see aggregate_verdicts: the quorum only decides when to
+    stop, the winner comes from the averaged totals). Judges that fail
+    are skipped.
+
+    Args:
+        client: Async LLM client providing `get_json_response`
+        topic: The debate topic
+        history: List of debate messages (alternating pro/con)
+        pro_name: Name of the pro debater
+        con_name: Name of the con debater
+        personas: Judge personas, one request per persona
+        quorum: Number of agreeing judges needed to stop early
+            (default: simple majority of the personas)
+        max_tokens: Maximum tokens per judge response
+
+    Returns:
+        Aggregated JudgeResult with `votes` filled in
+
+    Raises:
+        The last judge error if every judge failed
+    """
+    if not personas:
+        raise ValueError("At least one judge persona is required")
+    if quorum is None:
+        quorum = len(personas) // 2 + 1
+
+    prompt = create_structured_judge_prompt(
+        topic=topic,
+        history=history,
+        pro_name=pro_name,
+        con_name=con_name,
+        include_commentary=False,
+    )
+
+    async def run_judge(persona: JudgePersona) -> JudgeResult:
+        data = await client.get_json_response(
+            prompt=prompt,
+            system_prompt=create_judge_persona_system_prompt(persona),
+            max_tokens=max_tokens,
+            model=persona.model,
+        )
+        return parse_verdict(data, pro_name, con_name)
+
+    pending = {asyncio.ensure_future(run_judge(p)) for p in personas}
+    verdicts: list[JudgeResult] = []
+    votes: Counter = Counter()
+    last_error: Optional[Exception] = None
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    verdict = task.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                verdicts.append(verdict)
+                votes[verdict.winner] += 1
+
+            if votes and max(votes.values()) >= quorum:
+                break
+    finally:
+        # Cancel stragglers (also when we are cancelled ourselves)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    if not verdicts:
+        raise last_error
+
+    return aggregate_verdicts(verdicts, pro_name, con_name)
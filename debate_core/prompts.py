@@ -1,6 +1,9 @@
 """Prompt generation for AI debate (from ai_debate_voicevox.py lines 135-173)"""
 
-from .types import Character
+import json
+
+from .types import Character, JudgeResult, JudgePersona
+from .verdict import JUDGE_CRITERIA, CRITERION_MAX_SCORE
 
 
 def create_debater_prompt(role: str, topic: str, character: Character) -> str:
@@ -30,6 +33,15 @@ def create_debater_prompt(role: str, topic: str, character: Character) -> str:
 性格: {character.personality}"""
 
 
+def _format_conversation(history: list[str], pro_name: str, con_name: str) -> str:
+    """Format the debate history as "name: message" lines"""
+    conversation = ""
+    for i, msg in enumerate(history):
+        speaker = pro_name if i % 2 == 0 else con_name
+        conversation += f"{speaker}: {msg}\n"
+    return conversation
+
+
 def create_judge_prompt(topic: str, history: list[str], pro_name: str, con_name: str) -> str:
     """Create prompt for the judge
 
@@ -42,10 +54,7 @@ def create_judge_prompt(topic: str, history: list[str], pro_name: str, con_name:
     Returns:
         Judge prompt string
     """
-    conversation = ""
-    for i, msg in enumerate(history):
-        speaker = pro_name if i % 2 == 0 else con_name
-        conversation += f"{speaker}: {msg}\n"
+    conversation = _format_conversation(history, pro_name, con_name)
 
     return f"""あなたはディベート大会の審判です。今回の議論を振り返って、自然な口調で評価してください。
 
@@ -91,3 +100,110 @@ JUDGE_SYSTEM_PROMPT = """あなたは明るく親しみやすいディベート
 友達に話しかけるような自然な口調で、でも公正に評価してください。
 実際の発言を「」で引用しながら、どこが良かったか具体的に褒めてください。
 最後は両者を励ます前向きな言葉で締めくくってください。"""
+
+
+def create_structured_judge_prompt(
+    topic: str,
+    history: list[str],
+    pro_name: str,
+    con_name: str,
+    include_commentary: bool = True,
+) -> str:
+    """Create a judge prompt that asks for a JSON verdict
+
+    Args:
+        topic: The debate topic
+        history: List of debate messages (alternating pro/con)
+        pro_name: Name of the pro debater
+        con_name: Name of the con debater
+        include_commentary: Whether the JSON should also contain the spoken
+            commentary. Disable when the commentary is streamed separately.
+
+    Returns:
+        Judge prompt string
+    """
+    conversation = _format_conversation(history, pro_name, con_name)
+    example_scores = {criterion: 20 for criterion in JUDGE_CRITERIA}
+    example = {
+        "scores": {"pro": example_scores, "con": example_scores},
+        "winner": "pro",
+    }
+    if include_commentary:
+        example["commentary"] = "それでは判定結果を発表します！..."
+    commentary_rule = (
+        "- commentaryには、実際の発言を「」で引用しながら話し言葉で講評し、"
+        "最後に勝者を発表して両者を励ます文章を入れる\n"
+        if include_commentary else ""
+    )
+
+    return f"""あなたはディベート大会の審判です。今回の議論を採点し、結果をJSONで返してください。
+
+【議題】{topic}
+
+【議論内容】
+{conversation}
+
+【採点ルール】
+- {"、".join(JUDGE_CRITERIA)}の{len(JUDGE_CRITERIA)}項目を各{CRITERION_MAX_SCORE}点満点の整数で採点
+- scores.proは{pro_name}さん（賛成派）、scores.conは{con_name}さん（反対派）の点数
+- winnerは合計点の高い方を"pro"または"con"で指定
+{commentary_rule}
+【出力形式】
+次の形式のJSONオブジェクトのみを出力してください。
+{json.dumps(example, ensure_ascii=False)}"""
+
+
+def create_commentary_prompt(
+    topic: str,
+    history: list[str],
+    pro_name: str,
+    con_name: str,
+    verdict: JudgeResult,
+) -> str:
+    """Create a prompt for the spoken commentary of an already scored verdict
+
+    Args:
+        topic: The debate topic
+        history: List of debate messages (alternating pro/con)
+        pro_name: Name of the pro debater
+        con_name: Name of the con debater
+        verdict: Structured verdict with scores
+
+    Returns:
+        Commentary prompt string
+    """
+    conversation = _format_conversation(history, pro_name, con_name)
+    score_lines = ""
+    for role, name in (("pro", pro_name), ("con", con_name)):
+        scores = verdict.scores[role]
+        details = "、".join(f"{c}{scores[c]}点" for c in JUDGE_CRITERIA)
+        score_lines += f"- {name}さん: {details}、合計{verdict.totals[role]}点\n"
+
+    return f"""あなたはディベート大会の審判です。採点はすでに終わっています。この結果を自然な口調で発表してください。
+
+【議題】{topic}
+
+【議論内容】
+{conversation}
+
+【採点結果】
+{score_lines}
+【勝者】{verdict.winner_name}さん
+
+【回答のルール】
+- 箇条書きや■などの記号は使わず、話し言葉で自然に語る
+- 具体的にどの発言が良かったか・悪かったかを「」で引用する
+- 点数は採点結果の通りに伝える
+- 最後に勝者を発表し、両者への励ましの言葉で締める"""
+
+
+# Structured judge system prompt
+STRUCTURED_JUDGE_SYSTEM_PROMPT = """あなたは公正なディベート大会の審判です。
+指定された形式のJSONオブジェクトだけを出力してください。"""
+
+
+def create_judge_persona_system_prompt(persona: JudgePersona) -> str:
+    """Create the system prompt for one judge of a judge ensemble"""
+    return f"""あなたはディベート大会の{persona.name}です。
+特に「{persona.focus}」に注目して、公正に採点してください。
+指定された形式のJSONオブジェクトだけを出力してください。"""
@@ -0,0 +1,176 @@
+"""Turn and judge orchestration shared by the API, background jobs and CLIs"""
+
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Literal, Optional
+
+from .config import JUDGE_PERSONAS, LLM_MAX_TOKENS_DEBATE, LLM_MAX_TOKENS_JUDGE
+from .ensemble import judge_ensemble
+from .prompts import (
+    create_debater_prompt,
+    create_initial_prompt,
+    create_rebuttal_prompt,
+    create_structured_judge_prompt,
+    create_commentary_prompt,
+    JUDGE_SYSTEM_PROMPT,
+    STRUCTURED_JUDGE_SYSTEM_PROMPT,
+)
+from .types import DebateSession, JudgeResult, Speaker, TurnResult
+from .verdict import parse_verdict
+
+
+@dataclass
+class TurnPrompt:
+    """Prompts for the next turn of a session"""
+    role: Literal["pro", "con"]
+    system_prompt: str
+    user_prompt: str
+
+
+def prepare_turn(session: DebateSession) -> TurnPrompt:
+    """Build the prompts for the next speaker of a session
+
+    Args:
+        session: The debate session
+
+    Returns:
+        TurnPrompt for the next speaker
+    """
+    current_role = session.get_next_speaker()
+    current_char = session.pro if current_role == "pro" else session.con
+    opponent_char = session.con if current_role == "pro" else session.pro
+
+    system_prompt = create_debater_prompt(current_role, session.topic, current_char)
+
+    if session.turn_count == 0:
+        # First turn
+        user_prompt = create_initial_prompt(session.topic)
+    else:
+        # Rebuttal to previous statement
+        user_prompt = create_rebuttal_prompt(opponent_char.name, session.history[-1])
+
+    return TurnPrompt(role=current_role, system_prompt=system_prompt, user_prompt=user_prompt)
+
+
+def commit_turn(session: DebateSession, role: Literal["pro", "con"], text: str) -> TurnResult:
+    """Add a generated turn to the session and build its result
+
+    Args:
+        session: The debate session
+        role: Role that spoke
+        text: Generated text
+
+    Returns:
+        TurnResult for the committed turn
+    """
+    session.add_turn(text, role)
+    char = session.pro if role == "pro" else session.con
+
+    return TurnResult(
+        turn_number=session.turn_count,
+        speaker=Speaker(role=role, name=char.name, color=char.color),
+        text=text,
+        next_speaker="con" if role == "pro" else "pro",
+    )
+
+
+async def run_turn(client, session: DebateSession) -> TurnResult:
+    """Generate and commit the next turn with an async client
+
+    Args:
+        client: Async LLM client providing `get_response`
+        session: The debate session
+
+    Returns:
+        TurnResult for the new turn
+    """
+    turn = prepare_turn(session)
+    text = await client.get_response(
+        prompt=turn.user_prompt,
+        system_prompt=turn.system_prompt,
+        max_tokens=LLM_MAX_TOKENS_DEBATE,
+    )
+    return commit_turn(session, turn.role, text.strip())
+
+
+async def judge_session(
+    client,
+    session: DebateSession,
+    ensemble_size: Optional[int] = None,
+    quorum: Optional[int] = None,
+) -> JudgeResult:
+    """Judge a session with an async client
+
+    Without `ensemble_size` a single JSON verdict including commentary is
+    requested. With it, a judge ensemble scores the debate and one extra call
+    writes the commentary for the aggregated verdict.
+
+    Args:
+        client: Async LLM client providing `get_json_response` and `get_response`
+        session: The debate session (at least 2 turns)
+        ensemble_size: Number of judge personas to use (optional)
+        quorum: Agreeing judges needed to stop early (optional)
+
+    Returns:
+        JudgeResult with scores and commentary
+    """
+    if not ensemble_size:
+        data = await client.get_json_response(
+            prompt=create_structured_judge_prompt(
+                session.topic, session.history, session.pro.name, session.con.name,
+            ),
+            system_prompt=STRUCTURED_JUDGE_SYSTEM_PROMPT,
+            max_tokens=LLM_MAX_TOKENS_JUDGE,
+        )
+        return parse_verdict(data, session.pro.name, session.con.name)
+
+    verdict = await judge_ensemble(
+        client,
+        topic=session.topic,
+        history=session.history,
+        pro_name=session.pro.name,
+        con_name=session.con.name,
+        personas=JUDGE_PERSONAS[:ensemble_size],
+        quorum=quorum,
+    )
+    commentary = await client.get_response(
+        prompt=create_commentary_prompt(
+            session.topic, session.history, session.pro.name, session.con.name, verdict,
+        ),
+        system_prompt=JUDGE_SYSTEM_PROMPT,
+        max_tokens=LLM_MAX_TOKENS_JUDGE,
+    )
+    verdict.text = commentary.strip()
+    return verdict
+
+
+async def run_debate(
+    client,
+    session: DebateSession,
+    turns: int,
+    on_event: Optional[Callable[[dict], Awaitable[None]]] = None,
+    ensemble_size: Optional[int] = None,
+    quorum: Optional[int] = None,
+) -> JudgeResult:
+    """Run a complete debate (N turns plus judging) with an async client
+
+    Args:
+        client: Async LLM client
+        session: A fresh debate session
+        turns: Number of turns to generate (at least 2)
+        on_event: Awaitable callback receiving progress events
+            ({"type": "turn", "turn": {...}} and {"type": "verdict", "verdict": {...}})
+        ensemble_size: Number of judges (optional, see judge_session)
+        quorum: Agreeing judges needed to stop early (optional)
+
+    Returns:
+        JudgeResult of the debate
+    """
+    for _ in range(turns):
+        result = await run_turn(client, session)
+        if on_event:
+            await on_event({"type": "turn", "turn": result.to_dict()})
+
+    verdict = await judge_session(client, session, ensemble_size, quorum)
+    if on_event:
+        await on_event({"type": "verdict", "verdict": verdict.to_dict()})
+    return verdict
@@ -0,0 +1,67 @@
+"""Text utilities for speech (sentence splitting)"""
+
+import re
+
+# Sentence end: 。！？!? or a line break, plus any closing brackets after it
+_SENTENCE_END = re.compile(r"(?:[。！？!?]+[」』）)\]]*|\n+)")
+
+# A quote followed by one of these continues the sentence (「AIは道具だ！」と言える)
+_QUOTE_CONTINUATION = re.compile(r"[とってはがをにのもでやへ]")
+
+
+class SentenceChunker:
+    """Incremental sentence splitter for streamed text
+
+    Feed text deltas as they arrive (e.g. LLM tokens); complete sentences
+    are returned as soon as their end is certain, so they can be sent to
+    speech synthesis while the rest is still being generated.
+
+    Punctuation stays with its sentence. A quote closed by 」 or 』 only
+    ends the sentence when no particle follows it, so 「…！」と言える is
+    spoken as one sentence. Fragments shorter than `min_chars` (e.g.
+    "はい！") are merged into the following sentence so the synthesizer is
+    not called for tiny clips.
+    """
+
+    def __init__(self, min_chars: int = 8):
+        self.min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, delta: str) -> list[str]:
+        """Add text and return the sentences completed by it"""
+        self._buffer += delta
+        sentences = []
+        start = 0
+        for match in _SENTENCE_END.finditer(self._buffer):
+            if match.end() == len(self._buffer):
+                break  # more punctuation, a closing bracket or a particle may follow
+            if match.group().endswith(("」", "』")) and _QUOTE_CONTINUATION.match(self._buffer, match.end()):
+                continue  # the quote is part of a longer sentence
+            sentence = self._buffer[start:match.end()].strip()
+            if len(sentence) >= self.min_chars:
+                sentences.append(sentence)
+                start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> list[str]:
+        """Return the remaining text once the input is complete"""
+        rest = self._buffer.strip()
+        self._buffer = ""
+        return [rest] if rest else []
+
+
+def split_sentences(text: str, min_chars: int = 8) -> list[str]:
+    """Split Japanese text into sentences for chunked speech synthesis
+
+    See SentenceChunker for the rules.
+
+    Args:
+        text: Text to split
+        min_chars: Minimum sentence length before merging
+
+    Returns:
+        Non-empty sentences in order
+    """
+    chunker = SentenceChunker(min_chars)
+    return chunker.feed(text) + chunker.flush()
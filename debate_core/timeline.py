@@ -0,0 +1,269 @@
+"""Serialized debate timelines: generate once, present many times
+
+A timeline is a JSON Lines file. The first line is a header, then one
+event per line in time order:
+
+    {"type": "header", "version": 1, "topic": "...", "audio_dir": "debate_audio"}
+    {"type": "round", "t": 0.0, "round": 1}
+    {"type": "utterance", "t": 0.0, "speaker": "pro", "turn": 1, "text": "...",
+     "emotion": "happy", "audio": "0001.wav", "duration": 2.31}
+    {"type": "verdict", "t": 9.4, "winner": "pro", "winner_name": "...", "text": "..."}
+    {"type": "end", "t": 12.0}
+
+`t` is presentation time, not generation time. Each utterance starts
+after the previous one's audio, plus a gap when a new turn begins, so a
+timeline generated in bulk (as fast as the LLM and TTS allow) plays back
+with natural pacing. Audio is stored as WAV files in a directory next to
+the timeline. Utterances of one turn (sentence-by-sentence speech) share
+`turn` and follow each other without a gap, as in the live app.
+
+The writer flushes every line, so a presenter can follow a timeline
+while it is still being generated (TimelineReader.follow).
+"""
+
+import json
+import os
+import time
+import wave
+from io import BytesIO
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .types import TimelineEvent
+
+TIMELINE_VERSION = 1
+
+# Event types
+UTTERANCE = "utterance"
+ROUND = "round"
+JUDGE_START = "judge_start"
+VERDICT = "verdict"
+END = "end"
+
+# Silence between turns, in seconds
+DEFAULT_GAP = 0.4
+
+
+class TimelineFormatError(ValueError):
+    """Raised when a file is not a valid timeline"""
+    pass
+
+
+def _wav_duration(audio: bytes) -> float:
+    try:
+        with wave.open(BytesIO(audio)) as f:
+            return f.getnframes() / f.getframerate()
+    except (wave.Error, EOFError) as e:
+        raise TimelineFormatError(f"Utterance audio is not a PCM WAV: {e}")
+
+
+class TimelineWriter:
+    """Streams a timeline to disk while a debate is generated
+
+    Example:
+        with TimelineWriter("debate.jsonl", topic=topic) as timeline:
+            timeline.event("round", round=1)
+            timeline.utterance("pro", text, audio=wav_bytes, emotion="happy", turn=1)
+            timeline.event("verdict", winner="pro", text=comment)
+    """
+
+    def __init__(self, path: str, topic: str = "", gap: float = DEFAULT_GAP, **metadata):
+        """Create the timeline file (overwrites an existing one)
+
+        Args:
+            path: Timeline file (.jsonl)
+            topic: Debate topic
+            gap: Silence inserted after each turn, in seconds
+            **metadata: Extra header fields (e.g. character names)
+        """
+        self.path = Path(path)
+        self.audio_dir = self.path.with_name(f"{self.path.stem}_audio")
+        self.audio_dir.mkdir(parents=True, exist_ok=True)
+        self.gap = gap
+        self.clock = 0.0
+        self._clips = 0
+        self._last_turn: Optional[int] = None
+        self._gap_pending = False
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._write({
+            "type": "header",
+            "version": TIMELINE_VERSION,
+            "topic": topic,
+            "audio_dir": self.audio_dir.name,
+            **metadata,
+        })
+
+    def _write(self, record: dict) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def event(self, event_type: str, hold: float = 0.0, **data) -> TimelineEvent:
+        """Append an event at the current presentation time
+
+        Args:
+            event_type: Event type
+            hold: Seconds to keep the event on screen before the next one
+                (for events without audio, such as a verdict caption)
+            **data: Event fields
+
+        Returns:
+            The written event
+        """
+        self._end_turn(data.get("turn") if event_type == UTTERANCE else None)
+        event = TimelineEvent(event_type, self.clock, data)
+        self._write(event.to_dict())
+        self.clock += hold
+        return event
+
+    def utterance(
+        self,
+        speaker: str,
+        text: str,
+        audio: Optional[bytes] = None,
+        emotion: Optional[str] = None,
+        turn: Optional[int] = None,
+        duration: Optional[float] = None,
+    ) -> TimelineEvent:
+        """Append a spoken (or text-only) line and advance the clock past it
+
+        Args:
+            speaker: Speaker role ("pro", "con", "judge", or a participant id)
+            text: What is said
+            audio: WAV file contents, stored next to the timeline
+            emotion: Expression to show while speaking
+            turn: Turn number, shared by the sentences of one turn
+            duration: Seconds the line takes (default: the audio's length,
+                or 0 without audio)
+
+        Returns:
+            The written event
+        """
+        data = {"speaker": speaker, "text": text}
+        if turn is not None:
+            data["turn"] = turn
+        if emotion is not None:
+            data["emotion"] = emotion
+        if audio is not None:
+            self._clips += 1
+            name = f"{self._clips:04d}.wav"
+            (self.audio_dir / name).write_bytes(audio)
+            data["audio"] = name
+            if duration is None:
+                duration = _wav_duration(audio)
+        data["duration"] = round(duration or 0.0, 3)
+
+        event = self.event(UTTERANCE, **data)
+        self.clock += duration or 0.0
+        self._last_turn = turn
+        self._gap_pending = True
+        return event
+
+    def _end_turn(self, turn: Optional[int]) -> None:
+        """Insert the gap after the last utterance unless `turn` continues its turn"""
+        if self._gap_pending and (turn is None or turn != self._last_turn):
+            self.clock += self.gap
+        self._gap_pending = False
+
+    def close(self) -> None:
+        """Write the end event and close the file"""
+        if self._file.closed:
+            return
+        self.event(END)
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class TimelineReader:
+    """Reads a timeline written by TimelineWriter
+
+    Example:
+        timeline = TimelineReader("debate.jsonl")
+        for event in timeline:
+            if event.type == "utterance":
+                audio = timeline.read_audio(event)
+    """
+
+    def __init__(self, path: str):
+        """Open a timeline and read its header
+
+        Raises:
+            TimelineFormatError: If the file does not start with a timeline header
+        """
+        self.path = Path(path)
+        with open(self.path, encoding="utf-8") as f:
+            first = f.readline()
+        try:
+            header = json.loads(first)
+        except json.JSONDecodeError:
+            header = None
+        if not isinstance(header, dict) or header.get("type") != "header":
+            raise TimelineFormatError(f"{path} is not a timeline (missing header)")
+        if header.get("version", 0) > TIMELINE_VERSION:
+            raise TimelineFormatError(f"Timeline version {header['version']} is newer than supported")
+        self.header = header
+        self.audio_dir = self.path.parent / header.get("audio_dir", f"{self.path.stem}_audio")
+
+    @property
+    def topic(self) -> str:
+        return self.header.get("topic", "")
+
+    def __iter__(self) -> Iterator[TimelineEvent]:
+        """Events currently in the file, in order"""
+        with open(self.path, encoding="utf-8") as f:
+            f.readline()  # header
+            for line_no, line in enumerate(f, 2):
+                if line.strip():
+                    yield self._parse(line, line_no)
+
+    def follow(self, poll_interval: float = 0.2, timeout: Optional[float] = None) -> Iterator[TimelineEvent]:
+        """Events as they are appended, until the end event
+
+        For presenting a timeline while it is still being generated.
+
+        Args:
+            poll_interval: Seconds between checks for new lines
+            timeout: Give up after this many seconds without a new event
+                (None waits forever)
+        """
+        with open(self.path, encoding="utf-8") as f:
+            f.readline()  # header
+            line_no = 1
+            pending = ""
+            last_event = time.monotonic()
+            while True:
+                chunk = f.readline()
+                if not chunk:
+                    if timeout is not None and time.monotonic() - last_event > timeout:
+                        return
+                    time.sleep(poll_interval)
+                    continue
+                pending += chunk
+                if not pending.endswith("\n"):
+                    continue  # the writer is mid-line
+                line, pending = pending, ""
+                line_no += 1
+                if not line.strip():
+                    continue
+                event = self._parse(line, line_no)
+                last_event = time.monotonic()
+                yield event
+                if event.type == END:
+                    return
+
+    def _parse(self, line: str, line_no: int) -> TimelineEvent:
+        try:
+            return TimelineEvent.from_dict(json.loads(line))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            raise TimelineFormatError(f"{self.path}:{line_no}: invalid event: {e}")
+
+    def read_audio(self, event: TimelineEvent) -> Optional[bytes]:
+        """WAV contents of an utterance, or None if it has no audio"""
+        name = event.data.get("audio")
+        if not name:
+            return None
+        return (self.audio_dir / os.path.basename(name)).read_bytes()
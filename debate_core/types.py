@@ -27,6 +27,14 @@ class Character:
         }
 
 
+@dataclass
+class JudgePersona:
+    """Judge persona used in a judge ensemble"""
+    name: str
+    focus: str
+    model: Optional[str] = None  # None uses the client's default model
+
+
 @dataclass
 class Speaker:
     """Speaker info for a turn"""
@@ -62,13 +70,28 @@ class JudgeResult:
     winner: Literal["pro", "con"]
     winner_name: str
     text: str
+    scores: Optional[dict[str, dict[str, int]]] = None
+    votes: Optional[dict[str, int]] = None  # Winner votes of a judge ensemble
+
+    @property
+    def totals(self) -> Optional[dict[str, int]]:
+        """Total score per role, if scores are available"""
+        if self.scores is None:
+            return None
+        return {role: sum(s.values()) for role, s in self.scores.items()}
 
     def to_dict(self) -> dict:
-        return {
+        result = {
             "winner": self.winner,
             "winner_name": self.winner_name,
             "text": self.text,
         }
+        if self.scores is not None:
+            result["scores"] = self.scores
+            result["totals"] = self.totals
+        if self.votes is not None:
+            result["votes"] = self.votes
+        return result
 
 
 @dataclass
@@ -108,3 +131,19 @@ class DebateSession:
                 "color": self.con.color,
             },
         }
+
+
+@dataclass
+class TimelineEvent:
+    """One event of a debate timeline (see debate_core.timeline)"""
+    type: str  # "utterance", "round", "judge_start", "verdict", "end", ...
+    t: float  # Presentation time in seconds from the start of the debate
+    data: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {"type": self.type, "t": round(self.t, 3), **self.data}
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "TimelineEvent":
+        data = dict(raw)
+        return cls(type=data.pop("type"), t=float(data.pop("t", 0.0)), data=data)
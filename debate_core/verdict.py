@@ -0,0 +1,105 @@
+"""Structured judge verdicts (JSON mode)"""
+
+from typing import Optional
+
+from .types import JudgeResult
+
+# Judging criteria, each scored out of CRITERION_MAX_SCORE (total 100)
+JUDGE_CRITERIA = ["論理性", "具体性", "反論力", "説得力"]
+CRITERION_MAX_SCORE = 25
+
+
+class VerdictFormatError(ValueError):
+    """Raised when a judge response does not match the verdict schema"""
+    pass
+
+
+def _parse_scores(raw: object, role: str) -> dict[str, int]:
+    """Validate the per-criterion scores of one debater"""
+    if not isinstance(raw, dict):
+        raise VerdictFormatError(f"scores.{role} must be an object")
+
+    scores = {}
+    for criterion in JUDGE_CRITERIA:
+        value = raw.get(criterion)
+        # bool is a subclass of int, so reject it explicitly
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise VerdictFormatError(f"scores.{role}.{criterion} must be a number")
+        value = int(round(value))
+        if not 0 <= value <= CRITERION_MAX_SCORE:
+            raise VerdictFormatError(
+                f"scores.{role}.{criterion} must be between 0 and {CRITERION_MAX_SCORE}"
+            )
+        scores[criterion] = value
+    return scores
+
+
+def parse_verdict(
+    data: dict,
+    pro_name: str,
+    con_name: str,
+    commentary: Optional[str] = None,
+) -> JudgeResult:
+    """Validate a JSON verdict and convert it to a JudgeResult
+
+    Expected shape::
+
+        {
+            "scores": {"pro": {"論理性": 20, ...}, "con": {...}},
+            "winner": "pro" | "con",
+            "commentary": "..."   # optional
+        }
+
+    Args:
+        data: Decoded JSON object returned by the judge
+        pro_name: Name of the pro debater
+        con_name: Name of the con debater
+        commentary: Commentary text to use instead of data["commentary"]
+
+    The winner is the debater with the higher total score; "winner" only
+    breaks a tie.
+
+    Returns:
+        JudgeResult with scores filled in
+
+    Raises:
+        VerdictFormatError: If the object does not match the schema
+    """
+    if not isinstance(data, dict):
+        raise VerdictFormatError("verdict must be a JSON object")
+
+    raw_scores = data.get("scores")
+    if not isinstance(raw_scores, dict):
+        raise VerdictFormatError("scores must be an object")
+
+    scores = {
+        "pro": _parse_scores(raw_scores.get("pro"), "pro"),
+        "con": _parse_scores(raw_scores.get("con"), "con"),
+    }
+    totals = {role: sum(s.values()) for role, s in scores.items()}
+
+    # The scores decide, so the caption never names the lower scorer. The
+    # judge's "winner" (role key or, leniently, the debater's name) only
+    # breaks a tie; without one, ties go to pro like the legacy heuristic.
+    if totals["pro"] != totals["con"]:
+        winner = "pro" if totals["pro"] > totals["con"] else "con"
+    else:
+        winner = data.get("winner")
+        if winner == pro_name:
+            winner = "pro"
+        elif winner == con_name:
+            winner = "con"
+        if winner not in ("pro", "con"):
+            winner = "pro"
+
+    if commentary is None:
+        commentary = data.get("commentary") or ""
+    if not isinstance(commentary, str):
+        raise VerdictFormatError("commentary must be a string")
+
+    return JudgeResult(
+        winner=winner,
+        winner_name=pro_name if winner == "pro" else con_name,
+        text=commentary.strip(),
+        scores=scores,
+    )
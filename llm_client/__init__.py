@@ -1,11 +1,16 @@
 """LLM Client - Abstraction layer for LLM APIs"""
 
-from .exceptions import LLMError, RateLimitError, APIKeyError
+from .exceptions import LLMError, RateLimitError, APIKeyError, ModelError
 from .groq_client import GroqClient
+from .async_groq_client import AsyncGroqClient
+from .scheduler import QuotaScheduler
 
 __all__ = [
     "LLMError",
     "RateLimitError",
     "APIKeyError",
+    "ModelError",
     "GroqClient",
+    "AsyncGroqClient",
+    "QuotaScheduler",
 ]
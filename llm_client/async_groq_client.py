@@ -0,0 +1,191 @@
+"""Async Groq API client"""
+
+import asyncio
+import json
+import os
+from typing import AsyncIterator, Optional
+
+from .exceptions import RateLimitError, APIKeyError, LLMError, ModelError
+from .groq_client import GroqClient, _is_rate_limit_error, _is_auth_error, _retry_after
+from .scheduler import QuotaScheduler, estimate_tokens
+
+
+class AsyncGroqClient:
+    """Async client for Groq API
+
+    Mirrors GroqClient, but awaits instead of blocking so that several
+    requests (e.g. a judge ensemble) can be in flight at once.
+    """
+
+    DEFAULT_MODEL = GroqClient.DEFAULT_MODEL
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        scheduler: Optional[QuotaScheduler] = None,
+        max_retries: int = 3,
+    ):
+        """Initialize the async Groq client
+
+        Args:
+            api_key: Groq API key. If not provided, reads from GROQ_API_KEY env var.
+            scheduler: Quota scheduler shared by all requests using this key.
+                When set, requests wait for quota instead of hitting rate limits.
+            max_retries: Default number of retries on rate limit
+
+        Raises:
+            APIKeyError: If no API key is provided or found in environment
+        """
+        self.api_key = api_key or os.getenv("GROQ_API_KEY")
+        if not self.api_key:
+            raise APIKeyError(
+                "GROQ_API_KEY not found. Set it as an environment variable or pass it to the constructor."
+            )
+        self.scheduler = scheduler
+        self.max_retries = max_retries
+        self._client = None
+
+    def _get_client(self):
+        """Lazy initialization of AsyncGroq client"""
+        if self._client is None:
+            from groq import AsyncGroq
+            self._client = AsyncGroq(api_key=self.api_key)
+        return self._client
+
+    async def _create_completion(self, max_retries: Optional[int], **kwargs):
+        """Call chat.completions.create with quota scheduling and rate limit retries
+
+        Raises:
+            RateLimitError: If rate limited after all retries
+            APIKeyError: If the API key is rejected
+            LLMError: For other API errors
+        """
+        client = self._get_client()
+        max_retries = max_retries or self.max_retries
+        estimated = estimate_tokens(*(m["content"] for m in kwargs["messages"])) + kwargs["max_tokens"]
+
+        for attempt in range(max_retries):
+            try:
+                if self.scheduler is not None:
+                    await self.scheduler.acquire(estimated)
+                response = await client.chat.completions.create(**kwargs)
+                usage = getattr(response, "usage", None)
+                if self.scheduler is not None and usage is not None:
+                    self.scheduler.refund(estimated - usage.total_tokens)
+                return response
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                error_msg = str(e).lower()
+
+                if _is_rate_limit_error(error_msg):
+                    wait_time = _retry_after(e) or 5 * (attempt + 1)
+                    if attempt < max_retries - 1:
+                        if self.scheduler is not None:
+                            # Hold every request sharing the quota, not just this one
+                            self.scheduler.pause(wait_time)
+                        else:
+                            await asyncio.sleep(wait_time)
+                        continue
+                    else:
+                        raise RateLimitError(
+                            f"API rate limit exceeded after {max_retries} retries",
+                            retry_after=60,
+                        )
+
+                if _is_auth_error(error_msg):
+                    raise APIKeyError("Invalid API key")
+
+                raise LLMError(f"Groq API error: {e}")
+
+        raise LLMError("Unexpected error in _create_completion")
+
+    async def get_response(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int = 200,
+        model: Optional[str] = None,
+        max_retries: Optional[int] = None,
+    ) -> str:
+        """Get a response from Groq API
+
+        See GroqClient.get_response.
+        """
+        response = await self._create_completion(
+            max_retries,
+            model=model or self.DEFAULT_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=max_tokens,
+        )
+        return response.choices[0].message.content
+
+    async def get_json_response(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int = 200,
+        model: Optional[str] = None,
+        max_retries: Optional[int] = None,
+    ) -> dict:
+        """Get a JSON object response from Groq API (JSON mode)
+
+        See GroqClient.get_json_response.
+        """
+        response = await self._create_completion(
+            max_retries,
+            model=model or self.DEFAULT_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+        )
+        content = response.choices[0].message.content or ""
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ModelError(f"Model returned invalid JSON: {e}")
+        if not isinstance(data, dict):
+            raise ModelError("Model returned JSON that is not an object")
+        return data
+
+    async def stream_response(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int = 200,
+        model: Optional[str] = None,
+        max_retries: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """Stream a response from Groq API
+
+        See GroqClient.stream_response.
+        """
+        stream = await self._create_completion(
+            max_retries,
+            model=model or self.DEFAULT_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            raise LLMError(f"Groq API stream error: {e}")
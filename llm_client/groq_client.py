@@ -1,10 +1,32 @@
 """Groq API client (from ai_debate_voicevox.py lines 59-86)"""
 
+import json
 import os
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
-from .exceptions import RateLimitError, APIKeyError, LLMError
+from .exceptions import RateLimitError, APIKeyError, LLMError, ModelError
+
+
+def _is_rate_limit_error(error_msg: str) -> bool:
+    """Check whether a lowercased error message indicates rate limiting"""
+    return "rate" in error_msg or "limit" in error_msg or "429" in error_msg
+
+
+def _is_auth_error(error_msg: str) -> bool:
+    """Check whether a lowercased error message indicates an auth problem"""
+    return "auth" in error_msg or "key" in error_msg or "401" in error_msg
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Read the Retry-After header of a rate limit error, if present"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
 
 
 class GroqClient:
@@ -35,51 +57,26 @@ class GroqClient:
             self._client = Groq(api_key=self.api_key)
         return self._client
 
-    def get_response(
-        self,
-        prompt: str,
-        system_prompt: str,
-        max_tokens: int = 200,
-        model: Optional[str] = None,
-        max_retries: int = 3,
-    ) -> str:
-        """Get a response from Groq API
-
-        Args:
-            prompt: User prompt
-            system_prompt: System prompt
-            max_tokens: Maximum tokens in response
-            model: Model to use (defaults to DEFAULT_MODEL)
-            max_retries: Number of retries on rate limit
-
-        Returns:
-            Response text
+    def _create_completion(self, max_retries: int, **kwargs):
+        """Call chat.completions.create with rate limit retries
 
         Raises:
             RateLimitError: If rate limited after all retries
+            APIKeyError: If the API key is rejected
             LLMError: For other API errors
         """
         client = self._get_client()
-        model = model or self.DEFAULT_MODEL
 
         for attempt in range(max_retries):
             try:
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt},
-                    ],
-                    max_tokens=max_tokens,
-                )
-                return response.choices[0].message.content
+                return client.chat.completions.create(**kwargs)
 
             except Exception as e:
                 error_msg = str(e).lower()
 
                 # Check for rate limit errors
-                if "rate" in error_msg or "limit" in error_msg or "429" in error_msg:
-                    wait_time = 5 * (attempt + 1)
+                if _is_rate_limit_error(error_msg):
+                    wait_time = _retry_after(e) or 5 * (attempt + 1)
                     if attempt < max_retries - 1:
                         time.sleep(wait_time)
                         continue
@@ -90,11 +87,122 @@ class GroqClient:
                         )
 
                 # Check for auth errors
-                if "auth" in error_msg or "key" in error_msg or "401" in error_msg:
+                if _is_auth_error(error_msg):
                     raise APIKeyError("Invalid API key")
 
                 # Other errors
                 raise LLMError(f"Groq API error: {e}")
 
         # Should not reach here, but just in case
-        raise LLMError("Unexpected error in get_response")
+        raise LLMError("Unexpected error in _create_completion")
+
+    def get_response(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int = 200,
+        model: Optional[str] = None,
+        max_retries: int = 3,
+    ) -> str:
+        """Get a response from Groq API
+
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt
+            max_tokens: Maximum tokens in response
+            model: Model to use (defaults to DEFAULT_MODEL)
+            max_retries: Number of retries on rate limit
+
+        Returns:
+            Response text
+
+        Raises:
+            RateLimitError: If rate limited after all retries
+            LLMError: For other API errors
+        """
+        response = self._create_completion(
+            max_retries,
+            model=model or self.DEFAULT_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=max_tokens,
+        )
+        return response.choices[0].message.content
+
+    def get_json_response(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int = 200,
+        model: Optional[str] = None,
+        max_retries: int = 3,
+    ) -> dict:
+        """Get a JSON object response from Groq API (JSON mode)
+
+        The prompt must mention JSON and describe the expected object.
+
+        Returns:
+            Decoded JSON object
+
+        Raises:
+            RateLimitError: If rate limited after all retries
+            ModelError: If the model did not return a JSON object
+            LLMError: For other API errors
+        """
+        response = self._create_completion(
+            max_retries,
+            model=model or self.DEFAULT_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+        )
+        content = response.choices[0].message.content or ""
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ModelError(f"Model returned invalid JSON: {e}")
+        if not isinstance(data, dict):
+            raise ModelError("Model returned JSON that is not an object")
+        return data
+
+    def stream_response(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int = 200,
+        model: Optional[str] = None,
+        max_retries: int = 3,
+    ) -> Iterator[str]:
+        """Stream a response from Groq API
+
+        Yields:
+            Text deltas as they arrive
+
+        Raises:
+            RateLimitError: If rate limited after all retries
+            LLMError: For other API errors
+        """
+        stream = self._create_completion(
+            max_retries,
+            model=model or self.DEFAULT_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        except Exception as e:
+            raise LLMError(f"Groq API stream error: {e}")
@@ -0,0 +1,89 @@
+"""Quota scheduler shared by concurrent LLM requests"""
+
+import asyncio
+import time
+
+
+class QuotaScheduler:
+    """Token-bucket scheduler for requests-per-minute and tokens-per-minute quotas
+
+    Every request acquires one request slot and its estimated token cost
+    before it is sent. Allowances refill continuously, so requests are
+    released at exactly the quota rate instead of sleeping in fixed steps.
+    A rate limit response pauses all callers until the server's retry time.
+    """
+
+    def __init__(self, requests_per_minute: int = 30, tokens_per_minute: int = 6000):
+        if requests_per_minute <= 0 or tokens_per_minute <= 0:
+            raise ValueError("Quotas must be positive")
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._request_rate = requests_per_minute / 60.0
+        self._token_rate = tokens_per_minute / 60.0
+        self._request_allowance = float(requests_per_minute)
+        self._token_allowance = float(tokens_per_minute)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Create the lock lazily inside the running event loop"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._request_allowance = min(
+            float(self.requests_per_minute),
+            self._request_allowance + elapsed * self._request_rate,
+        )
+        self._token_allowance = min(
+            float(self.tokens_per_minute),
+            self._token_allowance + elapsed * self._token_rate,
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and `tokens` tokens fit into the quota
+
+        Callers are served in FIFO order.
+
+        Args:
+            tokens: Estimated tokens of the request (prompt + max completion)
+        """
+        tokens = min(tokens, self.tokens_per_minute)
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                wait = self._paused_until - now
+                if wait <= 0:
+                    missing_requests = 1 - self._request_allowance
+                    missing_tokens = tokens - self._token_allowance
+                    if missing_requests <= 0 and missing_tokens <= 0:
+                        self._request_allowance -= 1
+                        self._token_allowance -= tokens
+                        return
+                    wait = max(
+                        missing_requests / self._request_rate,
+                        missing_tokens / self._token_rate,
+                    )
+                await asyncio.sleep(wait)
+
+    def refund(self, tokens: int) -> None:
+        """Return over-estimated tokens once the actual usage is known"""
+        if tokens <= 0:
+            return
+        self._refill(time.monotonic())
+        self._token_allowance = min(float(self.tokens_per_minute), self._token_allowance + tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for `seconds` (after a rate limit response)"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Rough token estimate for Japanese/English prompt text"""
+    return sum(len(text) for text in texts) // 2 + 1
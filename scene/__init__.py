@@ -0,0 +1,17 @@
+"""Scene - Rendering helpers for the Tkinter apps"""
+
+from .background import GradientBackground
+from .frame_clock import FrameClock, DEFAULT_FPS
+from .particles import ParticleSystem, PARTICLE_STEP_SECONDS, parse_color
+from .assets import ImageLoader, scaled_image_key
+
+__all__ = [
+    "GradientBackground",
+    "FrameClock",
+    "DEFAULT_FPS",
+    "ParticleSystem",
+    "PARTICLE_STEP_SECONDS",
+    "parse_color",
+    "ImageLoader",
+    "scaled_image_key",
+]
@@ -0,0 +1,142 @@
+"""Pre-scaled character image loading with an on-disk cache (from the apps' _load_images)"""
+
+import hashlib
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from PIL import Image
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "ai_debate" / "images"
+
+# Bump when the resampling changes, so old variants are not reused
+_CACHE_VERSION = 1
+
+
+def scaled_image_key(source: bytes, size: Tuple[int, int], fit: bool) -> str:
+    """Key identifying one resized variant of an image file
+
+    Args:
+        source: Contents of the source file
+        size: Target size
+        fit: Whether the image is fitted inside `size` (keeping its aspect
+            ratio) rather than stretched to it
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256(source)
+    digest.update(f"|{size[0]}x{size[1]}|{'fit' if fit else 'exact'}|v{_CACHE_VERSION}".encode())
+    return digest.hexdigest()
+
+
+class ImageLoader:
+    """Loads images resized for display, reusing resized copies across launches
+
+    Resizing large PNGs with LANCZOS takes most of an app's startup. The
+    resized result is saved under a key made from the source file's hash
+    and the target size, so later launches only decode a small PNG, and an
+    edited source image is picked up automatically.
+
+    Loading returns PIL images and can run on a background thread;
+    converting to PhotoImage must happen on the Tk thread.
+
+    Example:
+        loader = ImageLoader()
+        future = loader.load_async({"pro_open": path}, size=(280, 280))
+        ...  # later, on the Tk thread
+        images = {key: ImageTk.PhotoImage(img) for key, img in future.result().items()}
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """Initialize the loader
+
+        Args:
+            directory: Cache directory. If not provided, reads IMAGE_CACHE_DIR env var
+                (default ~/.cache/ai_debate/images).
+        """
+        self.directory = Path(directory or os.getenv("IMAGE_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def load(self, path: str, size: Tuple[int, int], fit: bool = True) -> Image.Image:
+        """Load one image resized for display
+
+        Args:
+            path: Source image file
+            size: Target size (a bounding box when `fit` is true)
+            fit: Keep the aspect ratio like `Image.thumbnail` (never enlarges);
+                otherwise resize to exactly `size`
+
+        Returns:
+            The resized image (fully loaded)
+
+        Raises:
+            OSError: If the source cannot be read or decoded
+        """
+        with open(path, "rb") as f:
+            source = f.read()
+        cached = self.directory / f"{scaled_image_key(source, size, fit)}.png"
+
+        try:
+            with Image.open(cached) as img:
+                img.load()
+                return img
+        except OSError:
+            pass  # not cached yet (or an unreadable entry)
+
+        with Image.open(path) as img:
+            img.load()
+            if fit:
+                scaled = img.copy()
+                scaled.thumbnail(size, Image.Resampling.LANCZOS)
+            else:
+                scaled = img.resize(size, Image.Resampling.LANCZOS)
+
+        self._store(cached, scaled)
+        return scaled
+
+    def _store(self, path: Path, img: Image.Image) -> None:
+        # Write to a temp file and rename, so concurrent launches never read a partial file
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                img.save(f, format="PNG", compress_level=1)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # the cache is only an optimization
+
+    def load_all(
+        self,
+        paths: Dict[str, str],
+        size: Tuple[int, int],
+        fit: bool = True,
+    ) -> Dict[str, Image.Image]:
+        """Load several images; missing files are skipped
+
+        Args:
+            paths: Image key -> source file
+            size: Target size
+            fit: See `load`
+
+        Returns:
+            Image key -> resized image
+        """
+        images = {}
+        for key, path in paths.items():
+            if os.path.exists(path):
+                images[key] = self.load(path, size, fit)
+        return images
+
+    def load_async(
+        self,
+        paths: Dict[str, str],
+        size: Tuple[int, int],
+        fit: bool = True,
+    ) -> "Future[Dict[str, Image.Image]]":
+        """Start `load_all` on a background thread"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-loader")
+        return self._executor.submit(self.load_all, paths, size, fit)
@@ -0,0 +1,83 @@
+"""Pre-rendered animated gradient background (from ai_debate_youtube.py _draw_scene)"""
+
+import math
+from typing import Sequence
+
+import numpy as np
+from PIL import Image
+
+Color = Sequence[int]
+
+
+class GradientBackground:
+    """Vertical gradient with a slow sinusoidal colour shimmer
+
+    Row `i` at animation offset `t` has the colour
+
+        top + (bottom - top) * i / height + amplitude * sin(t + i * row_phase + channel_phase)
+
+    One cycle of the animation is computed with NumPy as a small number of
+    frames and each frame is turned into a PhotoImage on first display, so
+    animating costs one `itemconfig` on a single canvas image instead of a
+    canvas line per row.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        top: Color,
+        bottom: Color,
+        amplitude: float = 10.0,
+        row_phase: float = 0.01,
+        channel_phases: Color = (0, 2, 4),
+        frame_count: int = 24,
+    ):
+        """Initialize the background
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            top: RGB colour of the first row
+            bottom: RGB colour of the last row
+            amplitude: Shimmer strength in colour levels
+            row_phase: Shimmer phase change per row (radians)
+            channel_phases: Shimmer phase of the R, G and B channels (radians)
+            frame_count: Frames per animation cycle
+        """
+        self.width = width
+        self.height = height
+        self.frame_count = frame_count
+        self.colors = self._compute_colors(top, bottom, amplitude, row_phase, channel_phases)
+        self._photos: dict = {}
+
+    def _compute_colors(self, top, bottom, amplitude, row_phase, channel_phases):
+        """Row colours of every frame, shape (frame_count, height, 3)"""
+        rows = np.arange(self.height, dtype=np.float32)
+        ratio = rows / self.height
+        base = np.asarray(top, np.float32) + np.outer(ratio, np.subtract(bottom, top).astype(np.float32))
+
+        offsets = np.arange(self.frame_count, dtype=np.float32) * (2 * math.pi / self.frame_count)
+        phase = (offsets[:, None, None] + rows[None, :, None] * row_phase
+                 + np.asarray(channel_phases, np.float32)[None, None, :])
+        colors = base[None] + amplitude * np.sin(phase)
+        # Truncate like int() did per row, then clamp to valid levels
+        return np.clip(np.trunc(colors), 0, 255).astype(np.uint8)
+
+    def frame_index(self, offset: float) -> int:
+        """Frame to show at an animation offset (radians, any range)"""
+        return int(round(offset / (2 * math.pi) * self.frame_count)) % self.frame_count
+
+    def image(self, index: int) -> Image.Image:
+        """One frame as a PIL image"""
+        column = Image.fromarray(np.ascontiguousarray(self.colors[index][:, None, :]), "RGB")
+        return column.resize((self.width, self.height), Image.Resampling.NEAREST)
+
+    def photo(self, offset: float):
+        """PhotoImage for an animation offset (needs a Tk root; cached per frame)"""
+        index = self.frame_index(offset)
+        photo = self._photos.get(index)
+        if photo is None:
+            from PIL import ImageTk
+            photo = self._photos[index] = ImageTk.PhotoImage(self.image(index))
+        return photo
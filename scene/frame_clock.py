@@ -0,0 +1,100 @@
+"""One frame loop for a Tk app (replaces per-animation root.after loops)"""
+
+import time
+from typing import Callable, Optional, Set
+
+DEFAULT_FPS = 30.0
+
+
+class FrameClock:
+    """Ticks at a target frame rate, runs the animation steps, renders once
+
+    Each tick runs every registered step (or those whose interval has
+    elapsed), then calls the render callback once with the layers marked
+    dirty since the previous frame. Nothing is drawn on ticks where no
+    layer changed, and a frame is never drawn twice.
+
+    Steps read `clock.dt` (seconds since the previous tick) to advance
+    time-based animation. When a tick runs late the clock skips ahead
+    instead of firing a burst of catch-up ticks.
+
+    Example:
+        clock = FrameClock(root, fps=30, render=self._render)
+        clock.every(self._process_queue)
+        clock.every(self._update_timer, interval=1.0)
+        clock.start()
+        ...
+        clock.mark_dirty("characters")
+    """
+
+    def __init__(
+        self,
+        root,
+        fps: float = DEFAULT_FPS,
+        render: Optional[Callable[[Set[str]], None]] = None,
+    ):
+        """Initialize the clock
+
+        Args:
+            root: Tk root (or any widget) used for scheduling
+            fps: Target frame rate
+            render: Called with the set of dirty layers, at most once per tick
+        """
+        self.root = root
+        self.period = 1.0 / fps
+        self.render = render
+        self.now = time.monotonic()
+        self.dt = 0.0
+        self.frame_count = 0
+        self._steps: list = []
+        self._dirty: Set[str] = set()
+        self._deadline = 0.0
+        self._after_id = None
+
+    @property
+    def running(self) -> bool:
+        return self._after_id is not None
+
+    def every(self, step: Callable[[], None], interval: Optional[float] = None) -> None:
+        """Run a step on every tick, or at most once per `interval` seconds"""
+        self._steps.append([step, interval, self.now])
+
+    def mark_dirty(self, *layers: str) -> None:
+        """Request a redraw of layers on the next tick"""
+        self._dirty.update(layers)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.now = self._deadline = time.monotonic()
+        self._after_id = self.root.after(0, self._tick)
+
+    def stop(self) -> None:
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        now = time.monotonic()
+        self.dt, self.now = now - self.now, now
+        self.frame_count += 1
+        try:
+            for entry in self._steps:
+                step, interval, last = entry
+                if interval is None or now - last >= interval:
+                    entry[2] = now
+                    step()
+            if self._dirty and self.render is not None:
+                dirty, self._dirty = self._dirty, set()
+                self.render(dirty)
+        finally:
+            if self.running:  # a step may have stopped the clock
+                self._schedule(now)
+
+    def _schedule(self, now: float):
+        self._deadline += self.period
+        if self._deadline < now:
+            # Running behind: drop the missed frames
+            self._deadline = now + self.period
+        delay_ms = max(1, int((self._deadline - time.monotonic()) * 1000))
+        self._after_id = self.root.after(delay_ms, self._tick)
@@ -0,0 +1,155 @@
+"""Vectorized particle effects (from ai_debate_youtube.py Particle)"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+# Particle motion is defined per step of this length (the old 30ms animation tick)
+PARTICLE_STEP_SECONDS = 0.03
+
+
+def parse_color(color: str) -> Tuple[int, int, int]:
+    """Convert "#RRGGBB" (or "#RGB") to an RGB tuple"""
+    value = color.lstrip("#")
+    if len(value) == 3:
+        value = "".join(c * 2 for c in value)
+    if len(value) != 6:
+        raise ValueError(f"Expected a #RRGGBB colour, got {color!r}")
+    return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+
+
+class ParticleSystem:
+    """Fixed-capacity pool of particles stored as NumPy arrays
+
+    Positions, velocities, life, size and colour index live in one array
+    per field, so a frame is a single vectorized update, and the whole
+    effect is composited into one RGBA image instead of a canvas item per
+    particle. Spawning reuses dead slots; nothing is allocated per
+    particle.
+
+    Particles fade out with their remaining life.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        gravity: float = 0.2,
+        decay: float = 0.02,
+        rng: Optional[np.random.Generator] = None,
+    ):
+        """Initialize the pool
+
+        Args:
+            capacity: Maximum number of live particles (extra spawns are dropped)
+            gravity: Downward acceleration in pixels per step per step
+            decay: Life lost per step (particles start at 1.0)
+            rng: Random generator (for reproducible effects)
+        """
+        self.capacity = capacity
+        self.gravity = gravity
+        self.decay = decay
+        self.rng = rng or np.random.default_rng()
+
+        self.position = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color_index = np.zeros(capacity, dtype=np.int32)
+
+        self._palette: list = []
+        self._palette_index: dict = {}
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.life > 0))
+
+    def _color_index(self, color: str) -> int:
+        index = self._palette_index.get(color)
+        if index is None:
+            index = self._palette_index[color] = len(self._palette)
+            self._palette.append(parse_color(color))
+        return index
+
+    def spawn(self, x: float, y: float, color: str, count: int = 20) -> int:
+        """Burst of particles from a point
+
+        Args:
+            x: Emitter x in pixels
+            y: Emitter y in pixels
+            color: "#RRGGBB" or "#RGB" colour
+            count: Number of particles
+
+        Returns:
+            Number of particles actually spawned (limited by free slots)
+        """
+        slots = np.flatnonzero(self.life <= 0)[:count]
+        n = len(slots)
+        if n == 0:
+            return 0
+        self.position[slots] = (x, y)
+        self.velocity[slots, 0] = self.rng.uniform(-3, 3, n)
+        self.velocity[slots, 1] = self.rng.uniform(-5, -1, n)
+        self.life[slots] = 1.0
+        self.size[slots] = self.rng.integers(3, 9, n)
+        self.color_index[slots] = self._color_index(color)
+        return n
+
+    def update(self, dt: float = PARTICLE_STEP_SECONDS) -> None:
+        """Advance all live particles by `dt` seconds"""
+        alive = self.life > 0
+        if not alive.any():
+            return
+        steps = dt / PARTICLE_STEP_SECONDS
+        self.position[alive] += self.velocity[alive] * steps
+        self.velocity[alive, 1] += self.gravity * steps
+        self.life[alive] -= self.decay * steps
+
+    def clear(self) -> None:
+        self.life[:] = 0
+
+    def render(self, width: int, height: int) -> Optional[Tuple[int, int, Image.Image]]:
+        """Composite the live particles into one RGBA image
+
+        Only the bounding box of the particles is rendered.
+
+        Args:
+            width: Width of the visible area (particles outside are clipped)
+            height: Height of the visible area
+
+        Returns:
+            (x, y, image) with the image's top-left corner in scene
+            coordinates, or None if no particle is visible
+        """
+        alive = np.flatnonzero(self.life > 0)
+        if len(alive) == 0:
+            return None
+        centers = np.rint(self.position[alive]).astype(np.int32)
+        radii = self.size[alive]
+
+        x0 = max(0, int((centers[:, 0] - radii).min()))
+        y0 = max(0, int((centers[:, 1] - radii).min()))
+        x1 = min(width, int((centers[:, 0] + radii).max()) + 1)
+        y1 = min(height, int((centers[:, 1] + radii).max()) + 1)
+        if x0 >= x1 or y0 >= y1:
+            return None
+
+        # Every pixel of every particle's bounding square, masked to its disc
+        r = int(radii.max())
+        offsets = np.arange(-r, r + 1, dtype=np.int32)
+        dx, dy = np.meshgrid(offsets, offsets)
+        dx, dy = dx.ravel(), dy.ravel()
+        inside = dx[None, :] ** 2 + dy[None, :] ** 2 <= radii[:, None] ** 2
+        px = centers[:, 0:1] + dx[None, :] - x0
+        py = centers[:, 1:2] + dy[None, :] - y0
+        inside &= (px >= 0) & (px < x1 - x0) & (py >= 0) & (py < y1 - y0)
+
+        palette = np.asarray(self._palette, dtype=np.uint8)
+        rgba = np.empty((len(alive), 4), dtype=np.uint8)
+        rgba[:, :3] = palette[self.color_index[alive]]
+        rgba[:, 3] = np.clip(self.life[alive] * 255, 0, 255).astype(np.uint8)
+
+        pixels = np.zeros((y1 - y0, x1 - x0, 4), dtype=np.uint8)
+        which = np.nonzero(inside)[0]
+        # Later particles are drawn over earlier ones, like stacked canvas items
+        pixels[py[inside], px[inside]] = rgba[which]
+        return x0, y0, Image.fromarray(pixels, "RGBA")
@@ -0,0 +1,33 @@
+"""Tests for debate_core.emotion"""
+
+from debate_core import EmotionClassifier
+
+
+def test_overlapping_keywords_are_all_counted():
+    classifier = EmotionClassifier({"angry": {"ありえない": 1.0}, "happy": {"ない": 0.6, "えな": 0.6}})
+    assert classifier.scores("ありえない") == {"angry": 1.0, "happy": 1.2}
+    assert classifier.classify("ありえない") == "happy"
+
+
+def test_tie_uses_priority():
+    classifier = EmotionClassifier(
+        {"happy": {"いい": 1.0}, "angry": {"違う": 1.0}}, priority=("angry", "happy")
+    )
+    assert classifier.classify("いいけど違う") == "angry"
+
+
+def test_default_when_nothing_matches():
+    classifier = EmotionClassifier()
+    assert classifier.classify("今日は晴れです。") == "normal"
+    assert classifier.classify("今日は晴れです。", default="happy") == "happy"
+
+
+def test_batch_matches_single_classification():
+    classifier = EmotionClassifier()
+    texts = ["まさか！", "", "今日は晴れです。", "それは違う、ありえない", "素晴らしい"]
+    assert classifier.classify_many(texts) == [classifier.classify(text) for text in texts]
+
+
+def test_batch_separator_keeps_keywords_from_spanning_texts():
+    classifier = EmotionClassifier({"surprised": {"本当": 1.0}})
+    assert classifier.classify_many(["本", "当", "本当"]) == ["normal", "normal", "surprised"]
@@ -0,0 +1,42 @@
+"""Tests for debate_core.timeline turn gaps"""
+
+from debate_core import TimelineReader, TimelineWriter
+
+GAP = 0.5
+
+
+def _times(path):
+    return [(event.type, event.t) for event in TimelineReader(str(path))]
+
+
+def test_sentences_of_one_turn_have_no_gap(tmp_path):
+    path = tmp_path / "debate.jsonl"
+    with TimelineWriter(str(path), topic="t", gap=GAP) as timeline:
+        timeline.utterance("pro", "一文目。", turn=1, duration=1.0)
+        timeline.utterance("pro", "二文目。", turn=1, duration=2.0)
+        timeline.utterance("con", "反論です。", turn=2, duration=1.0)
+
+    assert _times(path) == [
+        ("utterance", 0.0),
+        ("utterance", 1.0),
+        ("utterance", 3.0 + GAP),
+        ("end", 4.0 + 2 * GAP),
+    ]
+
+
+def test_gap_before_non_utterance_event(tmp_path):
+    path = tmp_path / "debate.jsonl"
+    with TimelineWriter(str(path), topic="t", gap=GAP) as timeline:
+        timeline.utterance("pro", "発言", turn=1, duration=1.0)
+        timeline.event("verdict", hold=2.0, winner="pro")
+
+    assert _times(path) == [("utterance", 0.0), ("verdict", 1.0 + GAP), ("end", 3.0 + GAP)]
+
+
+def test_utterances_without_turn_each_get_a_gap(tmp_path):
+    path = tmp_path / "debate.jsonl"
+    with TimelineWriter(str(path), topic="t", gap=GAP) as timeline:
+        timeline.utterance("judge", "一つ目", duration=1.0)
+        timeline.utterance("judge", "二つ目", duration=1.0)
+
+    assert _times(path) == [("utterance", 0.0), ("utterance", 1.0 + GAP), ("end", 2.0 + 2 * GAP)]
@@ -0,0 +1,38 @@
+"""Tests for debate_core.verdict.parse_verdict"""
+
+import pytest
+
+from debate_core import JUDGE_CRITERIA, VerdictFormatError, parse_verdict
+
+
+def _verdict(pro_score, con_score, **extra):
+    return {
+        "scores": {
+            "pro": {criterion: pro_score for criterion in JUDGE_CRITERIA},
+            "con": {criterion: con_score for criterion in JUDGE_CRITERIA},
+        },
+        **extra,
+    }
+
+
+def test_higher_total_wins_over_judge_winner():
+    result = parse_verdict(_verdict(10, 15, winner="pro"), "さくら", "あおい")
+    assert result.winner == "con"
+    assert result.winner_name == "あおい"
+
+
+@pytest.mark.parametrize("winner", ["con", "あおい"])
+def test_judge_winner_breaks_tie(winner):
+    result = parse_verdict(_verdict(12, 12, winner=winner), "さくら", "あおい")
+    assert result.winner == "con"
+
+
+@pytest.mark.parametrize("extra", [{}, {"winner": "draw"}, {"winner": None}])
+def test_tie_without_valid_winner_goes_to_pro(extra):
+    result = parse_verdict(_verdict(12, 12, **extra), "さくら", "あおい")
+    assert result.winner == "pro"
+
+
+def test_out_of_range_score_is_rejected():
+    with pytest.raises(VerdictFormatError):
+        parse_verdict(_verdict(999, 10), "さくら", "あおい")
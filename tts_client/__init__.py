@@ -0,0 +1,18 @@
+"""TTS Client - Speech synthesis engine clients"""
+
+from .exceptions import TTSError, EngineUnavailableError
+from .voicevox import VoicevoxClient
+from .system import SystemTTS
+from .cache import AudioCache, cache_key
+from .pipeline import SpeechStream, synthesize_sentences
+
+__all__ = [
+    "TTSError",
+    "EngineUnavailableError",
+    "VoicevoxClient",
+    "SystemTTS",
+    "AudioCache",
+    "cache_key",
+    "SpeechStream",
+    "synthesize_sentences",
+]
@@ -0,0 +1,143 @@
+"""Content-addressed on-disk cache of synthesized audio"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "ai_debate" / "tts"
+DEFAULT_MAX_MB = 500
+ENGINE_VERSION_FILE = "engine_version"
+
+
+def cache_key(text: str, speaker_id: int, params: dict, engine_version: str) -> str:
+    """Key identifying one synthesized utterance
+
+    Args:
+        text: Text that was read
+        speaker_id: Engine style ID
+        params: Synthesis parameters (speed, pitch, ...)
+        engine_version: Engine version, so upgrades don't serve stale audio
+
+    Returns:
+        Hex digest
+    """
+    payload = json.dumps(
+        {"text": text, "speaker": speaker_id, "params": params, "engine": engine_version},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """Size-bounded LRU cache of WAV files on disk
+
+    Entries are files named by their key. Reading an entry refreshes its
+    mtime, and when the cache grows past `max_bytes` the least recently
+    used files are deleted down to 90% of the limit.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        """Initialize the cache
+
+        Args:
+            directory: Cache directory. If not provided, reads TTS_CACHE_DIR env var
+                (default ~/.cache/ai_debate/tts).
+            max_bytes: Size limit. If not provided, reads TTS_CACHE_MAX_MB env var
+                (default 500MB).
+        """
+        self.directory = Path(directory or os.getenv("TTS_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        if max_bytes is None:
+            max_bytes = int(os.getenv("TTS_CACHE_MAX_MB", str(DEFAULT_MAX_MB))) * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._total_bytes = sum(path.stat().st_size for path in self._entries())
+
+    def _entries(self):
+        return self.directory.glob("*.wav")
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.wav"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio, or None on a miss"""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store audio, evicting least recently used entries if needed"""
+        path = self._path(key)
+        # Write to a temp file and rename, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+
+        with self._lock:
+            try:
+                self._total_bytes -= path.stat().st_size
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, path)
+            self._total_bytes += len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries down to 90% of the limit"""
+        target = self.max_bytes * 0.9
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        self._total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._total_bytes <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            self._total_bytes -= size
+
+    def load_engine_version(self) -> Optional[str]:
+        """Engine version recorded by the last client that reached the engine"""
+        try:
+            return (self.directory / ENGINE_VERSION_FILE).read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    def save_engine_version(self, version: str) -> None:
+        """Record the engine version, so keys can be built while the engine is down"""
+        if version == self.load_engine_version():
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(version)
+        os.replace(tmp_path, self.directory / ENGINE_VERSION_FILE)
+
+    def clear(self) -> None:
+        """Delete every entry"""
+        with self._lock:
+            for path in self._entries():
+                path.unlink(missing_ok=True)
+            self._total_bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Current size of the cache"""
+        return self._total_bytes
@@ -0,0 +1,13 @@
+"""Exceptions for TTS client"""
+
+
+class TTSError(Exception):
+    """Base exception for speech synthesis errors"""
+    pass
+
+
+class EngineUnavailableError(TTSError):
+    """Raised when the TTS engine cannot be reached"""
+
+    def __init__(self, message: str = "TTS engine is not reachable"):
+        super().__init__(message)
@@ -0,0 +1,90 @@
+"""OS speech synthesizer client (from ai_debate_gui.py / character_window.py `say` calls)"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Optional
+
+from .exceptions import TTSError, EngineUnavailableError
+
+
+class SystemTTS:
+    """Offline speech through the OS synthesizer, returned as WAV bytes
+
+    Uses `say` on macOS and `espeak-ng` (or `espeak`) elsewhere. macOS
+    voice names such as "Kyoko" only exist for `say`; espeak uses the
+    ESPEAK_VOICE env var (default "ja") for every speaker.
+    """
+
+    def __init__(self, command: Optional[str] = None, espeak_voice: Optional[str] = None):
+        """Initialize the client
+
+        Args:
+            command: Synthesizer to use ("say", "espeak-ng" or "espeak").
+                Detected from PATH if not provided.
+            espeak_voice: espeak voice. If not provided, reads ESPEAK_VOICE env var.
+        """
+        self.command = command or self._detect_command()
+        self.espeak_voice = espeak_voice or os.getenv("ESPEAK_VOICE", "ja")
+
+    @staticmethod
+    def _detect_command() -> Optional[str]:
+        candidates = ("say",) if sys.platform == "darwin" else ("espeak-ng", "espeak", "say")
+        for command in candidates:
+            if shutil.which(command):
+                return command
+        return None
+
+    def is_available(self) -> bool:
+        """Check whether a synthesizer was found"""
+        return self.command is not None
+
+    def synthesize(self, text: str, voice: Optional[str] = None, rate: int = 150) -> bytes:
+        """Synthesize text to WAV
+
+        Args:
+            text: Text to read
+            voice: `say` voice name (ignored by espeak)
+            rate: Words per minute
+
+        Returns:
+            WAV file contents
+
+        Raises:
+            EngineUnavailableError: If no synthesizer is installed
+            TTSError: If synthesis fails
+        """
+        if self.command is None:
+            raise EngineUnavailableError("No system speech synthesizer (say/espeak-ng) found")
+
+        if self.command == "say":
+            return self._synthesize_say(text, voice, rate)
+
+        try:
+            # espeak writes a WAV stream to stdout, so nothing touches the disk
+            result = subprocess.run(
+                [self.command, "-v", self.espeak_voice, "-s", str(rate), "--stdout", text],
+                capture_output=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise TTSError(f"{self.command} failed: {e}")
+        return result.stdout
+
+    def _synthesize_say(self, text: str, voice: Optional[str], rate: int) -> bytes:
+        # say can only write to a file; ask for 16-bit PCM WAV so it plays from memory
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            path = f.name
+        command = ["say", "-r", str(rate), "--file-format=WAVE", "--data-format=LEI16@22050", "-o", path, text]
+        if voice:
+            command[1:1] = ["-v", voice]
+        try:
+            subprocess.run(command, capture_output=True, check=True)
+            with open(path, "rb") as f:
+                return f.read()
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise TTSError(f"say failed: {e}")
+        finally:
+            os.remove(path)
@@ -0,0 +1,164 @@
+"""VOICEVOX engine client (from ai_debate_voicevox.py speak_voicevox)"""
+
+import os
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import AudioCache, cache_key
+from .exceptions import TTSError, EngineUnavailableError
+
+DEFAULT_URL = "http://localhost:50021"
+
+
+class VoicevoxClient:
+    """Client for a VOICEVOX engine
+
+    All requests go through one pooled `requests.Session`, so the two round
+    trips per utterance (/audio_query and /synthesis) reuse a kept-alive
+    connection instead of opening a new one each time. The session is
+    shared by the apps' worker threads.
+
+    With an AudioCache, repeated lines (fixed announcements, judge intros)
+    are served from disk without calling the engine at all. The engine
+    version that is part of each cache key is persisted beside the cache,
+    so cached lines still play while the engine is down.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        connect_timeout: float = 2.0,
+        read_timeout: float = 60.0,
+        retries: int = 2,
+        pool_size: int = 8,
+        cache: Optional[AudioCache] = None,
+    ):
+        """Initialize the VOICEVOX client
+
+        Args:
+            base_url: Engine URL. If not provided, reads VOICEVOX_URL env var
+                (default http://localhost:50021).
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait for a response (synthesis is slow on CPU)
+            retries: Retries on connection errors and 502/503/504 responses
+            pool_size: Kept-alive connections per engine
+            cache: Audio cache consulted before synthesis (optional)
+        """
+        self.base_url = (base_url or os.getenv("VOICEVOX_URL") or DEFAULT_URL).rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache
+        self._engine_version: Optional[str] = None
+        self._session = requests.Session()
+
+        # audio_query/synthesis have no side effects, so POST is safe to retry
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def _request(self, method: str, path: str, timeout=None, **kwargs) -> requests.Response:
+        """Send a request to the engine
+
+        Raises:
+            EngineUnavailableError: If the engine cannot be reached
+            TTSError: If the engine returns an error
+        """
+        try:
+            response = self._session.request(
+                method, f"{self.base_url}{path}", timeout=timeout or self.timeout, **kwargs
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise EngineUnavailableError(f"VOICEVOX is not reachable at {self.base_url}: {e}")
+        except requests.RequestException as e:
+            raise TTSError(f"VOICEVOX request failed: {e}")
+
+        if response.status_code >= 400:
+            raise TTSError(f"VOICEVOX {path} returned {response.status_code}: {response.text[:200]}")
+        return response
+
+    def is_available(self) -> bool:
+        """Check whether the engine is running"""
+        try:
+            self._request("GET", "/version", timeout=(self.timeout[0], 2.0))
+            return True
+        except TTSError:
+            return False
+
+    def version(self) -> str:
+        """Engine version string (fetched once per client)"""
+        if self._engine_version is None:
+            self._engine_version = self._request("GET", "/version").json()
+            if self.cache is not None:
+                self.cache.save_engine_version(self._engine_version)
+        return self._engine_version
+
+    def _cache_version(self) -> str:
+        """Engine version for cache keys, falling back to the last one seen
+
+        Raises:
+            EngineUnavailableError: If the engine is down and no version was ever recorded
+        """
+        try:
+            return self.version()
+        except EngineUnavailableError:
+            version = self.cache.load_engine_version()
+            if version is None:
+                raise
+            return version
+
+    def audio_query(self, text: str, speaker_id: int) -> dict:
+        """Create an audio query (accent phrases and prosody) for text"""
+        return self._request(
+            "POST", "/audio_query", params={"text": text, "speaker": speaker_id}
+        ).json()
+
+    def synthesis(self, query: dict, speaker_id: int) -> bytes:
+        """Render an audio query to WAV bytes"""
+        return self._request(
+            "POST", "/synthesis", params={"speaker": speaker_id}, json=query
+        ).content
+
+    def synthesize(self, text: str, speaker_id: int, speed_scale: float = 1.0, **params) -> bytes:
+        """Synthesize text to WAV bytes
+
+        Args:
+            text: Text to read
+            speaker_id: VOICEVOX style ID
+            speed_scale: Speaking speed (1.0 = normal)
+            **params: Other audio query fields to override (e.g. pitchScale)
+
+        Returns:
+            WAV file contents
+
+        Raises:
+            EngineUnavailableError: If the engine cannot be reached
+            TTSError: If the engine returns an error
+        """
+        params = {"speedScale": speed_scale, **params}
+
+        key = None
+        if self.cache is not None:
+            key = cache_key(text, speaker_id, params, self._cache_version())
+            audio = self.cache.get(key)
+            if audio is not None:
+                return audio
+
+        query = self.audio_query(text, speaker_id)
+        query.update(params)
+        audio = self.synthesis(query, speaker_id)
+
+        if key is not None:
+            self.cache.put(key, audio)
+        return audio
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self._session.close()
@@ -17,14 +17,11 @@ class DebateAPI {
     }
 
     /**
-     * Make an API request
-     * @param {string} endpoint - API endpoint
-     * @param {Object} options - Fetch options
-     * @returns {Promise<Object>} Response data
+     * Build request headers
+     * @private
+     * @returns {Object} Headers
      */
-    async request(endpoint, options = {}) {
-        const url = `${this.baseUrl}${endpoint}`;
-
+    _buildHeaders() {
         const headers = {
             'Content-Type': 'application/json',
         };
@@ -34,6 +31,19 @@ class DebateAPI {
             headers['X-API-Key'] = this.apiKey;
         }
 
+        return headers;
+    }
+
+    /**
+     * Make an API request
+     * @param {string} endpoint - API endpoint
+     * @param {Object} options - Fetch options
+     * @returns {Promise<Object>} Response data
+     */
+    async request(endpoint, options = {}) {
+        const url = `${this.baseUrl}${endpoint}`;
+        const headers = this._buildHeaders();
+
         const defaultOptions = {
             headers,
         };
@@ -119,6 +129,218 @@ class DebateAPI {
             body: JSON.stringify({ session_id: sessionId }),
         });
     }
+
+    /**
+     * Get judge evaluation as a stream (scores first, then commentary)
+     * @param {string} sessionId - Session ID
+     * @param {Object} handlers - Event handlers
+     * @param {Function} handlers.onVerdict - Called with scores and winner
+     * @param {Function} handlers.onCommentary - Called with each commentary delta
+     * @param {number} handlers.ensembleSize - Number of judges (optional, 2-5)
+     * @returns {Promise<Object>} Final judge result (same shape as judgeDebate)
+     */
+    async judgeDebateStream(sessionId, { onVerdict = null, onCommentary = null, ensembleSize = null } = {}) {
+        const body = { session_id: sessionId };
+        if (ensembleSize) body.ensemble_size = ensembleSize;
+
+        let response;
+        try {
+            response = await fetch(`${this.baseUrl}/debate/judge/stream`, {
+                method: 'POST',
+                headers: this._buildHeaders(),
+                body: JSON.stringify(body),
+            });
+        } catch (error) {
+            const networkError = new Error('ネットワークエラーが発生しました');
+            networkError.status = 0;
+            throw networkError;
+        }
+
+        if (!response.ok) {
+            const errorData = await response.json().catch(() => ({}));
+            const error = new Error(errorData.detail || `HTTP ${response.status}`);
+            error.status = response.status;
+            error.data = errorData;
+            throw error;
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let result = null;
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+
+            // Server-sent events are separated by a blank line
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const event = this._parseSSE(buffer.slice(0, boundary));
+                buffer = buffer.slice(boundary + 2);
+
+                if (event.type === 'verdict' && onVerdict) {
+                    onVerdict(event.data);
+                } else if (event.type === 'commentary' && onCommentary) {
+                    onCommentary(event.data.delta);
+                } else if (event.type === 'done') {
+                    result = event.data;
+                } else if (event.type === 'error') {
+                    throw new Error(event.data.detail);
+                }
+            }
+        }
+
+        if (!result) {
+            throw new Error('判定の受信が途中で終了しました');
+        }
+        return result;
+    }
+
+    /**
+     * Parse a single server-sent event block
+     * @private
+     * @param {string} block - Raw event text
+     * @returns {Object} Event type and decoded data
+     */
+    _parseSSE(block) {
+        let type = 'message';
+        const dataLines = [];
+        block.split('\n').forEach(line => {
+            if (line.startsWith('event:')) {
+                type = line.slice(6).trim();
+            } else if (line.startsWith('data:')) {
+                dataLines.push(line.slice(5).trim());
+            }
+        });
+        return { type, data: dataLines.length ? JSON.parse(dataLines.join('\n')) : null };
+    }
+}
+
+/**
+ * WebSocket channel for a whole debate (start/turn/pause/judge over one connection)
+ */
+class DebateSocket {
+    constructor(baseUrl = '') {
+        const httpUrl = baseUrl || window.location.origin;
+        this.url = httpUrl.replace(/^http/, 'ws') + '/debate/ws';
+        this.ws = null;
+        // Requests awaiting an answer, in order (the server handles commands sequentially)
+        this.pending = []; // [{ expects, resolve, reject, handlers }]
+    }
+
+    /**
+     * Open the connection
+     * @returns {Promise<void>} Resolves when connected
+     */
+    connect() {
+        return new Promise((resolve, reject) => {
+            this.ws = new WebSocket(this.url);
+            this.ws.onopen = () => resolve();
+            this.ws.onerror = () => reject(new Error('WebSocket接続に失敗しました'));
+            this.ws.onmessage = (event) => this._onMessage(JSON.parse(event.data));
+            this.ws.onclose = () => {
+                this.pending.forEach(p => p.reject(new Error('接続が切断されました')));
+                this.pending = [];
+            };
+        });
+    }
+
+    /**
+     * Whether the connection is open
+     * @returns {boolean}
+     */
+    isOpen() {
+        return this.ws !== null && this.ws.readyState === WebSocket.OPEN;
+    }
+
+    /**
+     * Send a command and wait for the message type that answers it
+     * @private
+     */
+    _request(command, expects, handlers = {}) {
+        return new Promise((resolve, reject) => {
+            this.pending.push({ expects, resolve, reject, handlers });
+            this.ws.send(JSON.stringify(command));
+        });
+    }
+
+    /**
+     * Dispatch a server message
+     * @private
+     * @param {Object} message - Decoded message
+     */
+    _onMessage(message) {
+        const pending = this.pending[0];
+        if (!pending) return;
+
+        if (message.type === 'error') {
+            this.pending.shift();
+            pending.reject(new Error(message.detail));
+        } else if (message.type === pending.expects) {
+            this.pending.shift();
+            pending.resolve(message);
+        } else if (message.type === 'token' && pending.handlers.onToken) {
+            pending.handlers.onToken(message.delta, message.role);
+        } else if (message.type === 'verdict' && pending.handlers.onVerdict) {
+            pending.handlers.onVerdict(message);
+        } else if (message.type === 'commentary' && pending.handlers.onCommentary) {
+            pending.handlers.onCommentary(message.delta);
+        }
+    }
+
+    /**
+     * Start a new debate
+     * @param {string} topic - Debate topic
+     * @param {string} apiKey - Groq API key
+     * @returns {Promise<Object>} Session info
+     */
+    start(topic, apiKey) {
+        return this._request({ type: 'start', topic, api_key: apiKey }, 'started');
+    }
+
+    /**
+     * Request the next turn (often already prefetched by the server)
+     * @param {Object} handlers - { onToken(delta, role) }
+     * @returns {Promise<Object>} Turn result
+     */
+    requestTurn(handlers = {}) {
+        return this._request({ type: 'turn' }, 'turn', handlers);
+    }
+
+    /**
+     * Stop prefetching turns
+     */
+    pause() {
+        if (this.isOpen()) this.ws.send(JSON.stringify({ type: 'pause' }));
+    }
+
+    /**
+     * Resume prefetching turns
+     */
+    resume() {
+        if (this.isOpen()) this.ws.send(JSON.stringify({ type: 'resume' }));
+    }
+
+    /**
+     * Judge the debate
+     * @param {Object} handlers - { onVerdict(verdict), onCommentary(delta) }
+     * @returns {Promise<Object>} Judge result
+     */
+    judge(handlers = {}) {
+        return this._request({ type: 'judge' }, 'judged', handlers);
+    }
+
+    /**
+     * Close the connection
+     */
+    close() {
+        if (this.ws) {
+            this.ws.close();
+            this.ws = null;
+        }
+    }
 }
 
 // Export singleton instance
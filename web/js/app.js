@@ -8,8 +8,9 @@ class DebateApp {
         this.isDebating = false;
         this.turnCount = 0;
         this.currentSpeaker = null;
-        this.mouthAnimationInterval = null;
+        this.mouthAnimationFrame = null;
         this.autoPlay = true; // 自動進行フラグ
+        this.socket = null; // WebSocketチャンネル（使えない場合はHTTP）
 
         // DOM elements
         this.elements = {
@@ -41,6 +42,7 @@ class DebateApp {
         this._bindEvents();
         this._initSpeechSettings();
         this._initApiKey();
+        assetManager.ready.then(() => this._initAvatars());
     }
 
     /**
@@ -185,20 +187,67 @@ class DebateApp {
      * @param {boolean} speaking - Whether currently speaking
      */
     _updateSpeakingState(speaking) {
-        const proImg = document.getElementById('pro-img');
-        const conImg = document.getElementById('con-img');
-
         if (speaking && this.currentSpeaker) {
             // Start mouth animation
             this._startMouthAnimation();
         } else {
             // Stop mouth animation, show closed mouth
             this._stopMouthAnimation();
-            if (proImg) proImg.src = '/assets/pro_closed.png';
-            if (conImg) conImg.src = '/assets/con_closed.png';
+            this._showClosedMouths();
+        }
+    }
+
+    /**
+     * Load the avatar sprite sheets (or the raw images without a build)
+     * @private
+     */
+    _initAvatars() {
+        // 非表示中は幅が0になるのでCSSの既定サイズを使う
+        const width = this.elements.proAvatar.clientWidth || 120;
+        this.avatars = {};
+
+        for (const role of ['pro', 'con']) {
+            const el = document.getElementById(`${role}-img`);
+            const sprite = assetManager.sprite(`assets/${role}`, width);
+            if (sprite) {
+                // 全フレームを1枚の画像にまとめ、表示位置だけを切り替える
+                el.style.backgroundImage = `url("${sprite.url}")`;
+                el.style.backgroundSize = `${sprite.frames.length * 100}% auto`;
+            }
+            this.avatars[role] = { el, frames: sprite ? sprite.frames : null };
+            this._setMouth(role, false);
         }
     }
 
+    /**
+     * Show the open or closed mouth frame of an avatar
+     * @private
+     * @param {string} role - 'pro' or 'con'
+     * @param {boolean} open - Whether the mouth is open
+     */
+    _setMouth(role, open) {
+        const avatar = this.avatars && this.avatars[role];
+        if (!avatar) return;
+
+        const mouth = open ? 'open' : 'closed';
+        if (avatar.frames) {
+            const index = avatar.frames.indexOf(mouth);
+            const x = (index / (avatar.frames.length - 1)) * 100;
+            avatar.el.style.backgroundPosition = `${x}% 50%`;
+        } else {
+            avatar.el.style.backgroundImage = `url("/assets/${role}_${mouth}.png")`;
+        }
+    }
+
+    /**
+     * Show closed mouths on both avatars
+     * @private
+     */
+    _showClosedMouths() {
+        this._setMouth('pro', false);
+        this._setMouth('con', false);
+    }
+
     /**
      * Start mouth animation loop
      * @private
@@ -207,25 +256,29 @@ class DebateApp {
         // 既存のアニメーションを停止
         this._stopMouthAnimation();
 
-        const proImg = document.getElementById('pro-img');
-        const conImg = document.getElementById('con-img');
-        let mouthOpen = false;
-
         // 話していない方は常に閉じた口
-        if (this.currentSpeaker === 'pro' && conImg) {
-            conImg.src = '/assets/con_closed.png';
-        } else if (this.currentSpeaker === 'con' && proImg) {
-            proImg.src = '/assets/pro_closed.png';
-        }
+        this._showClosedMouths();
 
-        this.mouthAnimationInterval = setInterval(() => {
-            mouthOpen = !mouthOpen;
-            if (this.currentSpeaker === 'pro' && proImg) {
-                proImg.src = mouthOpen ? '/assets/pro_open.png' : '/assets/pro_closed.png';
-            } else if (this.currentSpeaker === 'con' && conImg) {
-                conImg.src = mouthOpen ? '/assets/con_open.png' : '/assets/con_closed.png';
+        const role = this.currentSpeaker;
+        let mouthOpen = false;
+        let lastSwitch = 0;
+
+        const step = (now) => {
+            // サーバー音声なら波形から求めた口の開きに合わせ、なければ一定間隔で開閉
+            const synced = speechManager.mouthOpen();
+            if (synced !== null) {
+                if (synced !== mouthOpen) {
+                    mouthOpen = synced;
+                    this._setMouth(role, mouthOpen);
+                }
+            } else if (now - lastSwitch >= 120) { // 口パクの速度（少し速く）
+                lastSwitch = now;
+                mouthOpen = !mouthOpen;
+                this._setMouth(role, mouthOpen);
             }
-        }, 120); // 口パクの速度（少し速く）
+            this.mouthAnimationFrame = requestAnimationFrame(step);
+        };
+        this.mouthAnimationFrame = requestAnimationFrame(step);
     }
 
     /**
@@ -233,9 +286,9 @@ class DebateApp {
      * @private
      */
     _stopMouthAnimation() {
-        if (this.mouthAnimationInterval) {
-            clearInterval(this.mouthAnimationInterval);
-            this.mouthAnimationInterval = null;
+        if (this.mouthAnimationFrame) {
+            cancelAnimationFrame(this.mouthAnimationFrame);
+            this.mouthAnimationFrame = null;
         }
     }
 
@@ -285,6 +338,53 @@ class DebateApp {
 
         this.elements.debateLog.appendChild(entry);
         this.elements.debateLog.scrollTop = this.elements.debateLog.scrollHeight;
+        return entry;
+    }
+
+    /**
+     * Add a score table entry for a structured verdict
+     * @private
+     * @param {Object} verdict - Verdict with scores, totals and winner
+     */
+    _addScoreEntry(verdict) {
+        const entry = this._addLogEntry('scores', '📊 採点結果', '');
+        const names = {
+            pro: this.elements.proName.textContent,
+            con: this.elements.conName.textContent,
+        };
+        const criteria = Object.keys(verdict.scores.pro);
+
+        const table = document.createElement('table');
+        table.className = 'score-table';
+
+        const header = table.insertRow();
+        ['', ...criteria, '合計'].forEach(label => {
+            const th = document.createElement('th');
+            th.textContent = label;
+            header.appendChild(th);
+        });
+
+        ['pro', 'con'].forEach(role => {
+            const row = table.insertRow();
+            row.className = role + (verdict.winner === role ? ' winner' : '');
+            row.insertCell().textContent = (verdict.winner === role ? '🏆 ' : '') + names[role];
+            criteria.forEach(c => {
+                row.insertCell().textContent = verdict.scores[role][c];
+            });
+            row.insertCell().textContent = verdict.totals[role];
+        });
+
+        entry.querySelector('.log-text').appendChild(table);
+
+        // Judge ensemble: show how the judges voted
+        if (verdict.votes) {
+            const votes = document.createElement('div');
+            votes.className = 'score-votes';
+            const total = verdict.votes.pro + verdict.votes.con;
+            votes.textContent = `審判${total}人中${verdict.votes[verdict.winner]}人が${names[verdict.winner]}さんを支持`;
+            entry.querySelector('.log-text').appendChild(votes);
+        }
+        this.elements.debateLog.scrollTop = this.elements.debateLog.scrollHeight;
     }
 
     /**
@@ -336,7 +436,7 @@ class DebateApp {
         this._setLoading(true, 'ディベートを開始しています...');
 
         try {
-            const response = await debateAPI.startDebate(topic);
+            const response = await this._startSession(topic, apiKey);
 
             this.sessionId = response.session_id;
             this.isDebating = true;
@@ -368,6 +468,37 @@ class DebateApp {
         }
     }
 
+    /**
+     * Start a session over WebSocket, falling back to HTTP
+     * @private
+     * @param {string} topic - Debate topic
+     * @param {string} apiKey - Groq API key
+     * @returns {Promise<Object>} Session info
+     */
+    async _startSession(topic, apiKey) {
+        this._closeSocket();
+        const socket = new DebateSocket();
+        try {
+            await socket.connect();
+        } catch (error) {
+            // WebSocket unavailable (proxy etc.): use per-turn HTTP requests
+            return debateAPI.startDebate(topic);
+        }
+        this.socket = socket;
+        return socket.start(topic, apiKey);
+    }
+
+    /**
+     * Close the WebSocket channel if open
+     * @private
+     */
+    _closeSocket() {
+        if (this.socket) {
+            this.socket.close();
+            this.socket = null;
+        }
+    }
+
     /**
      * Toggle pause/resume
      */
@@ -375,10 +506,12 @@ class DebateApp {
         this.autoPlay = !this.autoPlay;
         if (this.autoPlay) {
             this.elements.stopBtn.textContent = '⏸ 一時停止';
+            if (this.socket) this.socket.resume();
             // Resume debate loop
             this._runDebateLoop();
         } else {
             this.elements.stopBtn.textContent = '▶ 再開';
+            if (this.socket) this.socket.pause();
             speechManager.stop();
         }
     }
@@ -406,20 +539,45 @@ class DebateApp {
         this._setLoading(true);
 
         try {
-            const response = await debateAPI.debateTurn(this.sessionId);
+            let entryText = null;
+            let response;
+
+            if (this.socket && this.socket.isOpen()) {
+                // Tokens are streamed into the log entry as they arrive
+                response = await this.socket.requestTurn({
+                    onToken: (delta, role) => {
+                        if (!entryText) {
+                            this._setLoading(false);
+                            this._setActiveCharacter(role);
+                            const name = role === 'pro'
+                                ? this.elements.proName.textContent
+                                : this.elements.conName.textContent;
+                            entryText = this._addLogEntry(role, name, '').querySelector('.log-text');
+                        }
+                        entryText.textContent += delta;
+                        this.elements.debateLog.scrollTop = this.elements.debateLog.scrollHeight;
+                    },
+                });
+            } else {
+                response = await debateAPI.debateTurn(this.sessionId);
+            }
 
             this.turnCount = response.turn_number;
 
             // Update UI
             this._setActiveCharacter(response.speaker.role);
-            this._addLogEntry(
-                response.speaker.role,
-                response.speaker.name,
-                response.text
-            );
+            if (entryText) {
+                entryText.textContent = response.text;
+            } else {
+                this._addLogEntry(
+                    response.speaker.role,
+                    response.speaker.name,
+                    response.text
+                );
+            }
 
             // Speak the text
-            await speechManager.speak(response.text);
+            await speechManager.speak(response.text, response.speaker.role);
 
             // Enable judge after 2+ turns
             if (this.turnCount >= 2) {
@@ -451,16 +609,32 @@ class DebateApp {
         this._setLoading(true, 'ジャッジ中...');
 
         try {
-            const response = await debateAPI.judgeDebate(this.sessionId);
-
             // Add system message
             this._addLogEntry('system', null, '⚖️ ジャッジタイム！');
 
-            // Add judge result
-            this._addLogEntry('judge', '👩‍⚖️ ジャッジ', response.verdict.text);
+            // Scores arrive first, then the commentary is streamed into the judge entry
+            let judgeText = null;
+            const handlers = {
+                onVerdict: (verdict) => {
+                    this._addScoreEntry(verdict);
+                    this._setLoading(true, '講評中...');
+                },
+                onCommentary: (delta) => {
+                    if (!judgeText) {
+                        const entry = this._addLogEntry('judge', '👩‍⚖️ ジャッジ', '');
+                        judgeText = entry.querySelector('.log-text');
+                    }
+                    judgeText.textContent += delta;
+                    this.elements.debateLog.scrollTop = this.elements.debateLog.scrollHeight;
+                },
+            };
+            const response = this.socket && this.socket.isOpen()
+                ? await this.socket.judge(handlers)
+                : await debateAPI.judgeDebateStream(this.sessionId, handlers);
+            this._setLoading(false);
 
             // Speak the verdict
-            await speechManager.speak(response.verdict.text);
+            await speechManager.speak(response.verdict.text, 'judge');
 
             this._setActiveCharacter(null);
 
@@ -482,6 +656,7 @@ class DebateApp {
     reset() {
         speechManager.stop();
         this._stopMouthAnimation();
+        this._closeSocket();
 
         this.sessionId = null;
         this.isDebating = false;
@@ -496,10 +671,7 @@ class DebateApp {
         this._setActiveCharacter(null);
 
         // Reset images to closed mouth
-        const proImg = document.getElementById('pro-img');
-        const conImg = document.getElementById('con-img');
-        if (proImg) proImg.src = '/assets/pro_closed.png';
-        if (conImg) conImg.src = '/assets/con_closed.png';
+        this._showClosedMouths();
     }
 }
 
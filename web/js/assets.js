@@ -0,0 +1,112 @@
+/**
+ * Build manifest lookup for optimized image variants (web/dist)
+ */
+
+// 1x1 AVIF used to detect decoder support
+const AVIF_PROBE = 'data:image/avif;base64,AAAAIGZ0eXBhdmlmAAAAAGF2aWZtaWYxbWlhZk1BMUIAAAGGbWV0YQAAAAAAAAAhaGRscgAAAAAAAAAAcGljdAAAAAAAAAAAAAAAAAAAAAAOcGl0bQAAAAAAAQAAACxpbG9jAAAAAEQAAAIAAQAAAAEAAAHCAAAAIwACAAAAAQAAAa4AAAAUAAAAQmlpbmYAAAAAAAIAAAAaaW5mZQIAAAAAAQAAYXYwMUNvbG9yAAAAABppbmZlAgAAAAACAABhdjAxQWxwaGEAAAAAGmlyZWYAAAAAAAAADmF1eGwAAgABAAEAAADDaXBycAAAAJ1pcGNvAAAAFGlzcGUAAAAAAAAAAQAAAAEAAAAQcGl4aQAAAAADCAgIAAAADGF2MUOBAAwAAAAAE2NvbHJuY2x4AAEADQAGgAAAAA5waXhpAAAAAAEIAAAADGF2MUOBABwAAAAAOGF1eEMAAAAAdXJuOm1wZWc6bXBlZ0I6Y2ljcDpzeXN0ZW1zOmF1eGlsaWFyeTphbHBoYQAAAAAeaXBtYQAAAAAAAAACAAEEAQKDBAACBAEFhgcAAAA/bWRhdBIACgQYAAYVMgoUAAwxAAF1VEgIEgAKCBgABogIaDQgMhUUx4eGZQIIIJ5QAAAASFrZXNYwF2A=';
+
+class AssetManager {
+    constructor(baseUrl = '/static/dist/') {
+        this.baseUrl = baseUrl;
+        this.manifest = null;
+        this.formats = ['png'];
+        this.ready = this._init();
+    }
+
+    /**
+     * Load the manifest and detect supported formats
+     * @private
+     */
+    async _init() {
+        const [manifest, formats] = await Promise.all([
+            // ビルド済みのindex.htmlにはマニフェストが埋め込まれている
+            window.ASSET_MANIFEST || this._loadManifest(),
+            this._detectFormats(),
+        ]);
+        this.manifest = manifest;
+        this.formats = formats;
+    }
+
+    /**
+     * @private
+     * @returns {Promise<Object|null>} Manifest, or null when the build step has not run
+     */
+    async _loadManifest() {
+        try {
+            const response = await fetch(`${this.baseUrl}manifest.json`);
+            return response.ok ? await response.json() : null;
+        } catch (e) {
+            return null;
+        }
+    }
+
+    /**
+     * @private
+     * @returns {Promise<string[]>} Supported formats, preferred first
+     */
+    async _detectFormats() {
+        const formats = [];
+        const avif = await new Promise((resolve) => {
+            const img = new Image();
+            img.onload = () => resolve(img.width > 0);
+            img.onerror = () => resolve(false);
+            img.src = AVIF_PROBE;
+        });
+        if (avif) formats.push('avif');
+
+        const canvas = document.createElement('canvas');
+        canvas.width = canvas.height = 1;
+        if (canvas.toDataURL('image/webp').startsWith('data:image/webp')) {
+            formats.push('webp');
+        }
+
+        formats.push('png');
+        return formats;
+    }
+
+    /**
+     * Pick the variant to download for a display width
+     * @private
+     * @param {Object[]} variants - Manifest variants ({width, format, path, bytes})
+     * @param {number} cssWidth - Displayed width in CSS pixels
+     * @returns {Object|null} Smallest supported file at the best width
+     */
+    _pickVariant(variants, cssWidth) {
+        const supported = variants.filter((v) => this.formats.includes(v.format));
+        if (supported.length === 0) return null;
+
+        const target = cssWidth * (window.devicePixelRatio || 1);
+        const widths = [...new Set(supported.map((v) => v.width))].sort((a, b) => a - b);
+        const width = widths.find((w) => w >= target) || widths[widths.length - 1];
+        return supported
+            .filter((v) => v.width === width)
+            .reduce((best, v) => (v.bytes < best.bytes ? v : best));
+    }
+
+    /**
+     * Get the best URL for an image at a given display width
+     * @param {string} path - Original asset path (e.g. "assets/pro_open.png")
+     * @param {number} cssWidth - Displayed width in CSS pixels
+     * @returns {string} Variant URL, or the original file when no variant exists
+     */
+    url(path, cssWidth) {
+        const entry = this.manifest && this.manifest.images && this.manifest.images[path];
+        const variant = entry && this._pickVariant(entry.variants, cssWidth);
+        return variant ? this.baseUrl + variant.path : `/${path}`;
+    }
+
+    /**
+     * Get the sprite sheet of a character
+     * @param {string} key - Sprite key (e.g. "assets/pro")
+     * @param {number} cssWidth - Displayed frame width in CSS pixels
+     * @returns {{url: string, frames: string[]}|null} Sheet URL and frame order, or null without a build
+     */
+    sprite(key, cssWidth) {
+        const entry = this.manifest && this.manifest.sprites && this.manifest.sprites[key];
+        const variant = entry && this._pickVariant(entry.variants, cssWidth);
+        return variant ? { url: this.baseUrl + variant.path, frames: entry.frames } : null;
+    }
+}
+
+// Export singleton instance
+const assetManager = new AssetManager();
@@ -2,6 +2,15 @@
  * Web Speech API wrapper for AI Debate
  */
 
+// Longest text the server accepts in one /tts request (SpeechRequest.text)
+const SERVER_TTS_MAX_CHARS = 500;
+
+// Sentence end: 。！？!? plus any closing brackets, or a line break (as in debate_core/text.py)
+const SENTENCE_END = /[。！？!?]+[」』）)\]]*|\n+/g;
+
+// A quote followed by one of these continues the sentence (「…！」と言える)
+const QUOTE_CONTINUATION = /^[とってはがをにのもでやへ]/;
+
 class SpeechManager {
     constructor() {
         this.synthesis = window.speechSynthesis;
@@ -15,6 +24,13 @@ class SpeechManager {
         this.onSpeakEnd = null;
         this.isUnlocked = false; // iOS用フラグ
 
+        // Server-side speech (VOICEVOX) with lip sync data, when the server has it
+        this.serverVoice = false;
+        this.currentAudio = null;
+        this.visemes = null;
+        this._serverSpeech = null; // token of the server speech in progress
+        this._checkServerVoice();
+
         // Load voices
         this._loadVoices();
 
@@ -37,6 +53,19 @@ class SpeechManager {
         this.isUnlocked = true;
     }
 
+    /**
+     * Check whether the server can synthesize speech
+     * @private
+     */
+    async _checkServerVoice() {
+        try {
+            const response = await fetch('/tts/status');
+            this.serverVoice = response.ok && (await response.json()).available === true;
+        } catch (e) {
+            this.serverVoice = false;
+        }
+    }
+
     /**
      * Load available voices
      * @private
@@ -128,9 +157,180 @@ class SpeechManager {
     /**
      * Speak text
      * @param {string} text - Text to speak
+     * @param {string} [role] - 'pro', 'con' or 'judge' (selects the server voice)
+     * @returns {Promise<void>} Resolves when speech ends
+     */
+    async speak(text, role) {
+        if (this.enabled && text && role && this.serverVoice) {
+            try {
+                await this._speakServer(text, role);
+                return;
+            } catch (e) {
+                // 4xxはその文だけの問題なので、次の発言からもサーバー音声を使う
+                if (!(e.status >= 400 && e.status < 500)) {
+                    this.serverVoice = false;
+                }
+                // 読み上げ済みの文は飛ばしてブラウザで続ける
+                text = e.remaining !== undefined ? e.remaining : text;
+            }
+        }
+        return this._speakBrowser(text);
+    }
+
+    /**
+     * Split text into sentences no longer than the server accepts
+     * @private
+     * @param {string} text - Text to split
+     * @returns {string[]} Non-empty sentences in order
+     */
+    _splitSentences(text) {
+        const sentences = [];
+        let start = 0;
+        const cut = (end) => {
+            const sentence = text.slice(start, end).trim();
+            for (let i = 0; i < sentence.length; i += SERVER_TTS_MAX_CHARS) {
+                sentences.push(sentence.slice(i, i + SERVER_TTS_MAX_CHARS));
+            }
+            start = end;
+        };
+        for (const match of text.matchAll(SENTENCE_END)) {
+            const end = match.index + match[0].length;
+            if (/[」』]$/.test(match[0]) && QUOTE_CONTINUATION.test(text.slice(end))) {
+                continue;
+            }
+            cut(end);
+        }
+        cut(text.length);
+        return sentences;
+    }
+
+    /**
+     * Play server-synthesized speech sentence by sentence
+     *
+     * The next sentence is synthesized while the current one plays, so
+     * long texts (e.g. judge commentary) start quickly and play without gaps.
+     * @private
+     * @param {string} text - Text to speak
+     * @param {string} role - Speaker role
+     * @returns {Promise<void>} Resolves when playback ends or is stopped
+     * @throws {Error} With `status` (HTTP errors) and `remaining` (unspoken text)
+     */
+    async _speakServer(text, role) {
+        this.stop();
+        const token = {};
+        this._serverSpeech = token;
+
+        const sentences = this._splitSentences(text);
+        let next = sentences.length > 0 ? this._fetchServerSpeech(sentences[0], role) : null;
+        for (let i = 0; i < sentences.length; i++) {
+            let clip;
+            try {
+                clip = await next;
+                next = null;
+                if (i + 1 < sentences.length) {
+                    next = this._fetchServerSpeech(sentences[i + 1], role);
+                    next.catch(() => {}); // handled when awaited
+                }
+                if (this._serverSpeech !== token) {
+                    URL.revokeObjectURL(clip.url);
+                    if (next) next.then((c) => URL.revokeObjectURL(c.url), () => {});
+                    return;
+                }
+                await this._playServerClip(clip);
+            } catch (e) {
+                e.remaining = sentences.slice(i).join('');
+                throw e;
+            }
+        }
+    }
+
+    /**
+     * Synthesize one sentence on the server
+     * @private
+     * @param {string} text - Sentence to speak
+     * @param {string} role - Speaker role
+     * @returns {Promise<{url: string, visemes: string, frameMs: number}>} Audio URL and lip sync data
+     */
+    async _fetchServerSpeech(text, role) {
+        const response = await fetch('/tts', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ text, role, speed_scale: this.rate }),
+        });
+        if (!response.ok) {
+            const error = new Error(`TTS error: ${response.status}`);
+            error.status = response.status;
+            throw error;
+        }
+        return {
+            visemes: response.headers.get('X-Visemes') || '',
+            frameMs: Number(response.headers.get('X-Viseme-Frame-Ms')) || 40,
+            url: URL.createObjectURL(await response.blob()),
+        };
+    }
+
+    /**
+     * Play one synthesized sentence with its lip sync data
+     * @private
+     * @param {{url: string, visemes: string, frameMs: number}} clip - From _fetchServerSpeech
+     * @returns {Promise<void>} Resolves when playback ends
+     */
+    _playServerClip(clip) {
+        const { url, visemes, frameMs } = clip;
+        const audio = new Audio(url);
+        this.currentAudio = audio;
+        this.visemes = { levels: visemes, frameMs };
+
+        return new Promise((resolve, reject) => {
+            let finished = false;
+            const finish = () => {
+                // 終了時はpauseとendedの両方が来るので1回だけ処理する
+                if (finished) return;
+                finished = true;
+                URL.revokeObjectURL(url);
+                if (this.currentAudio === audio) {
+                    this.currentAudio = null;
+                    this.visemes = null;
+                }
+                if (this.onSpeakEnd) {
+                    this.onSpeakEnd();
+                }
+                resolve();
+            };
+            audio.onplaying = () => {
+                if (this.onSpeakStart) {
+                    this.onSpeakStart();
+                }
+            };
+            audio.onended = finish;
+            audio.onpause = finish; // stop()
+            audio.onerror = finish;
+            audio.play().catch((e) => {
+                URL.revokeObjectURL(url);
+                this.currentAudio = null;
+                this.visemes = null;
+                reject(e);
+            });
+        });
+    }
+
+    /**
+     * Mouth state of the server speech at its current playback position
+     * @returns {boolean|null} Whether the mouth is open, or null without lip sync data
+     */
+    mouthOpen() {
+        if (!this.currentAudio || !this.visemes) return null;
+        const index = Math.floor((this.currentAudio.currentTime * 1000) / this.visemes.frameMs);
+        return this.visemes.levels.charAt(index) > '0';
+    }
+
+    /**
+     * Speak text with the Web Speech API
+     * @private
+     * @param {string} text - Text to speak
      * @returns {Promise<void>} Resolves when speech ends
      */
-    speak(text) {
+    _speakBrowser(text) {
         return new Promise((resolve, reject) => {
             if (!this.enabled || !text) {
                 resolve();
@@ -191,6 +391,10 @@ class SpeechManager {
             this.synthesis.cancel();
         }
         this.currentUtterance = null;
+        this._serverSpeech = null;
+        if (this.currentAudio) {
+            this.currentAudio.pause();
+        }
     }
 
     /**
@@ -198,7 +402,7 @@ class SpeechManager {
      * @returns {boolean} Whether currently speaking
      */
     isSpeaking() {
-        return this.synthesis.speaking;
+        return this.synthesis.speaking || this.currentAudio !== null;
     }
 
     /**
@@ -0,0 +1,17 @@
+"""Web Build - Asset build step for the web frontend (output in web/dist)"""
+
+from .images import build_images, IMAGE_WIDTHS, IMAGE_FORMATS
+from .manifest import write_manifest, DIST_DIR
+from .sprites import build_sprites
+from .static import build_static, precompress
+
+__all__ = [
+    "build_images",
+    "IMAGE_WIDTHS",
+    "IMAGE_FORMATS",
+    "build_sprites",
+    "build_static",
+    "precompress",
+    "write_manifest",
+    "DIST_DIR",
+]
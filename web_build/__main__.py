@@ -0,0 +1,57 @@
+"""Build frontend assets: python -m web_build"""
+
+import argparse
+import time
+from pathlib import Path
+
+from .images import build_images
+from .manifest import DIST_DIR, ROOT_DIR, write_manifest
+from .sprites import build_sprites
+from .static import build_static, precompress
+
+# Image directories served to the web frontend (URL prefix -> directory)
+IMAGE_SOURCES = {
+    "assets": ROOT_DIR / "assets",
+}
+
+# Sprite sheets (URL prefix -> directory, characters, expressions).
+# The YouTube expressions follow EXPRESSIONS in ai_debate_youtube.py.
+SPRITE_SOURCES = {
+    "assets": (ROOT_DIR / "assets", ("pro", "con"), (None,)),
+    "assets_youtube": (
+        ROOT_DIR / "assets_youtube",
+        ("pro", "con"),
+        ("normal", "angry", "happy", "surprised"),
+    ),
+}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Build web/dist (image variants, sprite sheets, hashed CSS/JS and compressed copies)"
+    )
+    parser.add_argument("--out", default=str(DIST_DIR), help="Output directory")
+    args = parser.parse_args(argv)
+
+    dist_dir = Path(args.out)
+    dist_dir.mkdir(parents=True, exist_ok=True)
+
+    started = time.monotonic()
+    manifest = {
+        "images": build_images(IMAGE_SOURCES, dist_dir / "images"),
+        "sprites": build_sprites(SPRITE_SOURCES, dist_dir / "sprites"),
+    }
+    path = write_manifest(manifest, dist_dir)
+    files = build_static(ROOT_DIR / "web", dist_dir, manifest)
+    compressed = precompress(dist_dir)
+
+    variants = sum(len(entry["variants"]) for entry in manifest["images"].values())
+    sheets = sum(len(entry["variants"]) for entry in manifest["sprites"].values())
+    print(
+        f"Built {variants} image variants, {sheets} sprite sheets, {len(files)} CSS/JS files "
+        f"and {compressed} compressed copies in {time.monotonic() - started:.1f}s -> {path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Resized, re-encoded avatar variants with content-hashed filenames"""
+
+import hashlib
+import io
+from pathlib import Path
+
+from PIL import Image, features
+
+# Rendered widths (CSS px x device pixel ratio) the frontend picks from
+IMAGE_WIDTHS = (120, 240, 480)
+
+# Output formats, preferred first. PNG is the universal fallback.
+IMAGE_FORMATS = {
+    "avif": ("AVIF", {"quality": 60}),
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "png": ("PNG", {"optimize": True}),
+}
+
+
+def available_formats() -> list[str]:
+    """Formats this Pillow build can encode (AVIF needs Pillow 11.3+)"""
+    return [fmt for fmt in IMAGE_FORMATS if fmt == "png" or features.check(fmt)]
+
+
+def content_hash(data: bytes) -> str:
+    """Short content hash used in output filenames"""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def _encode(image: Image.Image, fmt: str) -> bytes:
+    pil_format, options = IMAGE_FORMATS[fmt]
+    if fmt == "png":
+        # Palette PNG is ~1/5 the size of the RGBA original at these sizes
+        image = image.quantize(256, method=Image.Quantize.FASTOCTREE)
+    buffer = io.BytesIO()
+    image.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def build_image_variants(source: Path, out_dir: Path, widths=IMAGE_WIDTHS) -> dict:
+    """Write every width/format variant of one image
+
+    Args:
+        source: Source image
+        out_dir: Directory for the variants
+        widths: Target widths (never upscaled)
+
+    Returns:
+        Manifest entry: {"width", "height", "variants": [{"width", "height", "format", "path", "bytes"}]}
+        with paths relative to out_dir
+    """
+    with Image.open(source) as original:
+        original = original.convert("RGBA")
+        entry = {"width": original.width, "height": original.height, "variants": []}
+
+        for width in sorted({min(w, original.width) for w in widths}):
+            height = round(original.height * width / original.width)
+            resized = original.resize((width, height), Image.LANCZOS)
+            for fmt in available_formats():
+                data = _encode(resized, fmt)
+                name = f"{source.stem}.{width}w.{content_hash(data)}.{fmt}"
+                (out_dir / name).write_bytes(data)
+                entry["variants"].append({
+                    "width": width,
+                    "height": height,
+                    "format": fmt,
+                    "path": name,
+                    "bytes": len(data),
+                })
+    return entry
+
+
+def build_images(sources: dict[str, Path], out_dir: Path, widths=IMAGE_WIDTHS) -> dict:
+    """Build variants for every PNG in the given source directories
+
+    Args:
+        sources: URL prefix -> source directory (e.g. {"assets": Path("assets")})
+        out_dir: Directory for the variants (recreated)
+        widths: Target widths
+
+    Returns:
+        Mapping of original asset path (e.g. "assets/pro_open.png") to manifest entry
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.iterdir():
+        if stale.is_file():
+            stale.unlink()
+
+    images = {}
+    for prefix, directory in sources.items():
+        for source in sorted(directory.glob("*.png")):
+            entry = build_image_variants(source, out_dir, widths)
+            for variant in entry["variants"]:
+                variant["path"] = f"{out_dir.name}/{variant['path']}"
+            images[f"{prefix}/{source.name}"] = entry
+    return images
@@ -0,0 +1,23 @@
+"""Build manifest read by the frontend"""
+
+import json
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+DIST_DIR = ROOT_DIR / "web" / "dist"
+MANIFEST_NAME = "manifest.json"
+
+
+def write_manifest(manifest: dict, dist_dir: Path = DIST_DIR) -> Path:
+    """Write the manifest to `dist_dir/manifest.json`
+
+    Args:
+        manifest: Manifest contents (paths relative to dist_dir)
+        dist_dir: Build output directory
+
+    Returns:
+        Path of the written manifest
+    """
+    path = dist_dir / MANIFEST_NAME
+    path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
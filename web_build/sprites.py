@@ -0,0 +1,95 @@
+"""Per-character sprite sheets (all mouth/expression frames in one image)"""
+
+from pathlib import Path
+
+from PIL import Image
+
+from .images import IMAGE_WIDTHS, available_formats, content_hash, _encode
+
+MOUTHS = ("closed", "open")
+
+
+def frame_names(expressions) -> list[str]:
+    """Frame order of a sheet: every expression with closed then open mouth
+
+    `None` as the only expression means plain "<char>_<mouth>.png" files.
+    """
+    return [
+        mouth if expression is None else f"{expression}_{mouth}"
+        for expression in expressions
+        for mouth in MOUTHS
+    ]
+
+
+def build_sprite(
+    directory: Path,
+    character: str,
+    expressions,
+    out_dir: Path,
+    widths=IMAGE_WIDTHS,
+) -> dict:
+    """Write the sprite sheet variants of one character
+
+    Frames are laid out left to right in `frame_names` order, so frame i
+    is shown with `background-position: i / (n - 1) * 100% 50%`.
+
+    Args:
+        directory: Directory holding "<character>_<frame>.png" files
+        character: Character prefix ("pro", "con")
+        expressions: Expression names, or (None,) for mouth-only sets
+        out_dir: Directory for the sheets
+        widths: Target frame widths
+
+    Returns:
+        Manifest entry: {"frames", "variants": [{"width", "height", "format", "path", "bytes"}]}
+        where width/height are per frame
+    """
+    frames = frame_names(expressions)
+    sources = [Image.open(directory / f"{character}_{frame}.png").convert("RGBA") for frame in frames]
+    frame_width, frame_height = sources[0].size
+    entry = {"frames": frames, "variants": []}
+
+    for width in sorted({min(w, frame_width) for w in widths}):
+        height = round(frame_height * width / frame_width)
+        sheet = Image.new("RGBA", (width * len(frames), height))
+        for index, source in enumerate(sources):
+            sheet.paste(source.resize((width, height), Image.LANCZOS), (index * width, 0))
+
+        for fmt in available_formats():
+            data = _encode(sheet, fmt)
+            name = f"{directory.name}_{character}.sprite.{width}w.{content_hash(data)}.{fmt}"
+            (out_dir / name).write_bytes(data)
+            entry["variants"].append({
+                "width": width,
+                "height": height,
+                "format": fmt,
+                "path": f"{out_dir.name}/{name}",
+                "bytes": len(data),
+            })
+
+    for source in sources:
+        source.close()
+    return entry
+
+
+def build_sprites(sources: dict, out_dir: Path, widths=IMAGE_WIDTHS) -> dict:
+    """Build sprite sheets for every configured character
+
+    Args:
+        sources: URL prefix -> (directory, characters, expressions)
+        out_dir: Directory for the sheets (recreated)
+        widths: Target frame widths
+
+    Returns:
+        Mapping of sprite key (e.g. "assets/pro") to manifest entry
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.iterdir():
+        if stale.is_file():
+            stale.unlink()
+
+    sprites = {}
+    for prefix, (directory, characters, expressions) in sources.items():
+        for character in characters:
+            sprites[f"{prefix}/{character}"] = build_sprite(directory, character, expressions, out_dir, widths)
+    return sprites
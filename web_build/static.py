@@ -0,0 +1,88 @@
+"""Content-hashed CSS/JS, built index.html and precompressed siblings"""
+
+import gzip
+import json
+import re
+from pathlib import Path
+
+from .images import content_hash
+
+# Extensions worth compressing (images are already compressed)
+COMPRESSIBLE_EXTENSIONS = {".html", ".css", ".js", ".json", ".svg", ".txt"}
+
+_STATIC_REF = re.compile(r'(?P<attr>href|src)="/static/(?P<path>(?:css|js)/[^"]+)"')
+
+
+def build_static(web_dir: Path, dist_dir: Path, manifest: dict) -> dict:
+    """Copy CSS/JS into dist with hashed names and write dist/index.html
+
+    The built page references the hashed files and carries the image
+    manifest inline, so a repeat visit needs no asset request at all.
+
+    Args:
+        web_dir: Source frontend directory (web/)
+        dist_dir: Build output directory (web/dist)
+        manifest: Image manifest to inline
+
+    Returns:
+        Mapping of source path (e.g. "js/app.js") to built path (e.g. "js/app.<hash>.js")
+    """
+    files = {}
+    for kind in ("css", "js"):
+        out_dir = dist_dir / kind
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for stale in out_dir.iterdir():
+            stale.unlink()
+        for source in sorted((web_dir / kind).glob(f"*.{kind}")):
+            data = source.read_bytes()
+            name = f"{source.stem}.{content_hash(data)}{source.suffix}"
+            (out_dir / name).write_bytes(data)
+            files[f"{kind}/{source.name}"] = f"{kind}/{name}"
+
+    def rewrite(match):
+        built = files.get(match.group("path"))
+        if built is None:
+            return match.group(0)
+        return f'{match.group("attr")}="/static/dist/{built}"'
+
+    html = _STATIC_REF.sub(rewrite, (web_dir / "index.html").read_text(encoding="utf-8"))
+    inline = json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+    html = html.replace(
+        "</head>",
+        f"    <script>window.ASSET_MANIFEST = {inline};</script>\n</head>",
+        1,
+    )
+    (dist_dir / "index.html").write_text(html, encoding="utf-8")
+    return files
+
+
+def precompress(dist_dir: Path) -> int:
+    """Write .gz (and .br when brotli is installed) next to compressible files
+
+    Siblings that would not be smaller than the original are skipped.
+
+    Returns:
+        Number of compressed files written
+    """
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+    written = 0
+    for path in sorted(dist_dir.rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_EXTENSIONS:
+            continue
+        data = path.read_bytes()
+        encoded = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            encoded[".br"] = brotli.compress(data, quality=11)
+
+        for suffix, compressed in encoded.items():
+            sibling = path.with_name(path.name + suffix)
+            if len(compressed) < len(data):
+                sibling.write_bytes(compressed)
+                written += 1
+            elif sibling.exists():
+                sibling.unlink()
+    return written